@@ -0,0 +1,75 @@
+"""
+Weighted-draw throughput: random.choices vs CumulativeSampler vs AliasTable.
+Sizes match what the game samples from: 3 (AI trade modes / draft top 3),
+4 (assist teammates), 5 (usage in a lineup), 10 (rebound candidates).
+
+Usage: python -m benchmarks.bench_sampler [draws]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.sampler import AliasTable, CumulativeSampler
+
+SIZES = (3, 4, 5, 10)
+
+
+def _rate(fn, draws: int) -> float:
+    start = time.perf_counter()
+    fn(draws)
+    return draws / (time.perf_counter() - start)
+
+
+def bench(draws: int = 200_000, seed: int = 7):
+    results = []
+    for n in SIZES:
+        rng = random.Random(seed)
+        weights = [rng.uniform(50, 99) ** 3 for _ in range(n)]
+        population = list(range(n))
+        cum = CumulativeSampler(weights)
+        alias = AliasTable(weights)
+
+        def run_choices(k):
+            choices = rng.choices
+            for _ in range(k):
+                choices(population, weights=weights, k=1)
+
+        def run_cumulative(k):
+            sample = cum.sample
+            for _ in range(k):
+                sample(rng)
+
+        def run_alias(k):
+            sample = alias.sample
+            for _ in range(k):
+                sample(rng)
+
+        def run_rebuild(k):
+            # Engine worst case before lineup tables: rebuild the sampler for every draw
+            for _ in range(k):
+                CumulativeSampler(weights).sample(rng)
+
+        results.append({
+            "n": n,
+            "random.choices": _rate(run_choices, draws),
+            "CumulativeSampler": _rate(run_cumulative, draws),
+            "AliasTable": _rate(run_alias, draws),
+            "CumulativeSampler (rebuilt)": _rate(run_rebuild, draws),
+        })
+    return results
+
+
+def main():
+    draws = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    results = bench(draws)
+    cols = list(results[0].keys())[1:]
+    print(f"{'n':>3} " + " ".join(f"{c:>28}" for c in cols) + "   (draws/sec)")
+    for row in results:
+        print(f"{row['n']:>3} " + " ".join(f"{row[c]:>28,.0f}" for c in cols))
+
+
+if __name__ == "__main__":
+    main()
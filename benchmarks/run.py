@@ -0,0 +1,221 @@
+"""
+Offline throughput / regression suite.
+
+Measures, on the shipped data/gamedata.json league (fixed league seed):
+  - engine.*      MatchEngine.simulate_game games/sec (full and score fidelity)
+  - season.*      wall time of a regular season and of the playoffs via GameManager.play_day
+  - offseason.*   progression + draft (advance_phase) + AI draft picks + free agency
+  - save.N.*      save/load latency and save-file size after N seasons (1, 5, 20)
+
+Usage:
+  python -m benchmarks.run                         # print results as JSON
+  python -m benchmarks.run -o results.json         # ...and write them
+  python -m benchmarks.run --baseline base.json --threshold 15
+      -> exit 1 if any metric is >15% worse than the baseline
+  python -m benchmarks.run --quick                 # fewer games, saves after 1/2 seasons
+  python -m benchmarks.run --engine-stats stats.json
+      -> also play an instrumented pass and dump models.engine_stats (per-phase timings, event rates)
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from controllers.data_loader import DataLoader
+from controllers.game_manager import GameManager
+from controllers.save_manager import SaveManager
+from controllers.season_phases import PHASE_DRAFT
+from models.match_engine import MatchEngine, FIDELITY_FULL, FIDELITY_SCORE
+from models import engine_stats
+
+DATA_PATH = "data/gamedata.json"
+LEAGUE_SEED = 20250101
+
+# Metrics where bigger is better; everything else (seconds, bytes) is lower-is-better
+HIGHER_IS_BETTER_SUFFIXES = ("_per_sec",)
+
+
+@contextlib.contextmanager
+def _quiet():
+    """GameManager is chatty (DEBUG prints); keep benchmark output readable."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def _new_league(save_dir: str) -> GameManager:
+    """Fresh GameManager on the shipped data, saving into save_dir. No user team (AI runs all)."""
+    GameManager._instance = None
+    gm = GameManager()
+    gm.save_manager = SaveManager(save_dir) # initialize() keeps an existing save dir
+    raw = DataLoader(DATA_PATH).load_data()
+    raw["league_seed"] = LEAGUE_SEED
+    gm.initialize(DATA_PATH, raw_data_override=raw)
+    gm.user_team_id = ""
+    return gm
+
+
+def _season_over(gm: GameManager) -> bool:
+    return gm.playoff_champion() is not None
+
+
+def _play_season(gm: GameManager, timings: Dict[str, float] = None):
+    start = time.perf_counter()
+    while gm.current_day <= gm.total_regular_season_days:
+        gm.play_day()
+    regular = time.perf_counter() - start
+
+    start = time.perf_counter()
+    safety = 0
+    while not _season_over(gm) and safety < 100:
+        gm.play_day()
+        safety += 1
+    playoffs = time.perf_counter() - start
+
+    if timings is not None:
+        timings["season.regular_sec"] = regular
+        timings["season.playoffs_sec"] = playoffs
+
+
+def _offseason(gm: GameManager):
+    gm.advance_phase(PHASE_DRAFT)
+    while gm.is_draft_active:
+        gm.resolve_draft_pick()
+    gm.fill_ai_rosters() # Keep rosters full so later seasons measure a normal league
+
+
+def _engine_pairs():
+    raw = DataLoader(DATA_PATH).load_data()
+    teams, _ = DataLoader(DATA_PATH).process_data_into_objects(raw)
+    teams = [t for t in teams if len(t.roster) >= 5]
+    return [(h, a) for h in teams for a in teams if h is not a]
+
+
+def bench_engine(games: int) -> Dict[str, float]:
+    pairs = _engine_pairs()
+    out = {}
+    for fidelity in (FIDELITY_FULL, FIDELITY_SCORE):
+        rng = random.Random(LEAGUE_SEED)
+        start = time.perf_counter()
+        for i in range(games):
+            h, a = pairs[i % len(pairs)]
+            MatchEngine.simulate_game(h, a, rng=rng, fidelity=fidelity)
+        out[f"engine.{fidelity}.games_per_sec"] = games / (time.perf_counter() - start)
+    return out
+
+
+def profile_engine(games: int, path: str) -> Dict:
+    """Separate instrumented pass (timers would skew the games/sec metrics); dumps engine stats JSON."""
+    pairs = _engine_pairs()
+    rng = random.Random(LEAGUE_SEED)
+    engine_stats.reset_engine_stats()
+    engine_stats.enable_engine_stats()
+    try:
+        for i in range(games):
+            h, a = pairs[i % len(pairs)]
+            MatchEngine.simulate_game(h, a, rng=rng, apply=False)
+        return engine_stats.dump_engine_stats(path)
+    finally:
+        engine_stats.enable_engine_stats(False)
+
+
+def bench_league(save_points: List[int]) -> Dict[str, float]:
+    out = {}
+    save_dir = tempfile.mkdtemp(prefix="tbgm_bench_")
+    try:
+        with _quiet():
+            gm = _new_league(save_dir)
+        for season in range(1, max(save_points) + 1):
+            with _quiet():
+                if season == 1:
+                    _play_season(gm, out)
+                    start = time.perf_counter()
+                    _offseason(gm)
+                    out["offseason.new_season_and_draft_sec"] = time.perf_counter() - start
+                else:
+                    _play_season(gm)
+                    _offseason(gm)
+
+            if season in save_points:
+                with _quiet():
+                    start = time.perf_counter()
+                    gm.save_game(9)
+                    out[f"save.{season}.save_sec"] = time.perf_counter() - start
+                    out[f"save.{season}.file_bytes"] = os.path.getsize(os.path.join(save_dir, "save_9.enc"))
+                    start = time.perf_counter()
+                    gm.load_game(9)
+                    out[f"save.{season}.load_sec"] = time.perf_counter() - start
+    finally:
+        shutil.rmtree(save_dir, ignore_errors=True)
+    return out
+
+
+def run(quick: bool = False) -> Dict[str, float]:
+    metrics = {}
+    metrics.update(bench_engine(300 if quick else 2000))
+    metrics.update(bench_league([1, 2] if quick else [1, 5, 20]))
+    return metrics
+
+
+def compare(current: Dict[str, float], baseline: Dict[str, float], threshold_pct: float) -> List[str]:
+    """Returns a description of every metric more than threshold_pct worse than baseline."""
+    regressions = []
+    for key, base in baseline.items():
+        if key not in current or not base:
+            continue
+        now = current[key]
+        if key.endswith(HIGHER_IS_BETTER_SUFFIXES):
+            change = (base - now) / base * 100.0
+        else:
+            change = (now - base) / base * 100.0
+        if change > threshold_pct:
+            regressions.append(f"{key}: {base:.4g} -> {now:.4g} ({change:+.1f}% worse)")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="TBGM engine/season benchmarks")
+    parser.add_argument("-o", "--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed regression in percent (default 10)")
+    parser.add_argument("--quick", action="store_true", help="smaller run for CI / smoke testing")
+    parser.add_argument("--engine-stats", metavar="PATH", help="dump per-phase engine stats JSON here")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT) # data paths are relative to the repo root
+    results = {"meta": {"quick": args.quick, "python": sys.version.split()[0], "time": time.time()},
+               "metrics": run(args.quick)}
+    if args.engine_stats:
+        profile_engine(300 if args.quick else 2000, args.engine_stats)
+        results["meta"]["engine_stats"] = args.engine_stats
+
+    text = json.dumps(results, indent=4)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f).get("metrics", {})
+        regressions = compare(results["metrics"], baseline, args.threshold)
+        if regressions:
+            print(f"\nREGRESSIONS (> {args.threshold:.0f}%):")
+            for line in regressions:
+                print("  " + line)
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0f}% vs {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
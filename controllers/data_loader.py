@@ -1,6 +1,7 @@
 import json
 import os
-from typing import Dict, Any, List
+import random
+from typing import Callable, Dict, Any, List, Optional
 from models.player import Player
 from models.team import Team
 
@@ -39,7 +40,9 @@ class DataLoader:
         masked_name = f"{first_name[0]}. {last_name}"
         return masked_name
 
-    def process_data_into_objects(self, raw_data: Dict[str, Any]) -> tuple[List[Team], List[Player]]:
+    def process_data_into_objects(self, raw_data: Dict[str, Any],
+                                  rng_for: Callable[..., random.Random] = None) -> tuple[List[Team], List[Player]]:
+        """rng_for(*keys) (GameManager.rng_for) seeds potentials missing from the data, one stream per player."""
         teams_data = raw_data.get("teams", [])
         # Support both 'players' (Save File) and 'roster' (Template) keys
         roster_data = raw_data.get("players") or raw_data.get("roster", [])
@@ -51,7 +54,7 @@ class DataLoader:
                 real_name = p_data.get("real_name", "")
                 p_data["mask_name"] = self.apply_masking(real_name)
             
-            player = Player.from_dict(p_data)
+            player = Player.from_dict(p_data, rng=self.potential_rng(p_data, rng_for))
             all_players.append(player)
 
         all_teams = []
@@ -60,3 +63,10 @@ class DataLoader:
             all_teams.append(team)
 
         return all_teams, all_players
+
+    @staticmethod
+    def potential_rng(p_data: Dict[str, Any], rng_for: Callable[..., random.Random] = None) -> Optional[random.Random]:
+        """("potential", player id) stream for Player.from_dict; None if not needed or no rng_for."""
+        if rng_for is None or p_data.get("potential", 0):
+            return None
+        return rng_for("potential", p_data.get("id", ""))
@@ -1,13 +1,24 @@
-from typing import List, Optional
-from models.player import Player, PlayerAttributes
+from typing import Callable, Iterator, List, Optional, Union
+from models.player import Player, PlayerAttributes, SeasonStats
 from models.team import Team
 from models.game import Game
-from models.match_engine import MatchEngine
+from models.game_result import GameResult
+from models.match_engine import MatchEngine, FIDELITY_FULL, FIDELITY_SCORE
 from .data_loader import DataLoader
 from .save_manager import SaveManager
+from .save_policy import SavePolicy, TRIGGER_CHANGE, TRIGGER_DAY, TRIGGER_PHASE
+from .league_index import LeagueIndex
+from .season_phases import (SeasonPhases, PHASE_REGULAR_SEASON, PHASE_PLAYOFFS, PHASE_AWARDS,
+                            PHASE_PROGRESSION, PHASE_DRAFT, PHASE_FREE_AGENCY, PHASE_ORDER)
+from .scheduler import Scheduler
+from .league_format import LeagueFormat
+from .playoff_bracket import PlayoffBracket, PLAY_IN_ROUND
+from .sim_progress import SimProgress, TARGET_USER_GAME, TARGET_SEASON_END
+from utils.rng_utils import new_master_seed, derive_rng, derive_seed
 import random
 import os
 import glob
+import time
 
 ACHIEVEMENT_DEFINITIONS = {
     "first_win": {
@@ -65,6 +76,10 @@ class GameManager:
             cls._instance = super(GameManager, cls).__new__(cls)
             cls._instance.initialized = False
             cls._instance.save_callback = None # Callback for external storage (e.g. Flet Client Storage)
+            cls._instance.save_policy = SavePolicy() # When autosave() writes slot 1
+            cls._instance.index = LeagueIndex() # id -> Team/Player, day -> games
+            cls._instance.phases = SeasonPhases() # Regular season -> playoffs -> ... -> free agency
+            cls._instance._register_phase_hooks()
         return cls._instance
 
     def set_save_callback(self, callback):
@@ -84,17 +99,21 @@ class GameManager:
              self.raw_data = self.data_loader.load_data()
         
         self.salary_cap = self.raw_data.get("salary_cap", 70.0)
+        # League master seed: every random subsystem derives its own stream from it
+        self.league_seed = self.raw_data.get("league_seed") or new_master_seed()
         self.user_team_id = self.raw_data.get("user_team_id", "")
+        self.league_format = LeagueFormat.from_dict(self.raw_data.get("league_format"))
         
-        self.teams, self.players = self.data_loader.process_data_into_objects(self.raw_data)
+        self.teams, self.players = self.data_loader.process_data_into_objects(self.raw_data, rng_for=self.rng_for)
+        self.index.rebuild(self.teams, self.players, [])
         
-        # Ensure enough teams for a season
-        if len(self.teams) < 4:
+        # Ensure enough teams for a season (league format may ask for more)
+        if len(self.teams) < self._min_teams():
             self._generate_dummy_teams()
 
         self.current_date = self.raw_data.get("current_date", "2025-10-01")
         self.current_day = self.raw_data.get("current_day", 1)
-        self.season_year = 2025
+        self.season_year = self.raw_data.get("season_year", 2025)
         self.retired_players: List[Player] = []
         self.scouting_points = self.raw_data.get("scouting_points", 50)
         self.news_feed = self.raw_data.get("news_feed", []) # News Feed
@@ -114,8 +133,8 @@ class GameManager:
                 # Re-link Team Objects
                 home_id = g_data.get("home_team_id")
                 away_id = g_data.get("away_team_id")
-                home = next((t for t in self.teams if t.id == home_id), None)
-                away = next((t for t in self.teams if t.id == away_id), None)
+                home = self.index.team(home_id)
+                away = self.index.team(away_id)
                 
                 if home and away:
                     # Manually reconstruct if from_dict missing, or use Class method
@@ -124,12 +143,12 @@ class GameManager:
                         id=g_data.get("id"),
                         day=g_data.get("day"),
                         home_team=home,
-                        away_team=away
+                        away_team=away,
+                        played=g_data.get("played", False),
+                        home_score=g_data.get("home_score", 0),
+                        away_score=g_data.get("away_score", 0)
                     )
-                    new_game.home_score = g_data.get("home_score", 0)
-                    new_game.away_score = g_data.get("away_score", 0)
-                    new_game.played = g_data.get("played", False)
-                    self.schedule.append(new_game)
+                    self.add_game(new_game)
             self._recalc_total_days()
         else:
             print("DEBUG: No Schedule in Save. Generating New Schedule.")
@@ -140,7 +159,7 @@ class GameManager:
         raw_draft = self.raw_data.get("draft_class", [])
         if raw_draft:
              for p_data in raw_draft:
-                 self.draft_class.append(Player.from_dict(p_data))
+                 self.draft_class.append(Player.from_dict(p_data, rng=DataLoader.potential_rng(p_data, self.rng_for)))
         elif not raw_schedule: # Only if fresh start generate
              # Unless we want to regenerate draft class if missing? 
              pass # Draft class is generated in 'offseason' or 'start'.
@@ -154,7 +173,7 @@ class GameManager:
                     new_picks = []
                     for offset in range(1, 4): # Next 3 years
                         year = current_year + offset
-                        for r in [1, 2]: # Round 1 & 2
+                        for r in range(1, self.league_format.draft_rounds + 1): # Round 1 & 2
                              new_picks.append({
                                  "year": year,
                                  "round": r,
@@ -174,6 +193,7 @@ class GameManager:
         self.save_manager = SaveManager(current_save_dir)
         self.season_progression_log = self.raw_data.get("season_progression_log", {})
         self.playoff_series = self.raw_data.get("playoff_series", [])
+        self.playoff_seeds = self.raw_data.get("playoff_seeds", []) # Team ids in seed order (play-in needs them later)
         self.progression_data = {} 
         
         # Draft State Persistence
@@ -198,7 +218,27 @@ class GameManager:
             "Blocks": {"val": 0, "holder": "None", "date": "N/A", "team": "N/A"},
             "3PM": {"val": 0, "holder": "None", "date": "N/A", "team": "N/A"},
         })
-        
+        self.phases.set_phase(self.raw_data.get("season_phase") or self._infer_phase())
+        
+    def game_fidelity(self, game: Game) -> str:
+        """Full box scores for the user's games; AI-vs-AI games only need score + season stats."""
+        if self.user_team_id in (game.home_team.id, game.away_team.id):
+            return FIDELITY_FULL
+        return FIDELITY_SCORE
+
+    def _check_game_records(self, game: Game, result: GameResult):
+        """Runs check_new_records for a finished game (every box-score line, or score-tier leaders)."""
+        if result.fidelity == FIDELITY_SCORE:
+            for stat_key, (pid, val) in result.leaders.items():
+                p_obj = self.index.player(pid)
+                if p_obj:
+                    self.check_new_records(p_obj, {stat_key: val})
+        else:
+            for pid, stats in result.rows():
+                p_obj = self.index.player(pid)
+                if p_obj:
+                    self.check_new_records(p_obj, stats)
+
     def check_new_records(self, player, stats):
         """Checks if a player broke a single-game record."""
         # Key Map: (Record Key, Stats Key)
@@ -217,7 +257,8 @@ class GameManager:
             
             if val > current_record:
                 # NEW RECORD!
-                team_name = self.get_team(player.team_id).name if self.get_team(player.team_id) else "N/A"
+                team = self.get_team(player.team_id)
+                team_name = team.name if team else "N/A"
                 
                 self.league_records[rec_key] = {
                     "val": val,
@@ -283,11 +324,84 @@ class GameManager:
 
 
     def save_game(self, slot_id: int):
-        return self.save_manager.save_game(self, slot_id)
+        result = self.save_manager.save_game(self, slot_id)
+        if slot_id == 1 and result and result[0]:
+            self.save_policy.saved()
+        return result
+
+    def autosave(self, trigger: str = TRIGGER_CHANGE):
+        """Automatic save to slot 1; save_policy decides whether this trigger writes now."""
+        if self.save_policy.request(trigger):
+            return self.save_game(1)
+
+    def flush_save(self):
+        """Writes slot 1 if anything changed since the last save."""
+        if self.save_policy.dirty:
+            return self.save_game(1)
+
+    def deferred_saves(self):
+        """with gm.deferred_saves(): ... -> no autosaves inside the block, one save at the end."""
+        return self.save_policy.deferred(self.flush_save)
 
     def load_game(self, slot_id: int):
         return self.save_manager.load_game(self, slot_id)
 
+    # --- Season phases (controllers.season_phases) ---
+
+    def _register_phase_hooks(self):
+        """Boundary work runs once per transition; day hooks only while their phase is current."""
+        p = self.phases
+        p.on_enter(PHASE_REGULAR_SEASON, self._update_ai_strategies)
+        p.on_enter(PHASE_PLAYOFFS, self._start_playoffs)
+        p.on_enter(PHASE_AWARDS, self._hand_out_awards)
+        p.on_enter(PHASE_PROGRESSION, self.start_new_season)
+        p.on_enter(PHASE_DRAFT, self.init_draft)
+        p.on_enter(PHASE_FREE_AGENCY, self.schedule_post_draft)
+        p.on_enter(PHASE_FREE_AGENCY, self._ai_process_free_agency)
+
+        p.on_day(PHASE_REGULAR_SEASON, self._ai_process_midseason_free_agency)
+        p.on_day(PHASE_REGULAR_SEASON, self._ai_process_trades)
+        p.on_day(PHASE_PLAYOFFS, self._ai_process_midseason_free_agency)
+        # After the roster moves above, so tactics and rotations see today's rosters
+        p.on_day(PHASE_REGULAR_SEASON, self._update_ai_strategies)
+        p.on_day(PHASE_PLAYOFFS, self._update_ai_strategies)
+
+    def advance_phase(self, phase: str) -> List[str]:
+        """Moves the season forward to `phase`, running each boundary once; saves if anything ran."""
+        entered = self.phases.advance_to(phase)
+        if entered:
+            self.autosave(TRIGGER_PHASE)
+        return entered
+
+    def _infer_phase(self) -> str:
+        """Phase for saves written before season_phase was stored."""
+        if self.is_draft_active:
+            return PHASE_DRAFT
+        if self.playoff_series:
+            return PHASE_AWARDS if self.playoff_champion() else PHASE_PLAYOFFS
+        return PHASE_REGULAR_SEASON
+
+    def _hand_out_awards(self):
+        champion = self.playoff_champion()
+        if champion:
+            self._calculate_and_store_awards(champion)
+
+    def _ai_process_trades(self):
+        """AI Autonomous Trades (Phase 63), until the trade deadline."""
+        day = self.current_day + 1 # Runs just before advance_day moves to tomorrow
+        if not (10 < day < self.total_regular_season_days * 0.85): # Trade Deadline
+            return
+        try:
+            from controllers.trade_manager import TradeManager
+            tm = TradeManager()
+            progress = day / self.total_regular_season_days
+            news = tm.attempt_ai_trade(progress, rng=self.rng_for("ai_trade", self.season_year, day))
+            if news:
+                self.news_feed.append(news)
+                if len(self.news_feed) > 50: self.news_feed.pop(0)
+        except Exception as e:
+            print(f"Error in AI Trade: {e}")
+
     def sign_player(self, player: Player, team: Team) -> tuple[bool, str]:
         """
         Signs a player to a team.
@@ -300,16 +414,9 @@ class GameManager:
         if team.salary_total + player.salary > self.salary_cap:
             return False, f"Over Salary Cap! (Cap: ${self.salary_cap}M)"
 
-        # Remove from old team
-        old_team = self.get_team(player.team_id)
-        if old_team and player in old_team.roster:
-            old_team.roster.remove(player)
-            
-        # Add to new team
-        team.roster.append(player)
-        player.team_id = team.id
+        self.move_player(player, team)
         
-        self.save_game(1)
+        self.autosave()
         return True, f"Successfully signed {player.mask_name}!"
 
     def reset_game(self, template_path):
@@ -333,7 +440,7 @@ class GameManager:
         self.initialize(template_path)
         
         # 4. Save immediately to persist new state
-        self.save_game(1)
+        self.autosave(TRIGGER_PHASE)
 
     def add_gm_score(self, points, reason):
         """Adds to GM legacy score and saves."""
@@ -350,7 +457,7 @@ class GameManager:
         self.gm_score_log.insert(0, log_entry) # Add to top
         
         print(f"DEBUG: GM Score +{points} ({reason}). Total: {self.gm_score}")
-        self.save_game(1)
+        self.autosave()
 
     def unlock_achievement(self, key, title, description=""):
         """Unlocks an achievement."""
@@ -365,24 +472,19 @@ class GameManager:
             }
             print(f"DEBUG: Achievement Unlocked: {title}")
             self.add_gm_score(100, f"Achievement: {title}") # Bonus for achievement
-            self.save_game(1)
+            self.autosave()
 
     def release_player(self, player: Player) -> tuple[bool, str]:
         """
         Releases a player to Free Agency (T00).
         """
-        old_team = self.get_team(player.team_id)
-        if old_team and player in old_team.roster:
-            old_team.roster.remove(player)
-            
         # Get or Create Free Agent Team
         fa_team = self.get_team("T00")
         if not fa_team:
             fa_team = Team("T00", "Free Agents", "#333333")
-            self.teams.append(fa_team)
+            self.add_team(fa_team)
             
-        fa_team.roster.append(player)
-        player.team_id = "T00"
+        self.move_player(player, fa_team)
         
         # Reset State for Negotiation
         player.contract_length = 0
@@ -392,12 +494,50 @@ class GameManager:
         player.negotiation_patience = 3 # Reset patience
         player.negotiation_max_patience = 3
         
-        self.save_game(1)
+        self.autosave()
         return True, f"Released {player.mask_name}."
 
+    def rng_for(self, *keys) -> random.Random:
+        """
+        Reproducible RNG stream for one subsystem, keyed e.g. ("game", 2025, "G12").
+        Same league_seed + same keys -> same draws, regardless of call order.
+        """
+        return derive_rng(getattr(self, "league_seed", None), *keys)
+
+    def roster_matrix(self, include_free_agents: bool = False):
+        """
+        Struct-of-arrays snapshot of the league's players for vectorized kernels
+        (batch engine, projections). Call .sync_to_players() after editing it.
+        """
+        from models.roster_matrix import RosterMatrix
+        players = self.players if include_free_agents else [p for p in self.players if p.team_id != "T00"]
+        return RosterMatrix(players)
+
+    def game_seed(self, game: Game) -> Optional[int]:
+        """Seed of the ("game", year, id) stream, for simulating the game out of process."""
+        seed = getattr(self, "league_seed", None)
+        return derive_seed(seed, "game", self.season_year, game.id) if seed is not None else None
+
+    def enable_parallel_sim(self, max_workers: int = None):
+        """Opt-in: simulate each day's games on a process pool (big leagues / sim-to-end)."""
+        from .sim_executor import SimExecutor
+        self.disable_parallel_sim()
+        self.sim_executor = SimExecutor(max_workers)
+
+    def disable_parallel_sim(self):
+        executor = getattr(self, "sim_executor", None)
+        if executor:
+            executor.shutdown()
+        self.sim_executor = None
+
+    def _min_teams(self) -> int:
+        """At least 4 teams, or the league format's team count (Free Agents not counted)."""
+        return max(4, self.league_format.teams or 0) + sum(1 for t in self.teams if t.id == "T00")
+
     def _generate_dummy_teams(self):
-        """Generates dummy teams to ensure at least 4 teams for league play."""
-        dummy_teams_needed = 4 - len(self.teams)
+        """Generates dummy teams up to _min_teams() for league play."""
+        rng = self.rng_for("dummy_teams")
+        dummy_teams_needed = self._min_teams() - len(self.teams)
         if dummy_teams_needed <= 0:
             return
 
@@ -411,6 +551,9 @@ class GameManager:
             # Generate dummy players
             roster = []
             for j in range(8): # Small roster for dummy
+                ovr = rng.randint(60, 85)
+                # Attributes around the OVR (all-zero attributes leave the match engine nothing to sample)
+                attrs = PlayerAttributes(*(max(30, ovr + rng.randint(-10, 10)) for _ in range(8)))
                 p = Player(
                     id=f"{t_id}_P{j}",
                     real_name=f"Player {j}",
@@ -419,95 +562,34 @@ class GameManager:
                     pos="PG" if j < 2 else "SG" if j < 4 else "SF" if j < 6 else "C",
                     salary=100,
                     age=22,
-                    attributes=PlayerAttributes(),
-                    ovr=random.randint(60, 85)
+                    attributes=attrs,
+                    ovr=ovr
                 )
                 roster.append(p)
-                self.players.append(p)
+                self.add_player(p)
                 
             new_team = Team(id=t_id, name=name, color=color, roster=roster)
-            self.teams.append(new_team)
+            self.add_team(new_team)
 
-    def _generate_schedule(self):
+    def _generate_schedule(self, rng=None):
         """
-        Generates advanced Regular Season schedule.
-        Requirement: Each team plays every other team 6 times.
-        Cycle: 6 Rounds.
-        Total Games per Team = (N-1) * 6.
+        Generates the Regular Season schedule (controllers.scheduler, circle method).
+        Length comes from the league format: every team plays every other team
+        `cycles` times (default 6, i.e. (N-1) * 6 games), or games_per_team if set.
         """
+        if rng is None:
+            rng = self.rng_for("schedule", self.season_year)
         self.schedule = []
+        self.index.rebuild_schedule(self.schedule)
         # Exclude Free Agents (T00) from schedule
         teams = [t for t in self.teams if t.id != "T00"]
-        n = len(teams)
-        if n < 2: return
-
-        # 1. Generate all matchups (TeamA vs TeamB) * 6
-        all_matchups = []
-        
-        # Round Robin pairs
-        base_pairs = []
-        for i in range(n):
-            for j in range(i + 1, n):
-                base_pairs.append((teams[i], teams[j]))
-
-        # Repeat 6 times (3 Home / 3 Away balance if possible)
-        for _ in range(6):
-            # Shuffle base pairs each cycle to distribute
-            random.shuffle(base_pairs)
-            for t1, t2 in base_pairs:
-                # Randomize home/away for now to keep simple, 
-                # or alternate? Simple shuffle is usually 'infinite' safe enough.
-                if random.random() < 0.5:
-                    all_matchups.append((t1, t2))
-                else:
-                    all_matchups.append((t2, t1))
-        
-        # 2. Assign to Days (Scheduler Algorithm)
-        # We need to assign games to "Day 1, Day 2..." such that 
-        # no team plays twice on the same day.
-        
-        schedule_map = {} # Day -> List of (Home, Away)
-        day = 1
-        
-        # Helper: Try to fit game into 'day', if not, try 'day+1'
-        for home, away in all_matchups:
-            placed = False
-            curr_check = 1
-            
-            while not placed:
-                # Check if Day 'curr_check' is valid for both teams
-                day_games = schedule_map.get(curr_check, [])
-                teams_playing_today = set()
-                for (h, a) in day_games:
-                    teams_playing_today.add(h.id)
-                    teams_playing_today.add(a.id)
-                
-                if home.id not in teams_playing_today and away.id not in teams_playing_today:
-                    # Valid! Place it
-                    if curr_check not in schedule_map: schedule_map[curr_check] = []
-                    schedule_map[curr_check].append((home, away))
-                    placed = True
-                else:
-                    # Busy, try next day
-                    curr_check += 1
-        
-        # 3. Create Game Objects
-        game_id_counter = 1
-        max_day = max(schedule_map.keys())
-        self.total_regular_season_days = max_day
-        
-        for d in range(1, max_day + 1):
-             games = schedule_map.get(d, [])
-             for home, away in games:
-                 game = Game(
-                     id=f"G{game_id_counter}",
-                     day=d,
-                     home_team=home,
-                     away_team=away
-                 )
-                 self.schedule.append(game)
-                 game_id_counter += 1
-                 
+        if len(teams) < 2: return
+
+        games = Scheduler(self.league_format.schedule_config()).generate(teams, rng)
+        for i, (day, home, away) in enumerate(games, start=1):
+            self.add_game(Game(id=f"G{i}", day=day, home_team=home, away_team=away))
+        self.total_regular_season_days = games[-1].day
+
         print(f"DEBUG: Generated Schedule. Total Days: {self.total_regular_season_days}. Total Games: {len(self.schedule)}")
 
     def _recalc_total_days(self):
@@ -524,181 +606,49 @@ class GameManager:
         print(f"DEBUG: Recalculated Total Regular Season Days: {self.total_regular_season_days}")
 
     def get_todays_games(self) -> List[Game]:
-        return [g for g in self.schedule if g.day == self.current_day]
+        return list(self.index.games_on(self.current_day))
 
-    def advance_day(self):
-        self.current_day += 1
-        
-        # --- AI Autonomous Trades (Phase 63) ---
-        if self.current_day > 10 and self.current_day < self.total_regular_season_days * 0.85: # Trade Deadline
-            try:
-                from controllers.trade_manager import TradeManager
-                tm = TradeManager()
-                progress = self.current_day / self.total_regular_season_days
-                news = tm.attempt_ai_trade(progress)
-                if news:
-                    self.news_feed.append(news)
-                    if len(self.news_feed) > 50: self.news_feed.pop(0)
-            except Exception as e:
-                print(f"Error in AI Trade: {e}")
-        # ---------------------------------------
-        
-        # Check Regular Season End
-        if self.current_day > self.total_regular_season_days:
-            # Entering Playoffs
-            if not self.playoff_series:
-                 # Initialize Playoffs
-                 self._init_playoffs_round1()
-            else:
-                 # Continue Playoffs
-                 self._advance_playoffs()
-        
-        self.save_game(1)
-
-    def _init_playoffs_round1(self):
-        print("DEBUG: Init Playoffs Round 1")
-        # Sort teams
-        sorted_teams = sorted(
-            self.teams, 
-            key=lambda t: (t.wins, t.wins / (t.wins + t.losses) if (t.wins + t.losses) > 0 else 0), 
-            reverse=True
-        )
-        if len(sorted_teams) < 4: return
-            
-        seed1, seed2, seed3, seed4 = sorted_teams[0], sorted_teams[1], sorted_teams[2], sorted_teams[3]
-        
-        # Define Series: Best of 7 (First to 4)
-        # Structure: {id, t1, t2, w1, w2, round, winner}
-        self.playoff_series = [
-            {"id": "S1", "t1": seed1, "t2": seed4, "w1": 0, "w2": 0, "round": 1, "winner": None}, # 1 vs 4
-            {"id": "S2", "t1": seed2, "t2": seed3, "w1": 0, "w2": 0, "round": 1, "winner": None}  # 2 vs 3
-        ]
-        
-        # Schedule Game 1 for tomorrow (current_day)
-        self._schedule_next_playoff_games()
+    def get_team(self, team_id: str) -> Optional[Team]:
+        return self.index.team(team_id)
 
-    def _advance_playoffs(self):
-        # 1. Check results of *yesterday's* games (which were simulated)
-        todays_games = [g for g in self.schedule if g.day == self.current_day - 1] # Games just finished
-        
-        series_updated = False
-        
-        for g in todays_games:
-            # Find which series this game belongs to
-            # We can tag games? Or lookup by team.
-            if g.id.startswith("P"): # Playoff Game
-               winner_name = g.result.get('winner')
-               if not winner_name: continue
-               
-               # Find Series
-               for s in self.playoff_series:
-                   if s['winner']: continue # Already done
-                   
-                   t1 = s['t1']
-                   t2 = s['t2']
-                   
-                   if g.home_team.id in [t1.id, t2.id] and g.away_team.id in [t1.id, t2.id]:
-                       # Found Series
-                       if t1.name == winner_name:
-                           s['w1'] += 1
-                       else:
-                           s['w2'] += 1
-                       series_updated = True
-                       
-                       # Check Series End
-                       if s['w1'] >= 4:
-                           s['winner'] = t1
-                           print(f"DEBUG: Series {s['id']} Winner: {t1.name}")
-                       elif s['w2'] >= 4:
-                           s['winner'] = t2
-                           print(f"DEBUG: Series {s['id']} Winner: {t2.name}")
-                            
-                       # Gamification Hook: Series Win
-                       if s['winner'] and s['winner'].id == self.user_team_id:
-                            self.add_gm_score(50, "Playoff Series Win")
-                            if s['round'] == 1:
-                                self.unlock_achievement("playoff_bound", "Playoff Competitor", "Win a playoff series.")
-                       break
-        
-        # 2. Check Round Completion
-        round1_series = [s for s in self.playoff_series if s['round'] == 1]
-        round2_series = [s for s in self.playoff_series if s['round'] == 2]
-        
-        if round1_series and all(s['winner'] is not None for s in round1_series) and not round2_series:
-            # Round 1 Done -> Create Finals
-            w1 = round1_series[0]['winner']
-            w2 = round1_series[1]['winner']
-            
-            # Start Finals
-            print("DEBUG: Starting Finals")
-            final_series = {"id": "SF", "t1": w1, "t2": w2, "w1": 0, "w2": 0, "round": 2, "winner": None}
-            self.playoff_series.append(final_series)
-            self._schedule_next_playoff_games()
-            
-        elif round2_series and round2_series[0]['winner']:
-            # Finals Done -> Season Over
-            champion = round2_series[0]['winner']
-            print(f"DEBUG: SEASON OVER! Champion: {champion.name}")
-            
-            # Gamification Hook: Championship
-            if champion.id == self.user_team_id:
-                self.add_gm_score(1000, "Championship Title")
-                self.unlock_achievement("champion", "National Champion", "Win the TPBL Title.")
-                self.celebration_pending = True # Flag for UI
-                
-            # Do nothing logic-wise, UI should show "Season Fin" or Offseason button
-            pass
-        else:
-            # Continue scheduling games for active series
-            self._schedule_next_playoff_games()
+    def get_player(self, player_id: str) -> Optional[Player]:
+        return self.index.player(player_id)
 
-    def _schedule_next_playoff_games(self):
-        # Determine next game number for active series
-        game_scheduled = False
-        
-        for s in self.playoff_series:
-            if s['winner']: continue # Series over
-            
-            # Create next game
-            game_num = s['w1'] + s['w2'] + 1
-            
-            # Home Court Logic usually 2-2-1-1-1.
-            # G1, G2: Higher Seed (t1) Home
-            # G3, G4: Lower Seed (t2) Home
-            # G5: t1
-            # G6: t2
-            # G7: t1
-            is_t1_home = True
-            if game_num in [3, 4, 6]:
-                is_t1_home = False
-                
-            home = s['t1'] if is_t1_home else s['t2']
-            away = s['t2'] if is_t1_home else s['t1']
-            
-            g = Game(
-                id=f"P_{s['id']}_G{game_num}", # unique ID
-                day=self.current_day,
-                home_team=home,
-                away_team=away
-            )
-            # Tag the series info in game object? 
-            # Not strictly supported by Game class yet, but ID helps.
-            
-            self.schedule.append(g)
-            game_scheduled = True
-            
-        if not game_scheduled:
-            # Maybe Offseason or waiting?
-            pass
+    # --- League mutations (keep self.index in sync; use these instead of editing the lists) ---
 
-        # Update AI Strategies (Legacy Support)
-        self._update_ai_strategies()
+    def add_team(self, team: Team):
+        self.teams.append(team)
+        self.index.add_team(team)
 
-    def get_team(self, team_id: str) -> Optional[Team]:
-        for team in self.teams:
-            if team.id == team_id:
-                return team
-        return None
+    def add_player(self, player: Player, team: Team = None):
+        """Registers a player with the league (once) and optionally puts him on `team`."""
+        if not self.index.has_player(player):
+            self.players.append(player)
+            self.index.add_player(player)
+        if team is not None:
+            self.move_player(player, team)
+
+    def move_player(self, player: Player, team: Team):
+        """Takes the player off his current roster (if any) and onto `team`."""
+        old_team = self.get_team(player.team_id)
+        if old_team and player in old_team.roster:
+            old_team.roster.remove(player)
+        if player not in team.roster:
+            team.roster.append(player)
+        player.team_id = team.id
+
+    def remove_player(self, player: Player):
+        """Drops the player from the league (retirement)."""
+        team = self.get_team(player.team_id)
+        if team and player in team.roster:
+            team.roster.remove(player)
+        if self.index.has_player(player):
+            self.players.remove(player)
+            self.index.remove_player(player)
+
+    def add_game(self, game: Game):
+        self.schedule.append(game)
+        self.index.add_game(game)
 
     def get_user_team(self) -> Optional[Team]:
         return self.get_team(self.user_team_id)
@@ -711,6 +661,7 @@ class GameManager:
         self.season_year += 1
         self.current_day = 1
         self.schedule = [] # Clear schedule
+        self.index.rebuild_schedule(self.schedule)
         # self.playoff_series = [] # Reset playoffs MOVED to finalize_offseason
         self.season_progression_log = {} # Clear logs
         self.retired_players = [] 
@@ -755,10 +706,10 @@ class GameManager:
             p.negotiation_allowed = True
             
             # Recover Patience
-            current_p = getattr(p, "negotiation_patience", 3)
+            current_p = p.negotiation_patience if p.negotiation_patience is not None else 3
             # Logic: Recover +2 patience per season, up to max
             # If they were at 0 (Walk Away), now they are at 2 (Warning) or 3 (Neutral)
-            p.negotiation_patience = min(getattr(p, "negotiation_max_patience", 3), current_p + 3) # Full reset effectively
+            p.negotiation_patience = min(p.negotiation_max_patience or 3, current_p + 3) # Full reset effectively
             # Ensure at least 3
             if p.negotiation_patience < 3: p.negotiation_patience = 3
 
@@ -776,11 +727,13 @@ class GameManager:
         #     t.wins = 0
         #     t.losses = 0
 
-    def _handle_progression(self):
+    def _handle_progression(self, rng=None):
         """
         Updates player OVR based on Age and Potential.
         Phase 41: Includes "User Favor" logic.
         """
+        if rng is None:
+            rng = self.rng_for("progression", self.season_year)
         # 1. Identify User Team and Calculate Favor Scores
         # 1. League-Wide Performance Bonus (Previously User Favor)
         # Calculate Score for ALL players to determine League S/A Tiers
@@ -832,7 +785,7 @@ class GameManager:
                 # User Req: If OVR >= 88, Potential NO LONGER affects growth.
                 # Treat them like Prime Phase (Standard random growth).
                 if p.ovr >= 88:
-                    rand = random.random()
+                    rand = rng.random()
                     if rand < 0.20: target_gain = 3
                     elif rand < 0.45: target_gain = 2
                     elif rand < 0.70: target_gain = 1
@@ -843,18 +796,18 @@ class GameManager:
                     pot = p.potential
                     
                     if pot >= 100:
-                        target_gain = random.randint(5, 7)
+                        target_gain = rng.randint(5, 7)
                     elif pot >= 90:
-                        target_gain = random.randint(3, 5)
+                        target_gain = rng.randint(3, 5)
                     elif pot >= 80:
                         target_gain = 3
                     elif pot >= 70:
-                        target_gain = random.randint(1, 3)
+                        target_gain = rng.randint(1, 3)
                     else:
-                        target_gain = random.randint(0, 1)
+                        target_gain = rng.randint(0, 1)
                     
                     # Double Growth Mechanic
-                    if pot >= 80 and random.random() < 0.10:
+                    if pot >= 80 and rng.random() < 0.10:
                         print(f"DEBUG: {p.mask_name} triggered DOUBLE GROWTH! ({target_gain} -> {target_gain*2})")
                         target_gain *= 2
 
@@ -876,7 +829,7 @@ class GameManager:
                 # 25% chance: +2
                 # 25% chance: +1
                 # 30% chance: +0
-                rand = random.random()
+                rand = rng.random()
                 if rand < 0.20:
                     target_gain = 3
                 elif rand < 0.45:
@@ -892,17 +845,17 @@ class GameManager:
                 # Decline Phase (> 32)
                 # Base decay
                 decline_chance = (p.age - 32) * 0.10 # Adjust start age to 32
-                if random.random() < decline_chance:
-                    target_gain = random.randint(-3, -1)
+                if rng.random() < decline_chance:
+                    target_gain = rng.randint(-3, -1)
                 
                 # Favor Protection
                 if is_s_tier:
                     # Rejuvenation: 50% chance to Flip negative to positive
                     if target_gain < 0:
                          target_gain = 0 # Prevent decay first
-                         if random.random() < 0.5: target_gain = 1 # Growth
+                         if rng.random() < 0.5: target_gain = 1 # Growth
                     elif target_gain == 0:
-                         if random.random() < 0.5: target_gain = 1
+                         if rng.random() < 0.5: target_gain = 1
                 
                 elif is_a_tier:
                      # Frozen: Prevent decay
@@ -913,7 +866,7 @@ class GameManager:
                 # User Req: High Capability (OVR >= 95) growth is harder.
                 if p.ovr >= 95:
                     # Resistance Mechanism: 50% chance to HALVE growth (rounded down)
-                    if random.random() < 0.50:
+                    if rng.random() < 0.50:
                          original_gain = target_gain
                          target_gain = target_gain // 2
                          print(f"DEBUG: {p.mask_name} (OVR {p.ovr}) hit RESISTANCE! ({original_gain} -> {target_gain})")
@@ -943,7 +896,7 @@ class GameManager:
             old_attrs = get_attr_snapshot(p)
 
             if target_gain != 0:
-                self._apply_attribute_changes(p, target_gain)
+                self._apply_attribute_changes(p, target_gain, rng)
             
             new_attrs = get_attr_snapshot(p)
             attr_diffs = {k: new_attrs[k] - old_attrs[k] for k in old_attrs}
@@ -961,10 +914,12 @@ class GameManager:
                 "new_attrs": new_attrs    # Current values
             }
 
-    def _apply_attribute_changes(self, p: Player, target_gain: int):
+    def _apply_attribute_changes(self, p: Player, target_gain: int, rng=None):
         """
         Distributes OVR gain/loss into specific attributes based on the User's Curve.
         """
+        if rng is None:
+            rng = random
         start_ovr = p.ovr
         current_ovr = start_ovr
         changes_map = {} # Key: Attr, Val: Amount
@@ -979,7 +934,7 @@ class GameManager:
         defense_pool = ["defense", "steal", "block", "rebound"]
         
         # Random start
-        is_offense_turn = random.choice([True, False])
+        is_offense_turn = rng.choice([True, False])
         
         while attempts < max_attempts: 
             # Check if we met target
@@ -998,7 +953,7 @@ class GameManager:
             
             # Build valid keys from pool
             # Note: consistency is in attributes but key map needed
-            key = random.choice(pool)
+            key = rng.choice(pool)
             
             # Toggle for next loop
             is_offense_turn = not is_offense_turn
@@ -1016,7 +971,7 @@ class GameManager:
             # User Req: Guards' block basically won't rise.
             if key == "block" and p.pos in ["PG", "SG", "控球後衛", "得分後衛"]:
                 # 90% chance to skip this attribute and pick another one
-                if random.random() < 0.90:
+                if rng.random() < 0.90:
                     continue
 
             val = getattr(p.attributes, field_name)
@@ -1030,7 +985,7 @@ class GameManager:
                 # Only attributes > 50 and < 70 can breakthrough.
                 can_breakthrough = (val > 50 and val < 70)
                 
-                if can_breakthrough and random.random() < 0.10:
+                if can_breakthrough and rng.random() < 0.10:
                      amount = 10
                      print(f"DEBUG: {p.mask_name} BREAKTHROUGH in {key}! (+10)")
                 else:
@@ -1048,7 +1003,7 @@ class GameManager:
 
             # --- DECLINE LOGIC ---
             else:
-                 amount = random.randint(1, 3)
+                 amount = rng.randint(1, 3)
                  new_val = max(25, val - amount)
                  setattr(p.attributes, field_name, new_val)
                  changes_map[key] = changes_map.get(key, 0) - amount
@@ -1095,6 +1050,7 @@ class GameManager:
                 # "Player X contract expired and is now a Free Agent."
 
     def _handle_retirements(self):
+        rng = self.rng_for("retirements", self.season_year)
         to_retire = []
         for p in self.players:
             chance = 0
@@ -1126,20 +1082,14 @@ class GameManager:
             # (Optional, but fits "Simulate forever" if user loves a player)
             # Not implemented yet to respect strict request.
             
-            if chance > 0 and random.randint(1, 100) <= chance:
+            if chance > 0 and rng.randint(1, 100) <= chance:
                 to_retire.append(p)
         
         for p in to_retire:
             self._check_hall_of_fame(p)
             self.release_player(p) # Move to FA first (or just remove completely)
-            # Remove from global player list
-            if p in self.players:
-                self.players.remove(p)
-            
-            # Remove from FA if there
-            fa_team = self.get_team("T00")
-            if fa_team and p in fa_team.roster:
-                fa_team.roster.remove(p)
+            # Remove from the league (FA roster, player list, index)
+            self.remove_player(p)
 
             self.retired_players.append(p)
 
@@ -1159,7 +1109,7 @@ class GameManager:
             
         p.is_scouted = True
         self.scouting_points -= 10
-        self.save_game(1)
+        self.autosave()
         return True, "Player scouted! Attributes revealed."
 
     def complete_draft(self):
@@ -1169,6 +1119,7 @@ class GameManager:
         Remaining go to FA.
         Then generates schedule.
         """
+        rng = self.rng_for("draft", self.season_year)
         # Sort draft class by OVR (Best first)
         sorted_rookies = sorted(self.draft_class, key=lambda p: p.ovr, reverse=True)
         
@@ -1192,31 +1143,34 @@ class GameManager:
         for p in list(sorted_rookies): # Copy list
             if p.team_id != "DRAFT": 
                 # Already signed/picked by user
-                if p not in self.players:
-                    self.players.append(p)
+                self.add_player(p)
                 continue
                 
             # Assign to random team or FA
-            prospect_team = random.choice(teams_to_pick)
+            prospect_team = rng.choice(teams_to_pick)
             # Check roster limit? (skip for now)
             
-            p.team_id = prospect_team.id
-            prospect_team.roster.append(p)
-            self.players.append(p)
+            self.add_player(p, prospect_team)
             
         self.draft_class = [] # Clear
         
         # NOW generate schedule
         self._generate_schedule()
+        # Draft resolved by hand; the next game day starts the regular season
+        self.phases.set_phase(PHASE_FREE_AGENCY)
 
-    def _generate_chinese_name(self) -> str:
+    def _generate_chinese_name(self, rng=None) -> str:
         """Generates a random Chinese Name."""
+        if rng is None:
+            rng = random
         last_names = ["王", "陳", "李", "張", "林", "劉", "黃", "吳", "蔡", "楊", "許", "鄭", "謝", "郭", "洪", "曾", "邱", "廖", "賴", "徐", "周", "葉", "蘇", "莊", "呂", "江", "何", "蕭", "羅", "高", "潘", "簡", "朱", "鍾", "彭", "游", "詹", "胡", "施", "沈"]
         first_names = ["志明", "志偉", "建國", "建華", "俊傑", "俊宏", "家豪", "家瑋", "冠宇", "冠廷", "宗翰", "柏翰", "彥廷", "彥宏", "承恩", "承翰", "宇軒", "宇欣", "品睿", "品宏", "浩宇", "浩然", "子軒", "子維", "偉哲", "偉豪", "智瑋", "智豪", "信宏", "信豪", "文傑", "文豪", "明哲", "明弘", "士豪", "士軒", "家榮", "家弘", "建宏", "建志"]
-        return random.choice(last_names) + random.choice(first_names)
+        return rng.choice(last_names) + rng.choice(first_names)
 
-    def _generate_rookies(self):
+    def _generate_rookies(self, rng=None):
         """Generates a draft class of young players with Chinese names."""
+        if rng is None:
+            rng = self.rng_for("rookies", self.season_year)
         self.draft_class = []
         
         # Determine number of rookies (Draft is 2 rounds of N teams)
@@ -1224,37 +1178,37 @@ class GameManager:
         num_rookies = max(20, num_teams * 4) # Ensure enough players for 2 rounds + undrafted
         
         for i in range(num_rookies):
-            age = random.randint(18, 22)
-            pos = random.choice(["PG", "SG", "SF", "PF", "C"])
+            age = rng.randint(18, 22)
+            pos = rng.choice(["PG", "SG", "SF", "PF", "C"])
             
             # Potential & OVR Distribution
-            roll = random.random()
+            roll = rng.random()
             if roll < 0.05: # Generational
-               pot = random.randint(90, 99)
-               start_ovr = random.randint(70, 80)
+               pot = rng.randint(90, 99)
+               start_ovr = rng.randint(70, 80)
             elif roll < 0.20: # All-Star
-               pot = random.randint(80, 89)
-               start_ovr = random.randint(65, 75)
+               pot = rng.randint(80, 89)
+               start_ovr = rng.randint(65, 75)
             elif roll < 0.60: # Role Player
-               pot = random.randint(70, 79)
-               start_ovr = random.randint(55, 65)
+               pot = rng.randint(70, 79)
+               start_ovr = rng.randint(55, 65)
             else: # Bench
-               pot = random.randint(50, 69)
-               start_ovr = random.randint(40, 55)
+               pot = rng.randint(50, 69)
+               start_ovr = rng.randint(40, 55)
                
             pid = f"R{self.season_year}{i+1:03d}"
-            name = self._generate_chinese_name()
+            name = self._generate_chinese_name(rng)
             
             # Base Attributes centered around start_ovr
             attrs = {
-                "2pt": max(30, start_ovr + random.randint(-10, 10)),
-                "3pt": max(30, start_ovr + random.randint(-15, 15)),
-                "rebound": max(30, start_ovr + random.randint(-10, 10)),
-                "pass": max(30, start_ovr + random.randint(-10, 10)),
-                "consistency": random.randint(40, 80),
-                "block": max(30, start_ovr + random.randint(-15, 15)),
-                "steal": max(30, start_ovr + random.randint(-10, 10)),
-                "defense": max(30, start_ovr + random.randint(-5, 5))
+                "2pt": max(30, start_ovr + rng.randint(-10, 10)),
+                "3pt": max(30, start_ovr + rng.randint(-15, 15)),
+                "rebound": max(30, start_ovr + rng.randint(-10, 10)),
+                "pass": max(30, start_ovr + rng.randint(-10, 10)),
+                "consistency": rng.randint(40, 80),
+                "block": max(30, start_ovr + rng.randint(-15, 15)),
+                "steal": max(30, start_ovr + rng.randint(-10, 10)),
+                "defense": max(30, start_ovr + rng.randint(-5, 5))
             }
             
             # Create Attributes object
@@ -1297,52 +1251,26 @@ class GameManager:
             self._generate_rookies()
         
         # Determine Order based on Performance
-        # Logic: 
-        # 1. Identify Playoff Teams (Champion=Last, RunnerUp=2ndLast) -> Sorted by Elimination Round then Regular Season Wins?
-        #    Currently Playoff logic determines 'Champion'.
-        #    Let's simplify: 
-        #    - Non-Playoff Teams: Sorted by Regular Season Wins (Ascending) -> Worse record = Early pick.
-        #    - Playoff Teams: Placed after Non-Playoff. Sorted by Elimination? 
-        #      Winner is last. Runner up second last.
-        #    For now, simpler approach requested: "Reverse Standings" generally, maybe specific override for finalists.
-        
-        
+        # - Non-Playoff Teams (and play-in losers) first: Regular Season record, worst first.
+        # - Playoff Teams after them, by elimination round (first-round exits first),
+        #   so the Runner-Up picks second last and the Champion last.
         active_teams = [t for t in self.teams if t.id != "T00"]
         print(f"DEBUG: init_draft. Active Teams: {len(active_teams)}")
         
-        # Sort by Wins (Ascending) = Worst record first
+        eliminated = self.playoff_bracket().elimination_rounds(self.playoff_series) if self.playoff_series else {}
+        
         # Tie-breaker: Lower Loss (Desc) or Random
-        active_teams.sort(key=lambda t: (t.wins, t.losses)) 
-        
-        # Champion Logic Override:
-        # If we know the champion, move them to the end.
-        if hasattr(self, 'playoff_series') and self.playoff_series:
-             # Find Winner of Round 2 (Finals)
-             final = next((s for s in self.playoff_series if s['round'] == 2), None)
-             if final and final.get('winner'):
-                 champ = final['winner']
-                 if champ in active_teams:
-                     active_teams.remove(champ)
-                     active_teams.append(champ) # Move to last
-                     
-             # Find Loser of finals? (Runner Up) -> 2nd Last
-             if final and final.get('winner'):
-                  winner = final['winner']
-                  t1 = final['t1']
-                  t2 = final['t2']
-                  runner_up = t1 if t1 != winner else t2
-                  if runner_up in active_teams:
-                      active_teams.remove(runner_up)
-                      active_teams.insert(len(active_teams)-1, runner_up) # Insert before champ
-        
-        # Round 1 & 2
-        self.draft_order = [t.id for t in active_teams] * 2
+        active_teams.sort(key=lambda t: (eliminated.get(t.id, 0), t.wins, t.losses)) 
+        
+        # Same order every round
+        self.draft_order = [t.id for t in active_teams] * self.league_format.draft_rounds
         
         # Save State Immediately
-        self.save_game(1)
+        self.autosave()
 
     def resolve_draft_pick(self, player_id: str = None):
         """Resolves current pick. AI autos, or User specific."""
+        rng = self.rng_for("draft_pick", self.season_year, self.current_draft_pick_index)
         if self.current_draft_pick_index >= len(self.draft_order):
             self.is_draft_active = False
             return
@@ -1371,22 +1299,20 @@ class GameManager:
             if score1 > score2 + 2:
                  picked_player = top_3[0]
             else:
-                 picked_player = random.choice(top_3)
+                 picked_player = rng.choice(top_3)
         else:
             # User Manual Pick
             picked_player = next((p for p in self.draft_class if p.id == player_id), None)
             
         if picked_player:
-            picked_player.team_id = team_id
             picked_player.years_on_team = 0
-            team.roster.append(picked_player)
-            self.players.append(picked_player)
+            self.add_player(picked_player, team)
             
             # Log
             # Pick number in round
-            num_teams = len(self.draft_order) // 2
+            num_teams = max(1, len(self.draft_order) // self.league_format.draft_rounds)
             pick_in_round = (self.current_draft_pick_index % num_teams) + 1
-            round_num = 1 if self.current_draft_pick_index < num_teams else 2
+            round_num = self.current_draft_pick_index // num_teams + 1
             
             self.draft_picks.append({
                 "round": round_num,
@@ -1399,9 +1325,9 @@ class GameManager:
             
         if self.current_draft_pick_index >= len(self.draft_order):
             self.is_draft_active = False
-            self.schedule_post_draft()
+            self.advance_phase(PHASE_FREE_AGENCY)
             
-        self.save_game(1)
+        self.autosave()
 
     def schedule_post_draft(self):
         # 1. Move Undrafted Rookies to Free Agency
@@ -1411,16 +1337,11 @@ class GameManager:
         if not fa_team:
             # Create if missing (Should exist)
             fa_team = Team("T00", "Free Agents", "#333333")
-            self.teams.append(fa_team)
+            self.add_team(fa_team)
             
         for p in undrafted:
-            p.team_id = "T00"
-            fa_team.roster.append(p)
-            self.players.append(p) # Ensure they are in main pool if not already?
-            # Wait, draft_class items are not in self.players until picked usually.
-            # If we add them to FA, we must add to self.players.
-            if p not in self.players:
-                self.players.append(p)
+            # draft_class items are not in self.players until picked, so register them once here
+            self.add_player(p, fa_team)
                 
             # Reset Negotiation State for Undrafted Rookies
             p.contract_length = 0
@@ -1539,13 +1460,13 @@ class GameManager:
         if loyalty_factor >= 0.15: base_patience = 4
         if loyalty_factor >= 0.30: base_patience = 5
         
-        if not hasattr(player, "negotiation_patience"):
+        if player.negotiation_patience is None:
             player.negotiation_allowed = True
             player.negotiation_patience = base_patience
             player.negotiation_max_patience = base_patience # Store for UI
         
         # 3. Check if already walked away
-        if not getattr(player, "negotiation_allowed", True) or player.negotiation_patience <= 0:
+        if not player.negotiation_allowed or player.negotiation_patience <= 0:
              return {"status": "walk_away", "message": "我說過我不談了，自由市場見。"}
 
         fmv = self.calculate_market_value(player)
@@ -1709,10 +1630,11 @@ class GameManager:
         
         # Reset Playoffs
         self.playoff_series = []
+        self.playoff_seeds = []
         
         # Reset Player Stats
         for p in self.players:
-            p.stats = {"games": 0, "pts": 0, "reb": 0, "ast": 0}
+            p.stats = SeasonStats()
             
         # Reset Team Records
         for t in self.teams:
@@ -1725,142 +1647,138 @@ class GameManager:
     def _update_ai_strategies(self):
         """
         Updates strategy settings for all AI teams based on their roster strengths.
-        Runs daily to account for trades/signings/injuries (future).
+        Runs daily (season phase hook) to account for trades/signings/injuries (future).
         """
-        for team in self. teams:
-            if team.id == self.user_team_id:
-                continue
-                
-            # 1. Scoring Options (Top 3 Players by OVR)
-            # Find best offensive players (using OVR for now, could be specific stats)
-            sorted_roster = sorted(team.roster, key=lambda p: p.ovr, reverse=True)
-            
-            # Reset options
-            # Option 1: Best Player
-            opt1 = str(sorted_roster[0].id) if len(sorted_roster) > 0 else None
-            # Option 2: 2nd Best
-            opt2 = str(sorted_roster[1].id) if len(sorted_roster) > 1 else None
-            # Option 3: 3rd Best
-            opt3 = str(sorted_roster[2].id) if len(sorted_roster) > 2 else None
-            
-            team.strategy_settings["scoring_options"] = [opt1, opt2, opt3]
-            
-            # 2. Rotation Settings
-            # ++: Top 2
-            # +:  Next 3 (Starters)
-            #  :  Next 3 (Rotation)
-            # -:  Next 2 (Deep Bench)
-            # --: Rest
-            rotation_map = {}
-            for i, p in enumerate(sorted_roster):
-                if i < 2:
-                    role = "++"
-                elif i < 5:
-                    role = "+"
-                elif i < 8:
-                    role = " "
-                elif i < 10:
-                    role = "-"
-                else:
-                    role = "--"
-                rotation_map[str(p.id)] = role
-            
-            team.strategy_settings["rotation_settings"] = rotation_map
-            
-            # 3. Tactics Selection
-            # Check Top 8 (Rotation) average attributes
-            active_roster = sorted_roster[:8]
-            if not active_roster: continue
-            
-            avg_3pt = sum(p.attributes.three_pt for p in active_roster) / len(active_roster)
-            avg_2pt = sum(p.attributes.two_pt for p in active_roster) / len(active_roster)
-            
-            # Logic
-            # If 3PT is elite (> 80) or significantly better than 2PT -> Outside
-            # If 2PT is significantly better -> Inside
-            # Else -> Balanced
-            
-            if avg_3pt >= 75:
-                # Strong shooting team
-                tactic = "Outside"
-            elif avg_2pt > avg_3pt + 10:
-                # Dominant inside, weak outside
-                tactic = "Inside"
+        for team in self.teams:
+            if team.id != self.user_team_id:
+                self.update_team_strategy(team)
+
+    @staticmethod
+    def update_team_strategy(team):
+        """Sets scoring options, rotation and tactics for one (AI) team from its roster."""
+        # 1. Scoring Options (Top 3 Players by OVR)
+        # Find best offensive players (using OVR for now, could be specific stats)
+        sorted_roster = sorted(team.roster, key=lambda p: p.ovr, reverse=True)
+        
+        # Reset options
+        # Option 1: Best Player
+        opt1 = str(sorted_roster[0].id) if len(sorted_roster) > 0 else None
+        # Option 2: 2nd Best
+        opt2 = str(sorted_roster[1].id) if len(sorted_roster) > 1 else None
+        # Option 3: 3rd Best
+        opt3 = str(sorted_roster[2].id) if len(sorted_roster) > 2 else None
+        
+        team.strategy_settings["scoring_options"] = [opt1, opt2, opt3]
+        
+        # 2. Rotation Settings
+        # ++: Top 2
+        # +:  Next 3 (Starters)
+        #  :  Next 3 (Rotation)
+        # -:  Next 2 (Deep Bench)
+        # --: Rest
+        rotation_map = {}
+        for i, p in enumerate(sorted_roster):
+            if i < 2:
+                role = "++"
+            elif i < 5:
+                role = "+"
+            elif i < 8:
+                role = " "
+            elif i < 10:
+                role = "-"
             else:
-                tactic = "Balanced"
-                
-            team.strategy_settings["tactics"] = tactic
+                role = "--"
+            rotation_map[str(p.id)] = role
+        
+        team.strategy_settings["rotation_settings"] = rotation_map
+        
+        # 3. Tactics Selection
+        # Check Top 8 (Rotation) average attributes
+        active_roster = sorted_roster[:8]
+        if not active_roster: return
+        
+        avg_3pt = sum(p.attributes.three_pt for p in active_roster) / len(active_roster)
+        avg_2pt = sum(p.attributes.two_pt for p in active_roster) / len(active_roster)
+        
+        # Logic
+        # If 3PT is elite (> 80) or significantly better than 2PT -> Outside
+        # If 2PT is significantly better -> Inside
+        # Else -> Balanced
+        
+        if avg_3pt >= 75:
+            # Strong shooting team
+            tactic = "Outside"
+        elif avg_2pt > avg_3pt + 10:
+            # Dominant inside, weak outside
+            tactic = "Inside"
+        else:
+            tactic = "Balanced"
             
-            # print(f"DEBUG: AI Strategy Updated for {team.name}: {tactic}, Options: {[p.mask_name for p in team.roster if str(p.id) in [opt1, opt2, opt3]]}")
-
-    def advance_day(self):
-        """Advances the simulation by one day."""
-        if self.mode != "season":
-             return
-             
-        # 0. AI Strategy Update (Refactored)
-        self._update_ai_strategies()
-
-        # 1. Simulate Games (if any)
-        todays_games = [g for g in self.schedule if g.day == self.current_day]
-
-        self._generate_schedule()
+        team.strategy_settings["tactics"] = tactic
         
-        # Phase 14: AI Free Agency
-        # Run AFTER invalidation/draft so rosters are ready to be filled
-        self._ai_process_free_agency()
+        # print(f"DEBUG: AI Strategy Updated for {team.name}: {tactic}, Options: {[p.mask_name for p in team.roster if str(p.id) in [opt1, opt2, opt3]]}")
 
     def play_day(self):
         """Simulates all games for the current day and advances."""
-        games = self.get_todays_games()
-        results = []
-        
-        for game in games:
-            if game.played:
-                continue
-                
-            # Simulate
-            result = MatchEngine.simulate_game(game.home_team, game.away_team)
-            
-            # Phase 64: League Records Check
-            if "box_score" in result:
-                for pid, stats in result["box_score"].items():
-                    # Verify Player Object exists in teams
-                    p_obj = next((p for p in game.home_team.roster if p.id == pid), None)
-                    if not p_obj:
-                        p_obj = next((p for p in game.away_team.roster if p.id == pid), None)
-                    
-                    if p_obj:
-                        self.check_new_records(p_obj, stats)
-
-            # Update Game Object
-            game.played = True
-            game.result = result
-            
-            # --- Gamification Hook ---
-            winner_team = game.home_team if result["home_score"] > result["away_score"] else game.away_team
-            if winner_team.id == self.user_team_id:
-                self.add_gm_score(10, "Season Win")
-                self.unlock_achievement("first_win", "First Blood", "Win your first game.")
+        # Changes made during the day (AI signings, GM score) ride on the day-end save
+        with self.save_policy.deferred():
+            # First game day after the offseason starts the new regular season
+            if self.phases.phase == PHASE_FREE_AGENCY:
+                self.advance_phase(PHASE_REGULAR_SEASON)
+
+            games = [g for g in self.get_todays_games() if not g.played]
+            results = []
+
+            # Simulate (optionally on the process pool; results are merged in schedule order)
+            fidelities = [self.game_fidelity(g) for g in games]
+            executor = getattr(self, "sim_executor", None)
+            if executor and len(games) > 1:
+                seeds = [self.game_seed(g) for g in games]
+                sim_results = executor.simulate_games(games, seeds, fidelities)
+            else:
+                sim_results = [None] * len(games)
+
+            for game, fidelity, result in zip(games, fidelities, sim_results):
+                if result is None:
+                    result = MatchEngine.simulate_game(game.home_team, game.away_team,
+                                                       rng=self.rng_for("game", self.season_year, game.id),
+                                                       fidelity=fidelity)
+                else:
+                    MatchEngine.apply_result(game.home_team, game.away_team, result.box_score, result.home_won)
+
+                # Phase 64: League Records Check
+                self._check_game_records(game, result)
+
+                # Update Game Object
+                game.played = True
+                game.result = result
+                game.home_score = result.home_score
+                game.away_score = result.away_score
+            
+                # --- Gamification Hook ---
+                winner_team = game.home_team if result.home_won else game.away_team
+                if winner_team.id == self.user_team_id:
+                    self.add_gm_score(10, "Season Win")
+                    self.unlock_achievement("first_win", "First Blood", "Win your first game.")
                 
-                # Check for Perfect Season (Example: if wins reaches specific count?)
-                # user_team = self.get_team(self.user_team_id)
-                # if user_team and user_team.wins + user_team.losses == 0: pass # Start of season
-            # -------------------------
+                    # Check for Perfect Season (Example: if wins reaches specific count?)
+                    # user_team = self.get_team(self.user_team_id)
+                    # if user_team and user_team.wins + user_team.losses == 0: pass # Start of season
+                # -------------------------
             
-            results.append(result)
+                results.append(result)
             
-        # Update Playoff Series Status (If applicable)
-        if self.playoff_series:
-            self._update_playoff_progress(results)
+            # Update Playoff Series Status (If applicable)
+            if self.playoff_series:
+                self._update_playoff_progress(results)
 
-        # AI Mid-Season Moves (Daily)
-        self._ai_process_midseason_free_agency()
+            # Daily work of the current phase (AI signings, trades)
+            self.phases.run_day()
             
-        self.advance_day()
+            self.advance_day()
         
-        # Aggressive Auto-Save (Mobile Requirement)
-        self.save_game(1)
+        # Aggressive Auto-Save (Mobile Requirement; SavePolicy may batch days)
+        self.autosave(TRIGGER_DAY)
         
         return results
 
@@ -1868,13 +1786,95 @@ class GameManager:
         self.current_day += 1
         
         # Check for Regular Season End
-        if self.current_day > self.total_regular_season_days:
-            if not self.playoff_series:
+        if self.phases.phase == PHASE_REGULAR_SEASON:
+            if self.current_day > self.total_regular_season_days:
                 # Regular Season just ended. Start Playoffs.
-                self._start_playoffs()
-            else:
-                 # Playoffs are ongoing. Schedule next games if needed.
-                 self._schedule_next_playoff_games()
+                self.advance_phase(PHASE_PLAYOFFS)
+        elif self.phases.phase == PHASE_PLAYOFFS:
+            # Playoffs are ongoing. Schedule next games if needed.
+            self._schedule_next_playoff_games()
+
+    # --- Bulk simulation ---
+
+    def simulate_until(self, target: Union[int, str], on_progress: Callable[[SimProgress], None] = None,
+                       progress_interval: float = 0.1, max_days: int = 1000) -> SimProgress:
+        """
+        Plays days until target: a day number (stop when current_day reaches it), a
+        season phase (stop on entering it), TARGET_USER_GAME or TARGET_SEASON_END.
+        Saves are deferred to one write at the end. on_progress gets a SimProgress at
+        most every progress_interval seconds, plus the final one, so UI refreshes
+        don't throttle the loop. Stops early when the season is over (days alone
+        don't move the offseason) or the playoffs have nothing left to schedule.
+        """
+        last = None
+        next_report = 0.0
+        for progress in self.iter_simulation(target, max_days):
+            last = progress
+            if on_progress and (progress.done or time.perf_counter() >= next_report):
+                on_progress(progress)
+                next_report = time.perf_counter() + progress_interval
+        return last
+
+    def iter_simulation(self, target: Union[int, str], max_days: int = 1000) -> Iterator[SimProgress]:
+        """Generator form of simulate_until: one SimProgress per simulated day, then a final done=True one."""
+        reached = self._sim_target(target)
+        total = self._estimate_sim_days(target)
+        days = games = 0
+        with self.deferred_saves():
+            while not reached() and days < max_days:
+                phase = self.phases.phase
+                if phase not in (PHASE_REGULAR_SEASON, PHASE_PLAYOFFS, PHASE_FREE_AGENCY):
+                    break # Season over
+                if phase == PHASE_PLAYOFFS and not self.get_todays_games():
+                    break # Stalled (playoffs could not be set up)
+                games += len(self.play_day())
+                days += 1
+                yield SimProgress(days, games, self.current_day, self.phases.phase, total, False)
+        yield SimProgress(days, games, self.current_day, self.phases.phase, total, True)
+
+    def _sim_target(self, target: Union[int, str]) -> Callable[[], bool]:
+        """Stop condition for simulate_until."""
+        if isinstance(target, int):
+            return lambda: self.current_day >= target
+        if target == TARGET_SEASON_END:
+            target = PHASE_AWARDS
+        if target == TARGET_USER_GAME:
+            return lambda: self._user_plays_on(self.current_day)
+        if target not in PHASE_ORDER:
+            raise ValueError(f"Unknown simulation target: {target}")
+        return lambda: self.phases.phase == target
+
+    def _user_plays_on(self, day: int) -> bool:
+        return any(not g.played and self.user_team_id in (g.home_team.id, g.away_team.id)
+                   for g in self.index.games_on(day))
+
+    def _estimate_sim_days(self, target: Union[int, str]) -> Optional[int]:
+        """Rough length of a simulate_until run, for progress bars."""
+        if isinstance(target, int):
+            return max(0, target - self.current_day)
+        regular_left = max(0, self.total_regular_season_days + 1 - self.current_day)
+        if target == PHASE_PLAYOFFS:
+            return regular_left
+        if target in (PHASE_AWARDS, TARGET_SEASON_END):
+            # Regular season left + every playoff series going the distance
+            bracket = self.playoff_bracket()
+            playoff_days = sum(bracket.best_of(r) for r in range(1, bracket.rounds + 1))
+            if bracket.play_in:
+                playoff_days += 2 * bracket.best_of(PLAY_IN_ROUND)
+            playoff_days_done = max(0, self.current_day - self.total_regular_season_days - 1)
+            return regular_left + max(1, playoff_days - playoff_days_done)
+        if target == TARGET_USER_GAME:
+            day = next((d for d in sorted(self.index.games_by_day) if d >= self.current_day and self._user_plays_on(d)), None)
+            return day - self.current_day if day is not None else None
+        return None
+
+    def playoff_bracket(self) -> PlayoffBracket:
+        """Bracket for the league format and the current number of teams."""
+        return PlayoffBracket(self.league_format, len([t for t in self.teams if t.id != "T00"]))
+
+    def playoff_champion(self) -> Optional[Team]:
+        """Winner of the finals, or None while the season is still going."""
+        return self.playoff_bracket().champion(self.playoff_series) if self.playoff_series else None
 
     def _start_playoffs(self):
         print("DEBUG: Starting Playoffs!")
@@ -1883,30 +1883,18 @@ class GameManager:
                            key=lambda x: (x.wins, x.wins/(x.losses+x.wins) if x.losses+x.wins > 0 else 0), 
                            reverse=True)
                            
-        # Top 4 make playoffs
-        if len(standings) < 4:
+        # Top N make playoffs (N from the league format)
+        bracket = self.playoff_bracket()
+        if len(standings) < bracket.size:
             print("ERROR: Not enough teams for playoffs!")
             return
             
-        seeds = standings[:4]
-        self.playoff_series = []
-        
-        # 1 vs 4
-        s1 = {
-            "id": "S1", "round": 1, 
-            "t1": seeds[0], "t2": seeds[3], 
-            "w1": 0, "w2": 0, "winner": None
-        }
-        # 2 vs 3
-        s2 = {
-            "id": "S2", "round": 1, 
-            "t1": seeds[1], "t2": seeds[2], 
-            "w1": 0, "w2": 0, "winner": None
-        }
-        self.playoff_series.append(s1)
-        self.playoff_series.append(s2)
+        seeds = standings[:bracket.num_seeds]
+        self.playoff_seeds = [t.id for t in seeds]
+        self.playoff_series = bracket.start(seeds)
         
-        print(f"DEBUG: Playoff Semi-Finals Set: {seeds[0].name} vs {seeds[3].name}, {seeds[1].name} vs {seeds[2].name}")
+        matchups = ", ".join(f"{s['t1'].name} vs {s['t2'].name}" for s in self.playoff_series)
+        print(f"DEBUG: Playoffs Set ({bracket.size} teams{', play-in' if bracket.play_in else ''}): {matchups}")
         self._schedule_next_playoff_games()
 
     def _schedule_next_playoff_games(self):
@@ -1936,7 +1924,7 @@ class GameManager:
                  away_team=s["t2"] if game_num % 2 != 0 else s["t1"]
             )
             # Simple alternating home field for now
-            self.schedule.append(g)
+            self.add_game(g)
             games_added += 1
         
         if games_added > 0:
@@ -1945,84 +1933,51 @@ class GameManager:
     def _update_playoff_progress(self, results):
         """Updates series scores based on game results."""
         if not self.playoff_series: return
-        
-        series_updated = set()
+        bracket = self.playoff_bracket()
         
         for res in results:
-            # We assume results don't carry Game ID, but we can verify team names
-            # Or better, iterate Today's Games that were played?
-            # Matching by team names in series
-            
-            winner_name = res["winner"] # Name
+            # Match results to series by team id (GameResult carries both ids)
+            teams_in_game = (res.home_team_id, res.away_team_id)
             
             for s in self.playoff_series:
                 if s.get("winner"): continue
                 
                 # Check if this result belongs to this series
-                if (s["t1"].name in [res["home_team"], res["away_team"]] and 
-                    s["t2"].name in [res["home_team"], res["away_team"]]):
-                    
-                    if winner_name == s["t1"].name:
-                        s["w1"] += 1
-                    else:
-                        s["w2"] += 1
-                    
+                if s["t1"].id in teams_in_game and s["t2"].id in teams_in_game:
+                    # Best-of-N from the league format
+                    bracket.record_win(s, res.winner_id)
                     print(f"DEBUG: Series {s['id']} Update: {s['t1'].name} {s['w1']} - {s['w2']} {s['t2'].name}")
-                    series_updated.add(s["id"])
                     
-                    # Check Victory (Best of 7 = 4 Wins)
-                    if s["w1"] == 4:
-                        s["winner"] = s["t1"]
-                        print(f"DEBUG: {s['t1'].name} Wins Series {s['id']}!")
-                    elif s["w2"] == 4:
-                        s["winner"] = s["t2"]
-                        print(f"DEBUG: {s['t2'].name} Wins Series {s['id']}!")
-                        
                     # Trigger Next Round Logic if Series Ends
                     if s["winner"]:
-                        self._check_round_completion()
+                        print(f"DEBUG: {s['winner'].name} Wins Series {s['id']}!")
+                        self._check_round_completion(bracket)
                     break
 
-    def _check_round_completion(self):
-        """Checks if all series in the current round are finished, then starts next round."""
-        active_round = max(s["round"] for s in self.playoff_series)
-        current_round_series = [s for s in self.playoff_series if s["round"] == active_round]
-        
-        if all(s["winner"] for s in current_round_series):
-            # Round Complete!
-            print(f"DEBUG: Round {active_round} Complete!")
-            
-            if active_round == 1:
-                # Semi-Finals Done -> Start Finals
-                # Find the two winners
-                winners = [s["winner"] for s in current_round_series]
-                if len(winners) != 2:
-                    print("ERROR: Weird number of winners for Finals.")
-                    return
-                    
-                finals = {
-                    "id": "F1", "round": 2,
-                    "t1": winners[0], "t2": winners[1],
-                    "w1": 0, "w2": 0, "winner": None
-                }
-                self.playoff_series.append(finals)
-                print(f"DEBUG: Finals Set: {winners[0].name} vs {winners[1].name}")
-                # Do NOT schedule here. advance_day will do it for the NEXT day.
-                
-            elif active_round == 2:
-                # Finals Done -> Champion!
-                finals_series = current_round_series[0] # Should be only 1
-                champion = finals_series["winner"]
-                print(f"DEBUG: SEASON CHAMPION: {champion.name}")
-                
-                # TRIGGER AWARDS
-                self._calculate_and_store_awards(champion)
+    def _check_round_completion(self, bracket: PlayoffBracket = None):
+        """Once every series of the current round is decided, sets up the next one (or crowns the champion)."""
+        bracket = bracket or self.playoff_bracket()
+        champion = bracket.champion(self.playoff_series)
+        if champion:
+            # Finals Done -> Champion! (awards are the next phase's enter hook)
+            print(f"DEBUG: SEASON CHAMPION: {champion.name}")
+            self.advance_phase(PHASE_AWARDS)
+            return
+
+        seeds = [self.get_team(tid) for tid in self.playoff_seeds]
+        next_round = bracket.advance(self.playoff_series, seeds)
+        if next_round:
+            # Do NOT schedule here. advance_day will do it for the NEXT day.
+            self.playoff_series.extend(next_round)
+            matchups = ", ".join(f"{s['t1'].name} vs {s['t2'].name}" for s in next_round)
+            print(f"DEBUG: Playoff Round {next_round[0]['round']} Set: {matchups}")
 
     def _ai_process_midseason_free_agency(self):
         """
         AI Teams occasionally check Free Agency during the season to fill roster spots.
         Triggered daily with a small probability.
         """
+        rng = self.rng_for("midseason_fa", self.season_year, self.current_day)
         ai_teams = [t for t in self.teams if t.id != "T00" and t.id != self.user_team_id]
         fa_team = self.get_team("T00")
         if not fa_team or not fa_team.roster: return
@@ -2032,8 +1987,8 @@ class GameManager:
         
         for team in ai_teams:
             # 1. Check Roster Limit & Chance
-            # AI usually only fills to 13. But for Stars (OVR>=80), will go to 15.
-            limit = 13
+            # AI usually only fills to roster_size (13). But for Stars (OVR>=80), will go to max_roster (15).
+            limit = self.league_format.roster_size
             chance = 0.08
             
             # Star Hunting: If top FA is a Star, boost chance and limit
@@ -2041,11 +1996,11 @@ class GameManager:
             is_star_hunt = (best_fa and best_fa.ovr >= 80)
             
             if is_star_hunt:
-                limit = 15
+                limit = self.league_format.max_roster
                 chance = 0.80 # High aggression for stars
             
             if len(team.roster) >= limit: continue
-            if random.random() > chance: continue
+            if rng.random() > chance: continue
             
             # 3. Check Cap Space
             payroll = sum(p.salary for p in team.roster)
@@ -2069,7 +2024,7 @@ class GameManager:
                 fmv = self.calculate_market_value(target) # Recalc? (already done)
                 target.salary = fmv
                 target.contract_length = 1 
-                if target.ovr >= 80: target.contract_length = random.randint(2, 4) # Lock stars
+                if target.ovr >= 80: target.contract_length = rng.randint(2, 4) # Lock stars
                 
                 success, msg = self.sign_player(target, team)
                 if success:
@@ -2078,6 +2033,7 @@ class GameManager:
 
     def _ai_process_renewals(self):
         """AI attempts to renew key players before they hit Free Agency."""
+        rng = self.rng_for("renewals", self.season_year)
         print("DEBUG: AI Processing Contract Renewals...")
         ai_teams = [t for t in self.teams if t.id != "T00" and t.id != self.user_team_id]
         
@@ -2107,8 +2063,7 @@ class GameManager:
                     
                     if cap_space - reserve_buffer >= salary_diff:
                         # Renew!
-                        import random
-                        length = random.randint(3, 5)
+                        length = rng.randint(3, 5)
                         
                         p.salary = fmv
                         p.contract_length = length 
@@ -2121,6 +2076,7 @@ class GameManager:
 
     def _ai_process_free_agency(self):
         """AI signs players from Free Agency to fill roster holes."""
+        rng = self.rng_for("free_agency", self.season_year, self.current_day)
         # print("DEBUG: AI Processing Free Agency...") # Reduce spam
         ai_teams = [t for t in self.teams if t.id != "T00" and t.id != self.user_team_id]
         fa_team = self.get_team("T00")
@@ -2134,8 +2090,8 @@ class GameManager:
             payroll = sum(p.salary for p in team.roster)
             cap_space = self.salary_cap - payroll
             
-            # Target Roster Size: 13
-            needs = 13 - roster_size
+            # Target Roster Size: league format (13)
+            needs = self.league_format.roster_size - roster_size
             if needs <= 0: continue
             
             # Analyze Positional Needs
@@ -2181,9 +2137,9 @@ class GameManager:
                 if cap_space >= ask:
                      # Contract Negotiation Simulation
                      fa.salary = ask
-                     fa.contract_length = random.randint(1, 2) 
+                     fa.contract_length = rng.randint(1, 2) 
                      if is_star: 
-                         fa.contract_length = random.randint(3, 5) # Lock stars down longer
+                         fa.contract_length = rng.randint(3, 5) # Lock stars down longer
 
                      if self.sign_player(fa, team):
                          cap_space -= ask
@@ -2203,3 +2159,40 @@ class GameManager:
                          else: pos_counts["F"] += 1
             
 
+
+    def fill_ai_rosters(self, max_passes: int = 20) -> int:
+        """
+        Repeats AI free agency until every AI roster reaches league_format.roster_size
+        (headless runs: nobody else signs players between seasons). Teams the regular
+        pass leaves short (no positional fit, no cap room) take the best free agent they
+        can afford, or the best one on a minimum contract.
+        Returns the number of signings.
+        """
+        target = self.league_format.roster_size
+        ai_teams = [t for t in self.teams if t.id != "T00" and t.id != self.user_team_id]
+        fa_team = self.get_team("T00")
+        start = sum(len(t.roster) for t in ai_teams)
+
+        for _ in range(max_passes):
+            if all(len(t.roster) >= target for t in ai_teams):
+                break
+            before = sum(len(t.roster) for t in ai_teams)
+            self._ai_process_free_agency()
+            if sum(len(t.roster) for t in ai_teams) == before:
+                break
+
+        rng = self.rng_for("free_agency_fill", self.season_year)
+        for team in ai_teams:
+            while fa_team and fa_team.roster and len(team.roster) < target:
+                cap_space = self.salary_cap - team.salary_total
+                available = sorted(fa_team.roster, key=lambda p: p.ovr, reverse=True)
+                fa = next((p for p in available if self.calculate_market_value(p) <= cap_space), None)
+                if fa:
+                    fa.salary = self.calculate_market_value(fa)
+                else:
+                    # Capped out: minimum contract (0.5M), allowed over the cap to fill the roster
+                    fa = available[0]
+                    fa.salary = 0.5
+                fa.contract_length = rng.randint(1, 2)
+                self.move_player(fa, team)
+        return sum(len(t.roster) for t in ai_teams) - start
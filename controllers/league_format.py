@@ -0,0 +1,70 @@
+from dataclasses import asdict, dataclass, fields
+from typing import Optional, Tuple
+
+from .scheduler import ScheduleConfig
+
+
+@dataclass(frozen=True)
+class LeagueFormat:
+    """
+    League shape, read from the data file's optional "league_format" block.
+    The schedule, playoff bracket, draft order and AI roster targets all derive
+    from it. Defaults are the TPBL setup: 6 round robins, top 4, two best-of-7 rounds.
+    """
+    teams: Optional[int] = None                 # Minimum team count (dummy teams fill the gap); None = what the data has (at least 4)
+    games_per_team: Optional[int] = None        # Regular-season length (e.g. 82); None = `cycles` full round robins
+    cycles: int = 6                             # Full round robins when games_per_team is None
+    max_consecutive_days: Optional[int] = None  # Back-to-back limit for the schedule
+    playoff_teams: int = 4                      # Bracket size (power of two); shrinks to fit small leagues
+    series_lengths: Tuple[int, ...] = (7, 7)    # Best-of per round, first round first; the first entry repeats for bigger brackets
+    play_in: bool = False                       # Seeds P-1..P+2 play in for the last two spots (needs P+2 teams)
+    play_in_best_of: int = 1
+    roster_size: int = 13                       # AI fills rosters to this many players
+    max_roster: int = 15                        # AI goes past roster_size only for stars, up to this
+    draft_rounds: int = 2
+
+    def __post_init__(self):
+        n = self.playoff_teams
+        if n < 2 or n & (n - 1):
+            raise ValueError(f"playoff_teams must be a power of two >= 2, got {n}")
+        lengths = tuple(self.series_lengths)
+        if not lengths or any(b < 1 or b % 2 == 0 for b in lengths + (self.play_in_best_of,)):
+            raise ValueError(f"Series lengths must be odd and positive, got {lengths} / {self.play_in_best_of}")
+        object.__setattr__(self, "series_lengths", lengths) # JSON gives lists
+        if self.teams is not None and self.teams < 2:
+            raise ValueError(f"teams must be >= 2, got {self.teams}")
+        if self.max_roster < self.roster_size:
+            raise ValueError("max_roster must be >= roster_size")
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> "LeagueFormat":
+        """Unknown keys are ignored so older/newer data files still load."""
+        if not data:
+            return cls()
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+    def to_dict(self) -> dict:
+        d = asdict(self)
+        d["series_lengths"] = list(self.series_lengths)
+        return d
+
+    def schedule_config(self) -> ScheduleConfig:
+        return ScheduleConfig(rounds=self.cycles, games_per_team=self.games_per_team,
+                              max_consecutive_days=self.max_consecutive_days)
+
+    def bracket_size(self, num_teams: int) -> int:
+        """Playoff teams for a league of num_teams: playoff_teams, halved until it fits."""
+        size = self.playoff_teams
+        while size > 2 and size > num_teams:
+            size //= 2
+        return size
+
+    def best_of(self, round_num: int, total_rounds: int) -> int:
+        """Series length for a playoff round (1 = first round, total_rounds = finals, 0 = play-in)."""
+        if round_num <= 0:
+            return self.play_in_best_of
+        lengths = self.series_lengths
+        # Count from the finals so a smaller bracket keeps the later rounds' lengths
+        i = len(lengths) - 1 - (total_rounds - round_num)
+        return lengths[max(0, i)]
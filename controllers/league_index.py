@@ -0,0 +1,63 @@
+from typing import Dict, Iterable, List, Optional
+
+from models.player import Player
+from models.team import Team
+from models.game import Game
+
+
+class LeagueIndex:
+    """
+    O(1) lookups over GameManager's league state: id -> Team, id -> Player,
+    team_id -> roster (the Team's own roster list) and day -> games.
+    GameManager keeps it current through its mutation helpers (add_player,
+    move_player, remove_player, add_team, add_game) and rebuilds it whenever
+    teams / players / schedule are replaced wholesale (initialize, load, new schedule).
+    """
+
+    def __init__(self):
+        self.teams: Dict[str, Team] = {}
+        self.players: Dict[str, Player] = {}
+        self.games_by_day: Dict[int, List[Game]] = {}
+
+    def rebuild(self, teams: Iterable[Team], players: Iterable[Player], schedule: Iterable[Game]):
+        self.teams = {t.id: t for t in teams}
+        self.players = {p.id: p for p in players}
+        self.rebuild_schedule(schedule)
+
+    def rebuild_schedule(self, schedule: Iterable[Game]):
+        self.games_by_day = {}
+        for g in schedule:
+            self.games_by_day.setdefault(g.day, []).append(g)
+
+    # --- Lookups ---
+
+    def team(self, team_id: str) -> Optional[Team]:
+        return self.teams.get(team_id)
+
+    def player(self, player_id: str) -> Optional[Player]:
+        return self.players.get(player_id)
+
+    def roster(self, team_id: str) -> List[Player]:
+        team = self.teams.get(team_id)
+        return team.roster if team else []
+
+    def games_on(self, day: int) -> List[Game]:
+        return self.games_by_day.get(day, [])
+
+    def has_player(self, player: Player) -> bool:
+        return self.players.get(player.id) is player
+
+    # --- Updates (called by GameManager's mutation helpers) ---
+
+    def add_team(self, team: Team):
+        self.teams[team.id] = team
+
+    def add_player(self, player: Player):
+        self.players[player.id] = player
+
+    def remove_player(self, player: Player):
+        if self.players.get(player.id) is player:
+            del self.players[player.id]
+
+    def add_game(self, game: Game):
+        self.games_by_day.setdefault(game.day, []).append(game)
@@ -0,0 +1,149 @@
+from typing import Dict, List, Optional, Sequence
+
+from models.team import Team
+from .league_format import LeagueFormat
+
+PLAY_IN_ROUND = 0
+
+
+def bracket_order(size: int) -> List[int]:
+    """Seeds 1..size in bracket order, e.g. 8 -> 1,8,4,5,2,7,3,6 (1 and 2 can only meet in the finals)."""
+    order = [1]
+    while len(order) < size:
+        n = len(order) * 2
+        order = [s for seed in order for s in (seed, n + 1 - seed)]
+    return order
+
+
+class PlayoffBracket:
+    """
+    Single-elimination bracket over the series dicts GameManager keeps in
+    playoff_series: {id, round, slot, best_of, t1, t2, w1, w2, winner}.
+    Round 1 pairs seeds in bracket order (slot k = order[2k] v order[2k+1]); the
+    winners of slots 2k and 2k+1 meet in slot k of the next round, upper slot as t1.
+    With play-in, round 0 decides the last two seeds first (PI1: P-1 v P, PI2:
+    P+1 v P+2, PI3: loser PI1 v winner PI2). Ids: PI1-3, then S1, S2, ... and F1 for the finals.
+    """
+
+    def __init__(self, fmt: LeagueFormat, num_teams: int):
+        self.format = fmt
+        self.size = fmt.bracket_size(num_teams)
+        self.rounds = self.size.bit_length() - 1 # Finals round number
+        self.play_in = fmt.play_in and num_teams >= self.size + 2
+
+    @property
+    def num_seeds(self) -> int:
+        """Teams that qualify from the standings (including play-in teams)."""
+        return self.size + 2 if self.play_in else self.size
+
+    def best_of(self, round_num: int) -> int:
+        return self.format.best_of(round_num, self.rounds)
+
+    def wins_needed(self, series: Dict) -> int:
+        # Series saved before league formats have no best_of
+        return (series.get("best_of") or self.best_of(series["round"])) // 2 + 1
+
+    # --- Series results ---
+
+    def record_win(self, series: Dict, team_id: str) -> bool:
+        """Counts one game for team_id; True if it decided the series."""
+        if team_id == series["t1"].id:
+            series["w1"] += 1
+        else:
+            series["w2"] += 1
+        need = self.wins_needed(series)
+        if series["w1"] >= need:
+            series["winner"] = series["t1"]
+        elif series["w2"] >= need:
+            series["winner"] = series["t2"]
+        return series["winner"] is not None
+
+    @staticmethod
+    def loser(series: Dict) -> Optional[Team]:
+        if not series.get("winner"):
+            return None
+        return series["t2"] if series["winner"] is series["t1"] else series["t1"]
+
+    def is_final(self, series: Dict) -> bool:
+        return series["round"] == self.rounds
+
+    def champion(self, series_list: Sequence[Dict]) -> Optional[Team]:
+        return next((s["winner"] for s in series_list if self.is_final(s) and s.get("winner")), None)
+
+    def elimination_rounds(self, series_list: Sequence[Dict]) -> Dict[str, int]:
+        """team_id -> round the team went out in (champion = rounds + 1). Play-in losers count as 0."""
+        out = {}
+        for s in series_list:
+            if s.get("winner"):
+                out[self.loser(s).id] = s["round"]
+                if self.is_final(s):
+                    out[s["winner"].id] = self.rounds + 1
+        return out
+
+    # --- Building rounds ---
+
+    def start(self, seeds: Sequence[Team]) -> List[Dict]:
+        """First stage for teams in seed order (play-in when enabled, else round 1)."""
+        if self.play_in:
+            p = self.size
+            return [self._series("PI1", PLAY_IN_ROUND, 0, seeds[p - 2], seeds[p - 1]),
+                    self._series("PI2", PLAY_IN_ROUND, 1, seeds[p], seeds[p + 1])]
+        return self._first_round(seeds, [])
+
+    def advance(self, series_list: Sequence[Dict], seeds: Sequence[Team]) -> List[Dict]:
+        """
+        New series once every series of the latest stage is decided; [] while it is
+        still running or after the finals. seeds is only needed to leave the play-in.
+        """
+        if not series_list:
+            return []
+        current = max(s["round"] for s in series_list)
+        stage = [s for s in series_list if s["round"] == current]
+        if not all(s.get("winner") for s in stage):
+            return []
+
+        if current == PLAY_IN_ROUND:
+            by_id = {s["id"]: s for s in stage}
+            if "PI3" not in by_id:
+                return [self._series("PI3", PLAY_IN_ROUND, 2, self.loser(by_id["PI1"]), by_id["PI2"]["winner"])]
+            seeds = list(seeds[:self.size])
+            seeds[self.size - 2] = by_id["PI1"]["winner"]
+            seeds[self.size - 1] = by_id["PI3"]["winner"]
+            return self._first_round(seeds, series_list)
+
+        if current >= self.rounds:
+            return []
+        stage.sort(key=lambda s: s["slot"])
+        made = []
+        for k in range(len(stage) // 2):
+            upper, lower = stage[2 * k], stage[2 * k + 1]
+            made.append(self._series(self._next_id(current + 1, list(series_list) + made), current + 1, k,
+                                     upper["winner"], lower["winner"]))
+        return made
+
+    def seeds_from_first_round(self, series_list: Sequence[Dict]) -> List[Team]:
+        """Seed order rebuilt from the round-1 series (for saves without playoff_seeds)."""
+        first = {s["slot"]: s for s in series_list if s["round"] == 1}
+        seeds: List[Optional[Team]] = [None] * self.size
+        order = bracket_order(self.size)
+        for k, s in first.items():
+            seeds[order[2 * k] - 1] = s["t1"]
+            seeds[order[2 * k + 1] - 1] = s["t2"]
+        return seeds
+
+    def _first_round(self, seeds: Sequence[Team], existing: Sequence[Dict]) -> List[Dict]:
+        order = bracket_order(self.size)
+        made = []
+        for k in range(self.size // 2):
+            made.append(self._series(self._next_id(1, list(existing) + made), 1, k,
+                                     seeds[order[2 * k] - 1], seeds[order[2 * k + 1] - 1]))
+        return made
+
+    def _next_id(self, round_num: int, existing: Sequence[Dict]) -> str:
+        if round_num == self.rounds:
+            return "F1"
+        return f"S{sum(1 for s in existing if s['round'] != PLAY_IN_ROUND) + 1}"
+
+    def _series(self, sid: str, round_num: int, slot: int, t1: Team, t2: Team) -> Dict:
+        return {"id": sid, "round": round_num, "slot": slot, "best_of": self.best_of(round_num),
+                "t1": t1, "t2": t2, "w1": 0, "w2": 0, "winner": None}
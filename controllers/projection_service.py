@@ -0,0 +1,274 @@
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models.team import Team
+from .playoff_bracket import PlayoffBracket, PLAY_IN_ROUND, bracket_order
+from models.batch_engine import BatchMatchEngine
+from models.sim_params import get_sim_params
+from utils.rng_utils import derive_np_rng
+
+# Finished projections, keyed by ProjectionService.cache_key(); least recently used dropped first.
+# Only the latest day is normally asked for again (tab switches), so a few entries are plenty.
+CACHE_SIZE = 4
+_cache: "OrderedDict[Tuple, ProjectionResult]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_get(key: Tuple) -> Optional["ProjectionResult"]:
+    with _cache_lock:
+        result = _cache.get(key)
+        if result is not None:
+            _cache.move_to_end(key)
+        return result
+
+
+def _cache_put(key: Tuple, result: "ProjectionResult"):
+    with _cache_lock:
+        _cache[key] = result
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+class ProjectionResult:
+    """
+    Monte Carlo tallies for the rest of the season.
+    Counts are per team (row order = team_ids); probabilities = counts / runs_done.
+    """
+
+    def __init__(self, team_ids: List[str], runs_total: int, num_seeds: int = 4):
+        self.team_ids = team_ids
+        self.runs_total = runs_total
+        self.runs_done = 0
+        n = len(team_ids)
+        self.seed_counts = np.zeros((n, num_seeds), dtype=np.int64) # Seed 1-N (after any play-in)
+        self.finals_counts = np.zeros(n, dtype=np.int64)
+        self.title_counts = np.zeros(n, dtype=np.int64)
+
+    @property
+    def complete(self) -> bool:
+        return self.runs_done >= self.runs_total
+
+    def probabilities(self) -> Dict[str, Dict[str, float]]:
+        """team_id -> {"seed_1".."seed_N", "playoffs", "finals", "title"}"""
+        runs = max(1, self.runs_done)
+        out = {}
+        for i, tid in enumerate(self.team_ids):
+            row = {f"seed_{k + 1}": float(self.seed_counts[i, k]) / runs for k in range(self.seed_counts.shape[1])}
+            row["playoffs"] = float(self.seed_counts[i].sum()) / runs
+            row["finals"] = float(self.finals_counts[i]) / runs
+            row["title"] = float(self.title_counts[i]) / runs
+            out[tid] = row
+        return out
+
+    def to_dict(self) -> Dict:
+        return {"runs_done": self.runs_done, "runs_total": self.runs_total, "teams": self.probabilities()}
+
+
+class ProjectionService:
+    """
+    Playoff odds: simulates the remaining regular season plus the playoff bracket
+    (league format: size, play-in, series lengths) N times on the vectorized BatchMatchEngine.
+    Work is done in chunks so callers get incremental results; start() runs it
+    on a background thread. The last few finished results are cached by (season, day, league hash).
+    """
+
+    def __init__(self, gm=None, runs: int = 1000, chunk_size: int = 50):
+        if gm is None:
+            from .game_manager import GameManager
+            gm = GameManager()
+        self.gm = gm
+        self.runs = runs
+        self.chunk_size = chunk_size
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # --- Cache ---
+
+    def cache_key(self) -> Tuple:
+        """(season, day, hash of standings + rosters + strategies)."""
+        gm = self.gm
+        h = hashlib.blake2b(digest_size=16)
+        for t in gm.teams:
+            if t.id == "T00": continue
+            h.update(f"{t.id}:{t.wins}:{t.losses}".encode("utf-8"))
+            for p in t.roster:
+                a = p.attributes
+                h.update(f"|{p.id}:{p.ovr}:{p.pos}:{p.offense_status}:{a.two_pt}:{a.three_pt}:{a.rebound}:"
+                         f"{a.passing}:{a.consistency}:{a.block}:{a.steal}:{a.defense}".encode("utf-8"))
+            h.update(json.dumps(t.strategy_settings, sort_keys=True, default=str).encode("utf-8"))
+        for s in gm.playoff_series:
+            h.update(f"{s['id']}:{s['w1']}:{s['w2']}".encode("utf-8"))
+        return (gm.season_year, gm.current_day, h.hexdigest())
+
+    def get_cached(self) -> Optional[ProjectionResult]:
+        return _cache_get(self.cache_key())
+
+    # --- Running ---
+
+    def project(self, runs: int = None, on_update: Callable[[ProjectionResult], None] = None) -> ProjectionResult:
+        """Runs the projection synchronously; on_update(result) fires after every chunk."""
+        key = self.cache_key()
+        cached = _cache_get(key)
+        if cached and cached.runs_total >= (runs or self.runs):
+            if on_update: on_update(cached)
+            return cached
+
+        self._cancel.clear()
+        state = self._snapshot()
+        result = ProjectionResult(state["team_ids"], runs or self.runs, state["bracket"].size)
+        P = get_sim_params()
+        seed = getattr(self.gm, "league_seed", None)
+
+        chunk_idx = 0
+        while not result.complete and not self._cancel.is_set():
+            n = min(self.chunk_size, result.runs_total - result.runs_done)
+            rng = derive_np_rng(seed, "projection", key[0], key[1], chunk_idx)
+            self._run_chunk(state, n, result, rng, P)
+            result.runs_done += n
+            chunk_idx += 1
+            if on_update: on_update(result)
+
+        if result.complete:
+            _cache_put(key, result)
+        return result
+
+    def start(self, runs: int = None, on_update: Callable[[ProjectionResult], None] = None) -> threading.Thread:
+        """Runs project() on a daemon thread (cancels any previous run)."""
+        self.cancel()
+        self._thread = threading.Thread(target=self.project, args=(runs, on_update), daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def cancel(self):
+        if self._thread and self._thread.is_alive():
+            self._cancel.set()
+            self._thread.join()
+        self._thread = None
+
+    # --- Internals ---
+
+    def _snapshot(self) -> Dict:
+        """Copies what the worker needs so the UI thread can keep mutating the league."""
+        gm = self.gm
+        teams = [t for t in gm.teams if t.id != "T00"]
+        copies = [Team(id=t.id, name=t.name, color=t.color, roster=list(t.roster),
+                       strategy_settings=copy.deepcopy(t.strategy_settings)) for t in teams]
+        index = {t.id: i for i, t in enumerate(teams)}
+
+        remaining = [(index[g.home_team.id], index[g.away_team.id]) for g in gm.schedule
+                     if not g.played and not str(g.id).startswith("P_")
+                     and g.home_team.id in index and g.away_team.id in index]
+
+        bracket = gm.playoff_bracket()
+        series = [{"id": s["id"], "round": s["round"], "slot": s["slot"], "best_of": s.get("best_of"),
+                   "t1": index.get(s["t1"].id), "t2": index.get(s["t2"].id),
+                   "w1": s["w1"], "w2": s["w2"]} for s in gm.playoff_series]
+        # Seeds fixed once the playoffs start (older saves: rebuilt from round 1)
+        seeds = [index.get(tid) for tid in getattr(gm, "playoff_seeds", [])]
+        if series and not seeds:
+            seeds = [index.get(t.id) if t else None for t in bracket.seeds_from_first_round(gm.playoff_series)]
+
+        return {
+            "teams": copies,
+            "team_ids": [t.id for t in teams],
+            "wins": np.array([t.wins for t in teams], dtype=np.int64),
+            "losses": np.array([t.losses for t in teams], dtype=np.int64),
+            "remaining": remaining,
+            "series": series,
+            "seeds": seeds,
+            "bracket": bracket,
+        }
+
+    def _run_chunk(self, state: Dict, n: int, result: ProjectionResult, rng: np.random.Generator, P):
+        teams = state["teams"]
+        T = len(teams)
+        runs = np.arange(n)
+        bracket: PlayoffBracket = state["bracket"]
+        series = {(s["round"], s["slot"]): s for s in state["series"]}
+
+        # 1. Seeds: from the current bracket, or by simulating the rest of the regular season
+        if state["seeds"]:
+            seeds = np.tile(state["seeds"], (n, 1))
+        else:
+            wins = np.tile(state["wins"], (n, 1))
+            losses = np.tile(state["losses"], (n, 1))
+            remaining = state["remaining"]
+            if remaining:
+                matchups = [(teams[h], teams[a]) for h, a in remaining] * n
+                home_won = BatchMatchEngine.simulate_matchups(matchups, P, rng).home_won.reshape(n, len(remaining))
+                for j, (h, a) in enumerate(remaining):
+                    wins[:, h] += home_won[:, j]
+                    losses[:, a] += home_won[:, j]
+                    wins[:, a] += ~home_won[:, j]
+                    losses[:, h] += ~home_won[:, j]
+
+            # Same ordering as GameManager._start_playoffs: wins, then win%, then league order
+            played = wins + losses
+            pct = np.where(played > 0, wins / np.maximum(played, 1), 0.0)
+            order = np.tile(np.arange(T), (n, 1))
+            seeds = np.array([np.lexsort((order[r], -pct[r], -wins[r]))[:bracket.num_seeds] for r in runs])
+
+        # 2. Play-in decides the last two seeds (PI1: P-1 v P, PI2: P+1 v P+2, PI3: loser PI1 v winner PI2)
+        if bracket.play_in:
+            p = bracket.size
+            pi_len = bracket.best_of(PLAY_IN_ROUND)
+            pi1 = self._play(teams, seeds[:, p - 2], seeds[:, p - 1], series.get((PLAY_IN_ROUND, 0)), pi_len, rng, P)
+            pi2 = self._play(teams, seeds[:, p], seeds[:, p + 1], series.get((PLAY_IN_ROUND, 1)), pi_len, rng, P)
+            pi1_loser = np.where(pi1 == seeds[:, p - 2], seeds[:, p - 1], seeds[:, p - 2])
+            pi3 = self._play(teams, pi1_loser, pi2, series.get((PLAY_IN_ROUND, 2)), pi_len, rng, P)
+            seeds = seeds[:, :p].copy()
+            seeds[:, p - 2] = pi1
+            seeds[:, p - 1] = pi3
+
+        for k in range(bracket.size):
+            np.add.at(result.seed_counts[:, k], seeds[:, k], 1)
+
+        # 3. Bracket rounds (1 v N, ...), winners of slots 2k / 2k+1 meet in slot k
+        order = bracket_order(bracket.size)
+        alive = [seeds[:, seed - 1] for seed in order]
+        for rnd in range(1, bracket.rounds + 1):
+            if rnd == bracket.rounds:
+                np.add.at(result.finals_counts, alive[0], 1)
+                np.add.at(result.finals_counts, alive[1], 1)
+            alive = [self._play(teams, alive[2 * k], alive[2 * k + 1], series.get((rnd, k)),
+                                bracket.best_of(rnd), rng, P)
+                     for k in range(len(alive) // 2)]
+        np.add.at(result.title_counts, alive[0], 1)
+
+    @classmethod
+    def _play(cls, teams: List[Team], t1: np.ndarray, t2: np.ndarray, current: Optional[Dict], best_of: int,
+              rng: np.random.Generator, P) -> np.ndarray:
+        """One bracket slot: continues the real series when it exists (its teams and score), else plays it fresh."""
+        if current is None:
+            return cls._play_series(teams, t1, t2, 0, 0, rng, P, best_of)
+        t1 = np.full(len(t1), current["t1"])
+        t2 = np.full(len(t2), current["t2"])
+        return cls._play_series(teams, t1, t2, current["w1"], current["w2"], rng, P, current["best_of"] or best_of)
+
+    @staticmethod
+    def _play_series(teams: List[Team], t1: np.ndarray, t2: np.ndarray, w1: int, w2: int,
+                     rng: np.random.Generator, P, best_of: int = 7) -> np.ndarray:
+        """
+        Best-of-N from (w1, w2), home court alternating like _schedule_next_playoff_games.
+        Playing every remaining game and taking the majority gives the same winner as
+        stopping at the clinching win, and keeps the batch rectangular.
+        """
+        need = best_of // 2 + 1
+        if w1 >= need: return t1
+        if w2 >= need: return t2
+        game_nums = list(range(w1 + w2 + 1, best_of + 1))
+        matchups = []
+        for a, b in zip(t1.tolist(), t2.tolist()):
+            for g in game_nums:
+                matchups.append((teams[a], teams[b]) if g % 2 else (teams[b], teams[a]))
+        home_won = BatchMatchEngine.simulate_matchups(matchups, P, rng).home_won.reshape(len(t1), len(game_nums))
+        t1_home = np.array([g % 2 == 1 for g in game_nums])
+        t1_wins = np.where(t1_home, home_won, ~home_won).sum(axis=1)
+        return np.where(w1 + t1_wins >= need, t1, t2)
@@ -6,6 +6,8 @@ from typing import Dict, Any, List
 from models.player import Player
 from models.team import Team
 from models.game import Game
+from .league_format import LeagueFormat
+from .data_loader import DataLoader
 
 class SaveManager:
     def __init__(self, save_dir: str = None):
@@ -56,6 +58,8 @@ class SaveManager:
             "version": "1.0",
             "current_date": game_manager.current_date,
             "current_day": game_manager.current_day,
+            "season_year": getattr(game_manager, "season_year", 2025),
+            "league_seed": getattr(game_manager, "league_seed", None),
             "salary_cap": game_manager.salary_cap,
             "user_team_id": game_manager.user_team_id,
             "players": [p.to_dict() for p in game_manager.players],
@@ -73,10 +77,15 @@ class SaveManager:
                     "w1": s.get("w1", 0),
                     "w2": s.get("w2", 0),
                     "round": s.get("round", 1),
+                    "slot": s.get("slot"),
+                    "best_of": s.get("best_of"),
                     "winner_id": s["winner"].id if s.get("winner") and hasattr(s["winner"], "id") else None
                 }
                 for s in game_manager.playoff_series
             ],
+            "playoff_seeds": getattr(game_manager, "playoff_seeds", []),
+            "league_format": game_manager.league_format.to_dict() if hasattr(game_manager, "league_format") else None,
+            "season_phase": game_manager.phases.phase if hasattr(game_manager, "phases") else None,
             "league_history": game_manager.league_history,
             
             # --- Draft State Persistence ---
@@ -163,6 +172,8 @@ class SaveManager:
             # Restore Global State
             game_manager.current_date = data.get("current_date", "2023-10-01")
             game_manager.current_day = data.get("current_day", 1)
+            game_manager.season_year = data.get("season_year", getattr(game_manager, "season_year", 2025))
+            game_manager.league_seed = data.get("league_seed") or getattr(game_manager, "league_seed", None)
             game_manager.salary_cap = data.get("salary_cap", 5000)
             game_manager.user_team_id = data.get("user_team_id", "")
             game_manager.scouting_points = data.get("scouting_points", 50)
@@ -170,26 +181,6 @@ class SaveManager:
             game_manager.league_history = data.get("league_history", [])
             game_manager.league_history = data.get("league_history", [])
             
-            # Restore Playoff Series
-            game_manager.playoff_series = []
-            for s_data in data.get("playoff_series", []):
-                t1 = game_manager.get_team(s_data.get("t1_id"))
-                t2 = game_manager.get_team(s_data.get("t2_id"))
-                winner = game_manager.get_team(s_data.get("winner_id")) if s_data.get("winner_id") else None
-                
-                # Only restore if teams found (safety)
-                if t1 and t2:
-                    series = {
-                        "id": s_data.get("id"),
-                        "t1": t1,
-                        "t2": t2,
-                        "w1": s_data.get("w1", 0),
-                        "w2": s_data.get("w2", 0),
-                        "round": s_data.get("round", 1),
-                        "winner": winner
-                    }
-                    game_manager.playoff_series.append(series)
-            
             # Gamification
             game_manager.gm_score = data.get("gm_score", 0)
             game_manager.achievements = data.get("achievements", {})
@@ -206,21 +197,55 @@ class SaveManager:
             # Restore Draft Class
             game_manager.draft_class = []
             for p_data in data.get("draft_class", []):
-                player = Player.from_dict(p_data)
+                player = Player.from_dict(p_data, rng=DataLoader.potential_rng(p_data, game_manager.rng_for))
                 game_manager.draft_class.append(player)
 
             # Restore Players
             game_manager.players = []
             for p_data in data.get("players", []):
-                player = Player.from_dict(p_data)
+                player = Player.from_dict(p_data, rng=DataLoader.potential_rng(p_data, game_manager.rng_for))
                 game_manager.players.append(player)
 
-            # Restore Teams
+            # Restore Teams (players grouped by team once instead of a full scan per team)
+            by_team = {}
+            for player in game_manager.players:
+                by_team.setdefault(player.team_id, []).append(player)
             game_manager.teams = []
             for t_data in data.get("teams", []):
-                # We need global players list to link roster
-                team = Team.from_dict(t_data, game_manager.players)
+                team = Team.from_dict(t_data, by_team.get(t_data.get("id", ""), []))
                 game_manager.teams.append(team)
+            game_manager.index.rebuild(game_manager.teams, game_manager.players, [])
+
+            # Restore League Format (older saves: default format)
+            game_manager.league_format = LeagueFormat.from_dict(data.get("league_format"))
+
+            # Restore Playoff Series
+            game_manager.playoff_series = []
+            game_manager.playoff_seeds = data.get("playoff_seeds", [])
+            slots = {} # round -> next slot, for series saved before brackets had slots
+            for s_data in data.get("playoff_series", []):
+                t1 = game_manager.get_team(s_data.get("t1_id"))
+                t2 = game_manager.get_team(s_data.get("t2_id"))
+                winner = game_manager.get_team(s_data.get("winner_id")) if s_data.get("winner_id") else None
+                
+                # Only restore if teams found (safety)
+                if t1 and t2:
+                    series = {
+                        "id": s_data.get("id"),
+                        "t1": t1,
+                        "t2": t2,
+                        "w1": s_data.get("w1", 0),
+                        "w2": s_data.get("w2", 0),
+                        "round": s_data.get("round", 1),
+                        "winner": winner
+                    }
+                    series["slot"] = s_data.get("slot")
+                    if series["slot"] is None:
+                        series["slot"] = slots.get(series["round"], 0)
+                    slots[series["round"]] = series["slot"] + 1
+                    if s_data.get("best_of"):
+                        series["best_of"] = s_data["best_of"]
+                    game_manager.playoff_series.append(series)
 
             # Restore Schedule
             # Need to link Team objects to Game objects
@@ -239,9 +264,15 @@ class SaveManager:
                         home_team=home_team,
                         away_team=away_team,
                         played=g_data.get("played", False),
-                        result=g_data.get("result", {})
+                        result=g_data.get("result", {}),
+                        home_score=g_data.get("home_score", 0),
+                        away_score=g_data.get("away_score", 0)
                     )
-                    game_manager.schedule.append(game)
+                    game_manager.add_game(game)
+            game_manager._recalc_total_days()
+
+            # Season Phase (older saves: inferred from playoff / draft state)
+            game_manager.phases.set_phase(data.get("season_phase") or game_manager._infer_phase())
             
             print(f"Game loaded from {loaded_path}")
             return True, "Success"
@@ -0,0 +1,69 @@
+from contextlib import contextmanager
+
+# When GameManager.autosave() actually writes slot 1
+MODE_EVERY_N_DAYS = "every_n_days" # Default: day ends (every N days), user actions, phase changes, app pause
+MODE_PHASE_CHANGE = "phase_change" # Phase changes and app pause only
+MODE_ON_PAUSE = "on_pause"         # App pause/close only
+MODE_EXPLICIT = "explicit"         # Never automatically (headless runs); save_game / flush only
+
+# What asked for the save
+TRIGGER_CHANGE = "change" # State mutation (sign, release, trade, draft pick, scouting, GM score...)
+TRIGGER_DAY = "day"       # End of play_day
+TRIGGER_PHASE = "phase"   # Season phase transitions (controllers.season_phases)
+TRIGGER_PAUSE = "pause"   # App backgrounded / closed
+
+_SAVES_ON = {
+    MODE_EVERY_N_DAYS: {TRIGGER_CHANGE, TRIGGER_DAY, TRIGGER_PHASE, TRIGGER_PAUSE},
+    MODE_PHASE_CHANGE: {TRIGGER_PHASE, TRIGGER_PAUSE},
+    MODE_ON_PAUSE: {TRIGGER_PAUSE},
+    MODE_EXPLICIT: set(),
+}
+
+
+class SavePolicy:
+    """
+    Decides when automatic saves happen. Every autosave request marks the league
+    dirty; the policy then says whether this trigger writes now. Inside deferred()
+    nothing is written until the block ends, which flushes once if anything changed
+    (Simulate Season = one save instead of one per day).
+    """
+
+    def __init__(self, mode: str = MODE_EVERY_N_DAYS, every_n_days: int = 1):
+        if mode not in _SAVES_ON:
+            raise ValueError(f"Unknown save mode: {mode}")
+        self.mode = mode
+        self.every_n_days = max(1, every_n_days)
+        self.dirty = False
+        self.days_since_save = 0
+        self._deferred = 0 # Nesting depth of deferred()
+        self._phase_pending = False # A phase change happened inside a deferred block
+
+    def request(self, trigger: str) -> bool:
+        """Records a change; True if the caller should save now."""
+        self.dirty = True
+        if trigger == TRIGGER_DAY:
+            self.days_since_save += 1
+        allowed = trigger in _SAVES_ON[self.mode]
+        if self._deferred:
+            self._phase_pending |= allowed and trigger == TRIGGER_PHASE
+            return False
+        if trigger == TRIGGER_DAY:
+            # A phase change inside play_day is saved at the end of that day
+            return self._phase_pending or (allowed and self.days_since_save >= self.every_n_days)
+        return allowed
+
+    def saved(self):
+        self.dirty = False
+        self.days_since_save = 0
+        self._phase_pending = False
+
+    @contextmanager
+    def deferred(self, flush=None):
+        """Suspends automatic saves; on exit calls flush() once if the league is dirty."""
+        self._deferred += 1
+        try:
+            yield self
+        finally:
+            self._deferred -= 1
+            if flush and not self._deferred and self.dirty and self.mode != MODE_EXPLICIT:
+                flush()
@@ -0,0 +1,154 @@
+import random
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Sequence
+
+from models.team import Team
+
+
+@dataclass(frozen=True)
+class ScheduleConfig:
+    """Regular-season shape for Scheduler."""
+    rounds: int = 6                        # Full round robins (every pair meets this many times)
+    games_per_team: Optional[int] = None   # Stop once every team has this many games (e.g. 82); None = all rounds
+    max_consecutive_days: Optional[int] = None # Back-to-back limit: league-wide rest day after this many game days in a row
+    rest_days_between_rounds: int = 0      # Off days after each full round robin (breaks)
+
+
+class ScheduledGame(NamedTuple):
+    day: int
+    home: Team
+    away: Team
+
+
+class Scheduler:
+    """
+    Round-robin schedule via the circle method: n teams (plus a bye when n is odd)
+    give n-1 (or n) matchdays per round in which every team plays at most once.
+    Each round reshuffles the circle, so the order of opponents changes.
+    Home court: repeat meetings of a pair alternate, and the leftover single meetings
+    are oriented along an Euler circuit, so every team ends within one game of an
+    even home/away split. Linear in the number of games (30 teams x 82 games is
+    ~1,200 games, a few ms).
+    """
+
+    def __init__(self, config: ScheduleConfig = None):
+        self.config = config or ScheduleConfig()
+
+    @staticmethod
+    def circle_rounds(teams: Sequence[Team]) -> List[List[tuple]]:
+        """One round robin: matchdays of (a, b) pairs; the team paired with the bye sits out."""
+        arr = list(teams)
+        if len(arr) % 2:
+            arr.append(None) # Bye
+        n = len(arr)
+        days = []
+        for _ in range(n - 1):
+            pairs = []
+            for i in range(n // 2):
+                a, b = arr[i], arr[n - 1 - i]
+                if a is not None and b is not None:
+                    pairs.append((a, b))
+            days.append(pairs)
+            # Rotate everything but the first slot
+            arr = [arr[0], arr[-1]] + arr[1:-1]
+        return days
+
+    def generate(self, teams: Sequence[Team], rng: random.Random = None) -> List[ScheduledGame]:
+        """
+        Games in day order. Day numbers start at 1 and may skip rest days.
+        With games_per_team, odd-sized leagues can leave a team one game short.
+        """
+        cfg = self.config
+        rng = rng or random.Random()
+        teams = list(teams)
+        if len(teams) < 2:
+            return []
+
+        target = cfg.games_per_team
+        played: Dict[str, int] = {t.id: 0 for t in teams}
+        slots = [] # (day, a, b), unoriented
+        day = 0
+        streak = 0 # Consecutive game days so far
+        rounds = cfg.rounds if target is None else max(cfg.rounds, -(-target // (len(teams) - 1)))
+
+        for r in range(rounds):
+            order = teams[:]
+            rng.shuffle(order)
+            matchdays = self.circle_rounds(order)
+            rng.shuffle(matchdays)
+
+            for pairs in matchdays:
+                if target is not None:
+                    pairs = [(a, b) for a, b in pairs if played[a.id] < target and played[b.id] < target]
+                if not pairs:
+                    continue
+
+                if cfg.max_consecutive_days and streak >= cfg.max_consecutive_days:
+                    day += 1 # Rest day
+                    streak = 0
+                day += 1
+                streak += 1
+                for a, b in pairs:
+                    played[a.id] += 1
+                    played[b.id] += 1
+                    slots.append((day, a, b))
+
+            if target is not None and all(v >= target for v in played.values()):
+                break
+            if cfg.rest_days_between_rounds and r < rounds - 1:
+                day += cfg.rest_days_between_rounds
+                streak = 0
+
+        home_first = self._orient(slots)
+        return [ScheduledGame(d, a, b) if first else ScheduledGame(d, b, a)
+                for (d, a, b), first in zip(slots, home_first)]
+
+    @staticmethod
+    def _orient(slots) -> List[bool]:
+        """Per slot: True if `a` hosts. Keeps every team's home - away within +-1."""
+        home_first = [True] * len(slots)
+
+        # 1. Repeat meetings of a pair alternate home court (balanced for both teams)
+        meetings: Dict[FrozenSet[str], List[int]] = {}
+        for i, (_, a, b) in enumerate(slots):
+            meetings.setdefault(frozenset((a.id, b.id)), []).append(i)
+        leftover = []
+        for idx in meetings.values():
+            first_team = slots[idx[0]][1].id
+            for j in range(0, len(idx) - 1, 2):
+                for k, i in enumerate(idx[j:j + 2]):
+                    # k == 0 -> first_team hosts, k == 1 -> the other one
+                    home_first[i] = (slots[i][1].id == first_team) == (k == 0)
+            if len(idx) % 2:
+                leftover.append(idx[-1])
+
+        # 2. Single meetings: orient along closed trails (Hierholzer); a dummy vertex
+        #    joined to every odd-degree team makes all degrees even first
+        adj: Dict[str, List[tuple]] = {}
+        for i in leftover:
+            _, a, b = slots[i]
+            adj.setdefault(a.id, []).append((b.id, i))
+            adj.setdefault(b.id, []).append((a.id, i))
+        dummy = -1
+        for tid in [t for t, edges in adj.items() if len(edges) % 2]:
+            adj[tid].append((None, dummy))
+            adj.setdefault(None, []).append((tid, dummy))
+            dummy -= 1
+
+        used = set()
+        for start in list(adj):
+            stack = [start]
+            while stack:
+                v = stack[-1]
+                edges = adj[v]
+                while edges and edges[-1][1] in used:
+                    edges.pop()
+                if not edges:
+                    stack.pop()
+                    continue
+                u, e = edges.pop()
+                used.add(e)
+                if e >= 0:
+                    home_first[e] = slots[e][1].id == v # Walked v -> u: v hosts
+                stack.append(u)
+        return home_first
@@ -0,0 +1,86 @@
+import time
+from typing import Callable, Dict, List, Optional
+
+PHASE_REGULAR_SEASON = "regular_season"
+PHASE_PLAYOFFS = "playoffs"
+PHASE_AWARDS = "awards"             # Champion crowned, season over
+PHASE_PROGRESSION = "progression"   # Aging, retirements, progression, contracts, rookies
+PHASE_DRAFT = "draft"
+PHASE_FREE_AGENCY = "free_agency"   # New schedule is out; AI fills rosters before day 1
+
+# One season; free agency wraps around to the next regular season
+PHASE_ORDER = [PHASE_REGULAR_SEASON, PHASE_PLAYOFFS, PHASE_AWARDS, PHASE_PROGRESSION,
+               PHASE_DRAFT, PHASE_FREE_AGENCY]
+
+Hook = Callable[[], None]
+
+
+class SeasonPhases:
+    """
+    Season state machine. Work that belongs to a phase boundary is registered as
+    an enter hook and runs exactly once per transition; daily work is registered
+    as a day hook and runs only while its phase is current. advance_to() walks the
+    cycle forward through every phase in between, is a no-op when already there,
+    and times each transition (timings: phase -> total seconds in its enter hooks).
+    """
+
+    def __init__(self, phase: str = PHASE_REGULAR_SEASON):
+        self.phase = self._check(phase)
+        self._enter_hooks: Dict[str, List[Hook]] = {p: [] for p in PHASE_ORDER}
+        self._day_hooks: Dict[str, List[Hook]] = {p: [] for p in PHASE_ORDER}
+        self.timings: Dict[str, float] = {p: 0.0 for p in PHASE_ORDER}
+        self.transitions = 0
+        self._advancing = False
+
+    @staticmethod
+    def _check(phase: str) -> str:
+        if phase not in PHASE_ORDER:
+            raise ValueError(f"Unknown season phase: {phase}")
+        return phase
+
+    # --- Registration ---
+
+    def on_enter(self, phase: str, hook: Hook):
+        self._enter_hooks[self._check(phase)].append(hook)
+
+    def on_day(self, phase: str, hook: Hook):
+        self._day_hooks[self._check(phase)].append(hook)
+
+    # --- Transitions ---
+
+    def set_phase(self, phase: str):
+        """Sets the phase without running hooks (loading a save)."""
+        self.phase = self._check(phase)
+
+    def advance_to(self, target: str) -> List[str]:
+        """Enters every phase up to and including target; returns the phases entered."""
+        self._check(target)
+        if self.phase == target or self._advancing:
+            # Already there, or a hook asked for a phase the walk is about to reach
+            return []
+        entered = []
+        self._advancing = True
+        try:
+            while self.phase != target:
+                nxt = self.next_phase()
+                start = time.perf_counter()
+                self.phase = nxt
+                for hook in self._enter_hooks[nxt]:
+                    hook()
+                elapsed = time.perf_counter() - start
+                self.timings[nxt] += elapsed
+                self.transitions += 1
+                entered.append(nxt)
+                print(f"DEBUG: Season phase -> {nxt} ({elapsed * 1000:.1f} ms)")
+        finally:
+            self._advancing = False
+        return entered
+
+    def run_day(self):
+        """Day hooks of the current phase."""
+        for hook in self._day_hooks[self.phase]:
+            hook()
+
+    def next_phase(self, phase: Optional[str] = None) -> str:
+        phase = phase or self.phase
+        return PHASE_ORDER[(PHASE_ORDER.index(phase) + 1) % len(PHASE_ORDER)]
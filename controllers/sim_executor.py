@@ -0,0 +1,76 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from models.player import Player, PlayerAttributes
+from models.team import Team
+from models.match_engine import MatchEngine
+from models.game_result import GameResult
+
+
+# Compact wire format (plain tuples pickle far smaller/faster than dataclasses)
+# player: (id, mask_name, pos, ovr, offense_status, (2pt, 3pt, reb, pass, cons, blk, stl, def))
+# team:   (id, name, strategy_settings, [player, ...])
+# job:    (game_id, home, away, seed, fidelity)
+
+def _pack_player(p: Player) -> Tuple:
+    a = p.attributes
+    return (p.id, p.mask_name, p.pos, p.ovr, p.offense_status,
+            (a.two_pt, a.three_pt, a.rebound, a.passing, a.consistency, a.block, a.steal, a.defense))
+
+
+def _pack_team(t: Team) -> Tuple:
+    return (t.id, t.name, t.strategy_settings, [_pack_player(p) for p in t.roster])
+
+
+def _unpack_team(data: Tuple) -> Team:
+    t_id, name, strategy, players = data
+    roster = []
+    for pid, mask_name, pos, ovr, offense_status, attrs in players:
+        roster.append(Player(
+            id=pid, real_name="", team_id=t_id, pos=pos, salary=0, age=0,
+            attributes=PlayerAttributes(*attrs), mask_name=mask_name, ovr=ovr,
+            offense_status=offense_status
+        ))
+    return Team(id=t_id, name=name, color="", roster=roster, strategy_settings=strategy)
+
+
+def _run_job(job: Tuple) -> Tuple[str, GameResult]:
+    """Worker entry point. Simulates one game without touching any shared state."""
+    game_id, home_data, away_data, seed, fidelity = job
+    rng = random.Random(seed) if seed is not None else None
+    result = MatchEngine.simulate_game(_unpack_team(home_data), _unpack_team(away_data), rng=rng,
+                                       apply=False, fidelity=fidelity)
+    return game_id, result
+
+
+class SimExecutor:
+    """
+    Runs a day's games on a process pool.
+    Games on the same day never share a team, so they can be simulated independently;
+    the caller merges results back (MatchEngine.apply_result) in schedule order.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def simulate_games(self, games: List[Any], seeds: List[Optional[int]],
+                       fidelities: List[str]) -> List[Dict[str, Any]]:
+        """
+        games: Game objects (home_team/away_team); seeds/fidelities: matching per-game values.
+        Returns un-applied results in the same order as `games`.
+        """
+        jobs = [(g.id, _pack_team(g.home_team), _pack_team(g.away_team), seed, fidelity)
+                for g, seed, fidelity in zip(games, seeds, fidelities)]
+        return [result for _, result in self._get_pool().map(_run_job, jobs)]
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
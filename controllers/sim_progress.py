@@ -0,0 +1,24 @@
+from typing import NamedTuple, Optional
+
+# GameManager.simulate_until targets besides a day number or a season phase
+TARGET_USER_GAME = "user_game"   # Stop on the day the user's team plays next
+TARGET_SEASON_END = "season_end" # Stop once the champion is crowned
+
+
+class SimProgress(NamedTuple):
+    """Snapshot handed to simulate_until's progress callback (and yielded by iter_simulation)."""
+    days: int                  # Days simulated so far in this run
+    games: int                 # Games played so far in this run
+    day: int                   # League day now
+    phase: str                 # Season phase now (controllers.season_phases)
+    total_days: Optional[int]  # Estimated days for the whole run; None if unknown
+    done: bool                 # Last report of the run
+
+    @property
+    def fraction(self) -> float:
+        """0..1 for progress bars (estimates can be off, e.g. short playoff series)."""
+        if self.done:
+            return 1.0
+        if not self.total_days:
+            return 0.0
+        return min(1.0, self.days / self.total_days)
@@ -1,9 +1,15 @@
 from typing import List, Tuple, Optional
 from models.player import Player
 from models.team import Team
+from models.sampler import AliasTable
+from models.win_probability import estimate_win_prob
 from .game_manager import GameManager
 
 class TradeManager:
+    # AI trade strategies. Weights: Dump (30%), Fill (40%), Upgrade (30%)
+    AI_TRADE_MODES = ['DUMP', 'FILL', 'UPGRADE']
+    _ai_trade_mode_table = AliasTable([30, 40, 30])
+
     def __init__(self):
         self.gm = GameManager()
 
@@ -191,7 +197,6 @@ class TradeManager:
         val_offer = sum(self.calculate_asset_value(a) for a in team_a_assets)
         val_ask = sum(self.calculate_asset_value(a) for a in team_b_assets)
         
-        # 2. Star Quality Check (The "Penny for a Dollar" Rule)
         # 2. Star Quality Check (The "Penny for a Dollar" Rule)
         # If AI is giving up the best player in the deal, the User must provide a player of comparable tier.
         # Only applies if players are involved.
@@ -202,18 +207,9 @@ class TradeManager:
             best_offer = max(players_offer, key=lambda p: p.ovr)
             best_ask = max(players_ask, key=lambda p: p.ovr)
             
-            ovr_diff = best_ask.ovr - best_offer.ovr
-            
             # If User is downgrading significantly (e.g. trading for a 90 with a 78)
             # Penalty: The total offer value is discounted.
-            if ovr_diff > 4: # Tier Gap
-                 penalty_factor = 1.0
-                 if ovr_diff <= 7: penalty_factor = 0.9  # Mild downgrade (e.g. 85 for 90)
-                 elif ovr_diff <= 10: penalty_factor = 0.7 # Major downgrade (e.g. 80 for 90)
-                 else: penalty_factor = 0.5 # Scrub for Star (e.g. 75 for 90) -> Massive penalty
-                 
-                 val_offer = val_offer * penalty_factor
-                 # print(f"DEBUG: Quality Penalty applied. Diff: {ovr_diff}, Factor: {penalty_factor}")
+            val_offer = val_offer * self._quality_penalty(best_ask.ovr - best_offer.ovr)
 
         # 3. Threshold: AI wants to win the trade value-wise
         # Start at 1.0 (Fair).
@@ -224,6 +220,23 @@ class TradeManager:
         else:
             return False, "AI refuses (Value too low or Quality mismatch)."
 
+    @staticmethod
+    def _quality_penalty(ovr_diff: int) -> float:
+        """Offer multiplier for the OVR gap between the best player asked and offered."""
+        if ovr_diff <= 4: return 1.0   # Same tier
+        if ovr_diff <= 7: return 0.9   # Mild downgrade (e.g. 85 for 90)
+        if ovr_diff <= 10: return 0.7  # Major downgrade (e.g. 80 for 90)
+        return 0.5                     # Scrub for Star (e.g. 75 for 90) -> Massive penalty
+
+    @staticmethod
+    def _upgrade_gain(roster: List[Player], incoming: List[Player], outgoing: List[Player]) -> float:
+        """
+        Win-probability model (models.win_probability): chance the post-trade roster
+        beats the current one on a neutral court (> 0.5 = the trade makes the team better).
+        """
+        after = [p for p in roster if p not in outgoing] + incoming
+        return estimate_win_prob(after, list(roster), neutral=True)
+
     def find_potential_trades(self, user_team: Team, user_assets: List[Player]) -> List[dict]:
         """
         Scans for trades.
@@ -294,13 +307,14 @@ class TradeManager:
         """
         Moves the players and resets tenure/loyalty data.
         """
+        from controllers.game_manager import GameManager
+        gm = GameManager()
+
         # Move A -> B
         for asset in assets_a:
             if isinstance(asset, Player):
                 if asset in team_a.roster:
-                    team_a.roster.remove(asset)
-                    team_b.roster.append(asset)
-                    asset.team_id = team_b.id
+                    gm.move_player(asset, team_b) # Keeps the league index in sync
                     asset.years_on_team = 0 # Reset Tenure
             elif isinstance(asset, dict): # Pick
                 if asset in team_a.draft_picks:
@@ -311,9 +325,7 @@ class TradeManager:
         for asset in assets_b:
             if isinstance(asset, Player):
                 if asset in team_b.roster:
-                    team_b.roster.remove(asset)
-                    team_a.roster.append(asset)
-                    asset.team_id = team_a.id
+                    gm.move_player(asset, team_a) # Keeps the league index in sync
                     asset.years_on_team = 0 # Reset Tenure
             elif isinstance(asset, dict): # Pick
                 if asset in team_b.draft_picks:
@@ -321,9 +333,7 @@ class TradeManager:
                     team_a.draft_picks.append(asset)
 
         # Persistence Logic (Save Game)
-        from controllers.game_manager import GameManager
-        gm = GameManager()
-        gm.save_game(1)
+        gm.autosave()
 
     def identify_team_needs(self, team: Team) -> dict:
         """
@@ -367,16 +377,18 @@ class TradeManager:
         
         return {'status': status, 'needs': needs, 'surplus': surplus}
 
-    def attempt_ai_trade(self, day_progress: float) -> Optional[str]:
+    def attempt_ai_trade(self, day_progress: float, rng=None) -> Optional[str]:
         """
         Simulates AI-to-AI trade activity using multiple strategies.
+        rng: optional seeded random.Random (see GameManager.rng_for).
         """
         # 1. Trade Chance
         chance = 0.05
         if 0.6 <= day_progress <= 0.85: chance = 0.15
         
         import random
-        if random.random() > chance: return None
+        if rng is None: rng = random
+        if rng.random() > chance: return None
         
         teams_data = {t.id: self.identify_team_needs(t) for t in self.gm.teams if t.id != self.gm.user_team_id}
         buyers = [self.gm.get_team(tid) for tid, data in teams_data.items() if data['status'] == "Buyer"]
@@ -385,20 +397,18 @@ class TradeManager:
         if not buyers or not sellers: return None
         
         # --- Strategy Selection ---
-        modes = ['DUMP', 'FILL', 'UPGRADE']
-        # Weights: Dump (30%), Fill (40%), Upgrade (30%)
-        mode = random.choices(modes, weights=[30, 40, 30])[0]
+        mode = self._ai_trade_mode_table.choice(self.AI_TRADE_MODES, rng)
         
         if mode == 'DUMP':
             # Seller initiates logic (Previous Logic)
-            seller = random.choice(sellers)
+            seller = rng.choice(sellers)
             trade_bait = None
             candidates = [p for p in seller.roster if (p.age >= 30 and p.ovr > 75) or self.calculate_loyalty(p) < 40]
             if not candidates: candidates = [p for p in seller.roster if getattr(p, 'years_left', 1) == 1]
             if not candidates: return None
             
-            trade_bait = random.choice(candidates)
-            buyer = random.choice(buyers)
+            trade_bait = rng.choice(candidates)
+            buyer = rng.choice(buyers)
             
             # Buyer offers Pick
             offer_assets = []
@@ -425,14 +435,14 @@ class TradeManager:
             needy_buyers = [b for b in buyers if teams_data[b.id]['needs']]
             if not needy_buyers: return None
             
-            buyer = random.choice(needy_buyers)
-            needed_pos_group = random.choice(teams_data[buyer.id]['needs']) # 'C', 'G', or 'F'
+            buyer = rng.choice(needy_buyers)
+            needed_pos_group = rng.choice(teams_data[buyer.id]['needs']) # 'C', 'G', or 'F'
             
             # Find Seller with surplus in this group
             matching_sellers = [s for s in sellers if needed_pos_group in teams_data[s.id]['surplus']]
             if not matching_sellers: matching_sellers = sellers # Fallback to any seller
             
-            seller = random.choice(matching_sellers)
+            seller = rng.choice(matching_sellers)
             
             # ID Target: Decent player at that pos
             # If group is 'G', look for PG/SG. 'F' -> SF/PF. 'C' -> C
@@ -467,7 +477,7 @@ class TradeManager:
 
         elif mode == 'UPGRADE':
             # Buyer looks to upgrade a starter
-            buyer = random.choice(buyers)
+            buyer = rng.choice(buyers)
             
             # Find weakest starter
             sorted_roster = sorted(buyer.roster, key=lambda x: x.ovr, reverse=True)
@@ -476,11 +486,12 @@ class TradeManager:
             weakest_starter = min(starters, key=lambda x: x.ovr)
             
             # Target Seller with a better player at same pos
-            seller = random.choice(sellers)
+            seller = rng.choice(sellers)
             upgrades = [p for p in seller.roster if p.pos == weakest_starter.pos and p.ovr > weakest_starter.ovr + 5]
             if not upgrades: return None
             
-            target = max(upgrades, key=lambda x: x.ovr) # Get the best
+            # Get the one that helps the most (fitted win probability, not just OVR)
+            target = max(upgrades, key=lambda x: self._upgrade_gain(buyer.roster, [x], [weakest_starter]))
             
             # Package: Weak Starter + 1st Round + Prospect
             offer_assets = [weakest_starter]
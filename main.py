@@ -1,5 +1,6 @@
 import flet as ft
 from controllers.game_manager import GameManager
+from controllers.save_policy import TRIGGER_PAUSE
 from views.main_layout import MainLayout
 import os
 
@@ -159,6 +160,13 @@ def main(page: ft.Page):
             page.update()
 
         page.on_route_change = route_change
+
+        # App backgrounded / closed: write whatever SavePolicy has been holding back
+        def on_lifecycle(e):
+            if str(getattr(e, "data", "")).lower() in ("pause", "hide", "inactive", "detach"):
+                gm.autosave(TRIGGER_PAUSE)
+
+        page.on_app_lifecycle_state_change = on_lifecycle
         page.go(page.route)
         
     except Exception as e:
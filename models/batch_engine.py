@@ -0,0 +1,370 @@
+from typing import List, Tuple, Dict, Optional, Sequence
+import numpy as np
+
+from .team import Team
+from .match_engine import MatchEngine
+from .sim_params import SimParams, get_sim_params
+from .roster_matrix import RosterMatrix
+from . import possession_kernel as kernel
+
+# Box-score columns tracked by the batch kernel (same keys as MatchEngine box scores)
+STAT_KEYS = ("pts", "reb", "ast", "fgm", "fga", "3pm", "3pa", "2pm", "2pa",
+             "stl", "blk", "to", "oreb", "dreb")
+
+HOME, AWAY = 0, 1
+TICKS = 100
+
+# Backends: NumPy across games per tick, or the per-game possession kernel (Numba-compiled if installed)
+BACKEND_VECTORIZED = "vectorized"
+BACKEND_KERNEL = "kernel"
+DEFAULT_BACKEND = BACKEND_KERNEL if kernel.HAS_NUMBA else BACKEND_VECTORIZED
+
+
+class BatchResult:
+    """
+    Output of BatchMatchEngine. Arrays are indexed [game] or [game, side, slot],
+    where side 0 = home, 1 = away and slot follows `roster_ids[game][side]`.
+    Teams and players are NOT mutated.
+    """
+    def __init__(self, matchups, roster_ids, home_score, away_score, ot_rounds, stats):
+        self.matchups = matchups
+        self.roster_ids = roster_ids
+        self.home_score = home_score
+        self.away_score = away_score
+        self.ot_rounds = ot_rounds
+        self.stats = stats # key -> int array [K, 2, R]
+
+    def __len__(self):
+        return len(self.home_score)
+
+    @property
+    def home_won(self) -> np.ndarray:
+        return self.home_score > self.away_score
+
+    def home_win_rate(self) -> float:
+        return float(self.home_won.mean()) if len(self) else 0.0
+
+    def player_totals(self) -> Dict[str, Dict[str, int]]:
+        """Sums every stat per player id across all games in the batch."""
+        totals: Dict[str, Dict[str, int]] = {}
+        for g, sides in enumerate(self.roster_ids):
+            for side, ids in enumerate(sides):
+                for slot, pid in enumerate(ids):
+                    entry = totals.setdefault(pid, {"games": 0, **{k: 0 for k in STAT_KEYS}})
+                    entry["games"] += 1
+                    for k in STAT_KEYS:
+                        entry[k] += int(self.stats[k][g, side, slot])
+        return totals
+
+
+class BatchMatchEngine:
+    """
+    Vectorized MatchEngine: simulates K independent games per possession tick
+    with NumPy array draws. Follows the probability model of
+    MatchEngine.simulate_possession (usage & fatigue, OVR factor, microwave,
+    hot hand, coach boost, bottom-4 scrub boost, comeback bonus, overtime).
+    Results are statistically equivalent, not draw-for-draw identical.
+    """
+
+    @staticmethod
+    def simulate_replays(home_team: Team, away_team: Team, k: int,
+                         params: SimParams = None, rng: np.random.Generator = None,
+                         matrix: RosterMatrix = None, backend: str = None) -> BatchResult:
+        """K independent replays of the same matchup."""
+        return BatchMatchEngine.simulate_matchups([(home_team, away_team)] * k, params, rng, matrix, backend)
+
+    @staticmethod
+    def simulate_matchups(matchups: Sequence[Tuple[Team, Team]],
+                          params: SimParams = None, rng: np.random.Generator = None,
+                          matrix: RosterMatrix = None, backend: str = None) -> BatchResult:
+        """
+        Simulates every (home, away) pair in `matchups` at once.
+        `matrix` is an up-to-date RosterMatrix covering every rostered player
+        (e.g. GameManager.roster_matrix()); built from the rosters if omitted.
+        `backend` defaults to the JIT kernel when Numba is installed, else the vectorized path.
+        """
+        P = params or get_sim_params()
+        rng = rng if rng is not None else np.random.default_rng()
+        matchups = list(matchups)
+        if matrix is None:
+            matrix = RosterMatrix({p.id: p for h, a in matchups for p in h.roster + a.roster}.values())
+        tables = _BatchTables(matchups, P, matrix)
+        if (backend or DEFAULT_BACKEND) == BACKEND_KERNEL:
+            return _run_kernel(matchups, tables, P, rng)
+        return _run_batch(matchups, tables, P, rng)
+
+
+class _BatchTables:
+    """Per-slot constants and per-tick lineups for a batch of matchups."""
+
+    def __init__(self, matchups: Sequence[Tuple[Team, Team]], P: SimParams, matrix: RosterMatrix):
+        K = len(matchups)
+        R = max([max(len(h.roster), len(a.roster)) for h, a in matchups] or [5])
+        shape = (K, 2, R)
+
+        f = lambda: np.zeros(shape, dtype=np.float64)
+        self.usage = f(); self.ovr_f = f(); self.two_pt = f(); self.three_pt = f()
+        self.passing = f(); self.consistency = f(); self.steal = f(); self.defense = f()
+        self.blk_val = f(); self.reb_off = f(); self.reb_def = f(); self.tendency = f()
+        self.def_penalty = f(); self.v_low = f(); self.boost = f(); self.scrub = f()
+        self.mw_bonus = f(); self.pass_w = f(); self.ast_chance = f()
+        self.is_small = np.zeros(shape, dtype=bool)
+        self.is_big = np.zeros(shape, dtype=bool)
+        self.lineups = np.zeros((K, 2, TICKS, 5), dtype=np.int64)
+        self.roster_ids: List[Tuple[List[str], List[str]]] = []
+
+        # Matchup tables are identical for repeated pairs; build once per pair
+        built: Dict[Tuple[int, int], int] = {}
+
+        # Position multipliers per pos_code, so they can be gathered with the attribute columns
+        self.M = matrix
+        self.blk_mult = np.array([MatchEngine._block_pos_mult(pos) for pos in matrix.pos_names])
+        self.reb_mult = np.array([MatchEngine._reb_pos_mult(pos) for pos in matrix.pos_names])
+        self.small_mask = matrix.pos_mask(["PG", "SG"])
+        self.big_mask = matrix.pos_mask(["C", "PF"])
+
+        for g, (home, away) in enumerate(matchups):
+            key = (id(home), id(away))
+            if key in built:
+                src = built[key]
+                for arr in self._arrays():
+                    arr[g] = arr[src]
+                self.lineups[g] = self.lineups[src]
+                self.roster_ids.append(self.roster_ids[src])
+                continue
+            built[key] = g
+            self._fill_game(g, home, away, P)
+
+    def _arrays(self):
+        return (self.usage, self.ovr_f, self.two_pt, self.three_pt, self.passing, self.consistency,
+                self.steal, self.defense, self.blk_val, self.reb_off, self.reb_def, self.tendency,
+                self.def_penalty, self.v_low, self.boost, self.scrub, self.mw_bonus, self.pass_w,
+                self.ast_chance, self.is_small, self.is_big)
+
+    def _fill_game(self, g, home: Team, away: Team, P: SimParams):
+        if len(home.roster) < 5 or len(away.roster) < 5:
+            raise ValueError("Batch engine requires at least 5 players per roster.")
+
+        boost_map = {}
+        bottoms = set()
+        ids = []
+        for side, team in ((HOME, home), (AWAY, away)):
+            strat = MatchEngine._get_strategy(team)
+            MatchEngine._coach_boosts(team, strat, boost_map)
+            bottoms |= MatchEngine._bottom_4_ids(team)
+
+            opts = strat.get("scoring_options", [])
+            rot = strat.get("rotation_settings", {})
+            tactics = strat.get("tactics", "Balanced")
+
+            M = self.M
+            rows = M.rows([p.id for p in team.roster])
+            n = len(rows)
+            col = lambda name: M.attrs[name][rows].astype(np.float64)
+            two_pt, three_pt, rebound = col("two_pt"), col("three_pt"), col("rebound")
+            passing, consistency, block = col("passing"), col("consistency"), col("block")
+            steal, defense = col("steal"), col("defense")
+            ovr = M.ovr[rows]
+            codes = M.pos_code[rows]
+
+            of = 1.0 + (ovr - P.ovr_baseline) * P.ovr_factor_per_point # P.ovr_factor, vectorized
+            self.ovr_f[g, side, :n] = of
+            self.two_pt[g, side, :n] = two_pt
+            self.three_pt[g, side, :n] = three_pt
+            self.passing[g, side, :n] = passing
+            self.consistency[g, side, :n] = consistency
+            self.steal[g, side, :n] = steal
+            self.defense[g, side, :n] = defense
+            self.blk_val[g, side, :n] = (block * of / P.block_divisor) * self.blk_mult[codes]
+            reb = rebound * of * self.reb_mult[codes]
+            self.reb_off[g, side, :n] = reb
+            self.reb_def[g, side, :n] = reb * 3.0
+            self.def_penalty[g, side, :n] = [MatchEngine._def_penalty(int(o)) for o in ovr]
+            self.v_low[g, side, :n] = np.minimum(P.variance_low + (consistency / 100.0) * P.consistency_floor_bonus,
+                                                 P.variance_high - 0.01)
+            self.mw_bonus[g, side, :n] = (M.offense_status[rows] / 100.0) * P.microwave_max_bonus
+            self.pass_w[g, side, :n] = passing ** 3
+            self.ast_chance[g, side, :n] = (passing ** 2 / P.assist_divisor) * of
+            self.is_small[g, side, :n] = self.small_mask[rows]
+            self.is_big[g, side, :n] = self.big_mask[rows]
+
+            # Strategy-dependent weights stay per player
+            slot_of = {}
+            for r, p in enumerate(team.roster):
+                slot_of[p.id] = r
+                self.usage[g, side, r] = MatchEngine._usage_base_weight(p, opts, rot, tactics, P)
+                self.tendency[g, side, r] = MatchEngine._shot_tendency(p, tactics, P)
+
+            for seg in MatchEngine._rotation_segments(team, strat):
+                self.lineups[g, side, seg.start:seg.end] = [slot_of[p.id] for p in seg.lineup]
+            ids.append([p.id for p in team.roster])
+
+        for side, team in ((HOME, home), (AWAY, away)):
+            for r, p in enumerate(team.roster):
+                self.boost[g, side, r] = boost_map.get(p.id, 0.0)
+                self.scrub[g, side, r] = 1.0 if p.id in bottoms else 0.0
+
+        self.roster_ids.append((ids[0], ids[1]))
+
+
+def _weighted_pick(weights: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """Row-wise inverse-CDF pick. Rows with zero total fall back to uniform."""
+    cum = np.cumsum(weights, axis=1)
+    total = cum[:, -1]
+    n = weights.shape[1]
+    empty = total <= 0
+    if empty.any():
+        cum[empty] = np.arange(1, n + 1)
+        total = np.where(empty, n, total)
+    idx = (cum <= (u * total)[:, None]).sum(axis=1)
+    return np.minimum(idx, n - 1)
+
+
+def _run_batch(matchups, T: _BatchTables, P: SimParams, rng: np.random.Generator) -> BatchResult:
+    K, _, R = T.usage.shape
+    ar = np.arange(K)
+    stats = {k: np.zeros((K, 2, R), dtype=np.int64) for k in STAT_KEYS}
+    fga = stats["fga"]
+    streak = np.zeros((K, 2, R), dtype=np.int64)
+    score = np.zeros((K, 2), dtype=np.int64)
+
+    def possession(o: int, tick: int, active: np.ndarray, comeback: np.ndarray) -> np.ndarray:
+        d = 1 - o
+        off_slots = T.lineups[:, o, tick, :]
+        def_slots = T.lineups[:, d, tick, :]
+
+        # 1. Attacker (usage x fatigue) & matched defender
+        off_fga = np.take_along_axis(fga[:, o, :], off_slots, axis=1)
+        fatigue = np.select([off_fga >= 40, off_fga >= 30, off_fga >= 22], [0.05, 0.20, 0.50], 1.0)
+        w = np.take_along_axis(T.usage[:, o, :], off_slots, axis=1) * fatigue
+        pos = _weighted_pick(w, rng.random(K))
+        a = off_slots[ar, pos]
+        df = def_slots[ar, pos]
+
+        off_f = T.ovr_f[ar, o, a]
+        def_f = T.ovr_f[ar, d, df]
+
+        # 2. Turnover
+        to_chance = (P.base_to_chance
+                     - (T.passing[ar, o, a] * off_f + T.consistency[ar, o, a] * off_f) / P.to_divisor
+                     + (T.steal[ar, d, df] * def_f + T.defense[ar, d, df] * def_f) / P.steal_divisor)
+        is_to = active & (rng.random(K) < to_chance)
+        stl = is_to & (rng.random(K) < P.steal_ratio_of_to)
+        stats["to"][ar[is_to], o, a[is_to]] += 1
+        stats["stl"][ar[stl], d, df[stl]] += 1
+
+        # 3. Shot attempt & block
+        shoot = active & ~is_to
+        fga[ar[shoot], o, a[shoot]] += 1
+        blk_chance = P.base_block_chance + T.blk_val[ar, d, df]
+        blk_chance = blk_chance + np.where(T.is_small[ar, o, a] & T.is_big[ar, d, df], P.big_block_small_bonus, 0.0)
+        blocked = shoot & (rng.random(K) < blk_chance)
+        stats["blk"][ar[blocked], d, df[blocked]] += 1
+        live = shoot & ~blocked
+
+        # 4. Shot type & make probability
+        is3 = rng.random(K) < T.tendency[ar, o, a]
+        a_streak = streak[ar, o, a]
+        a_fga = fga[ar, o, a]
+        shot_val = np.where(is3, T.three_pt[ar, o, a], T.two_pt[ar, o, a]) * off_f
+        shot_val = shot_val + np.where(a_streak >= P.microwave_streak_req, T.mw_bonus[ar, o, a], 0.0)
+        shot_val = shot_val - np.where(a_fga > 25, (a_fga - 25) * 3.0, 0.0)
+        def_val = T.defense[ar, d, df] * def_f * T.def_penalty[ar, o, a]
+        diff = shot_val - def_val
+        diff = np.where(diff < 0, diff * P.defense_impact_factor, diff)
+
+        v_low = T.v_low[ar, o, a]
+        make = (P.base_pct + diff / P.attribute_impact_divisor) * (v_low + (P.variance_high - v_low) * rng.random(K))
+        make = make + np.where(a_streak > 0, np.minimum(a_streak * P.hot_hand_bonus_per_streak, P.hot_hand_cap), 0.0)
+        make = np.where(is3, make * P.three_pt_penalty, make)
+        make = make + T.boost[ar, o, a]
+        make = make + T.scrub[ar, o, a] * np.where(is3, 0.10, 0.20)
+        make = make + np.where(comeback, 0.15, 0.0)
+
+        made = live & (rng.random(K) < make)
+        missed = live & ~made
+        l3 = live & is3
+        m3 = made & is3
+        stats["3pa"][ar[l3], o, a[l3]] += 1
+        stats["2pa"][ar[live & ~is3], o, a[live & ~is3]] += 1
+        stats["3pm"][ar[m3], o, a[m3]] += 1
+        stats["2pm"][ar[made & ~is3], o, a[made & ~is3]] += 1
+        stats["fgm"][ar[made], o, a[made]] += 1
+        streak[ar[made], o, a[made]] += 1
+        streak[ar[missed], o, a[missed]] = 0
+
+        and_one = made & (rng.random(K) < 0.2)
+        pts = np.where(made, np.where(is3, 3, 2), 0) + and_one
+        stats["pts"][ar, o, a] += pts
+
+        # 5. Assist (teammates weighted by passing^3)
+        pw = np.take_along_axis(T.pass_w[:, o, :], off_slots, axis=1)
+        pw[ar, pos] = 0.0
+        no_pass = pw.sum(axis=1) <= 0
+        if no_pass.any():
+            pw[no_pass] = 1.0
+            pw[no_pass, pos[no_pass]] = 0.0
+        passer = off_slots[ar, _weighted_pick(pw, rng.random(K))]
+        ast = made & (rng.random(K) < T.ast_chance[ar, o, passer])
+        stats["ast"][ar[ast], o, passer[ast]] += 1
+
+        # 6. Rebound on a live miss (offense x1, defense x3)
+        rw = np.concatenate([np.take_along_axis(T.reb_off[:, o, :], off_slots, axis=1),
+                             np.take_along_axis(T.reb_def[:, d, :], def_slots, axis=1)], axis=1)
+        ridx = _weighted_pick(rw, rng.random(K))
+        is_oreb = ridx < 5
+        rslot = np.where(is_oreb, off_slots[ar, np.minimum(ridx, 4)], def_slots[ar, np.maximum(ridx - 5, 0)])
+        ro = missed & is_oreb
+        rd = missed & ~is_oreb
+        stats["reb"][ar[ro], o, rslot[ro]] += 1
+        stats["oreb"][ar[ro], o, rslot[ro]] += 1
+        stats["reb"][ar[rd], d, rslot[rd]] += 1
+        stats["dreb"][ar[rd], d, rslot[rd]] += 1
+
+        return pts
+
+    everyone = np.ones(K, dtype=bool)
+    nobody = np.zeros(K, dtype=bool)
+    comeback_h = nobody.copy()
+    comeback_a = nobody.copy()
+
+    for tick in range(TICKS):
+        # Phase 50: Comeback Mode (activate when trailing by > 20, release at <= 10)
+        diff = score[:, HOME] - score[:, AWAY]
+        comeback_h = np.where(diff < -20, True, np.where(diff >= -10, False, comeback_h))
+        comeback_a = np.where(diff > 20, True, np.where(diff <= 10, False, comeback_a))
+
+        score[:, HOME] += possession(HOME, tick, everyone, comeback_h)
+        score[:, AWAY] += possession(AWAY, tick, everyone, comeback_a)
+
+    # Overtime (Phase 48): one possession each with the closing lineup until untied
+    ot_rounds = np.zeros(K, dtype=np.int64)
+    tied = score[:, HOME] == score[:, AWAY]
+    while tied.any():
+        ot_rounds += tied
+        score[:, HOME] += possession(HOME, TICKS - 1, tied, nobody)
+        score[:, AWAY] += possession(AWAY, TICKS - 1, tied, nobody)
+        tied = score[:, HOME] == score[:, AWAY]
+
+    return BatchResult(matchups, T.roster_ids, score[:, HOME].copy(), score[:, AWAY].copy(), ot_rounds, stats)
+
+
+def _run_kernel(matchups, T: _BatchTables, P: SimParams, rng: np.random.Generator) -> BatchResult:
+    K, _, R = T.usage.shape
+    stats = np.zeros((kernel.N_STATS, K, 2, R), dtype=np.int64)
+    score = np.zeros((K, 2), dtype=np.int64)
+    ot_rounds = np.zeros(K, dtype=np.int64)
+    u = kernel.draw_uniforms(rng, K, TICKS)
+    games = np.arange(K)
+    while len(games):
+        kernel.simulate_kernel(T.usage, T.ovr_f, T.two_pt, T.three_pt, T.passing, T.consistency, T.steal,
+                               T.defense, T.blk_val, T.reb_off, T.reb_def, T.tendency, T.def_penalty, T.v_low,
+                               T.boost, T.scrub, T.mw_bonus, T.pass_w, T.ast_chance, T.is_small, T.is_big,
+                               T.lineups, kernel.pack_params(P), u, stats, score, ot_rounds, games)
+        # Marathon overtimes: replay those games with more overtime uniforms
+        games = np.flatnonzero(ot_rounds == kernel.OT_UNFINISHED)
+        if len(games):
+            stats[:, games] = 0
+            u = kernel.extend_uniforms(rng, u)
+    return BatchResult(matchups, T.roster_ids, score[:, HOME].copy(), score[:, AWAY].copy(), ot_rounds,
+                       {k: stats[i] for i, k in enumerate(STAT_KEYS)})
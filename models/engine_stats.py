@@ -0,0 +1,207 @@
+"""
+Opt-in MatchEngine instrumentation: per-phase counters/timers plus per-game
+event rates (turnovers, blocks, shot mix, assists, rebounds, overtime loops,
+hero-ball usage) for tuning game_config.json and profiling the possession loop.
+
+Off by default. When off, MatchEngine gets probe=None: the only cost is a
+few `is not None` checks per possession (within benchmark noise), nothing is
+counted or timed, and seeded results are the same either way.
+Counters are process-local: games played in sim_executor worker processes
+are not included.
+
+    enable_engine_stats()
+    ... play games ...
+    print(get_engine_stats())          # or dump_engine_stats("engine_stats.json")
+"""
+import json
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+# Possession phases, in the order MatchEngine runs them
+PHASE_USAGE = 0         # Attacker pick (usage x fatigue) + matched defender
+PHASE_TURNOVER = 1
+PHASE_BLOCK = 2
+PHASE_SHOT_SELECTION = 3 # 2PT/3PT pick + shot value vs defense
+PHASE_MAKE_MISS = 4      # Variance, modifiers, make roll, points
+PHASE_ASSIST = 5
+PHASE_REBOUND = 6
+PHASE_NAMES = ("usage", "turnover", "block", "shot_selection", "make_miss", "assist", "rebound")
+
+# Box-score totals summed per game (team-level, both sides)
+_TOTAL_KEYS = ("pts", "fga", "fgm", "2pa", "2pm", "3pa", "3pm", "ast", "reb", "oreb", "dreb", "stl", "blk", "to")
+
+# A player taking this share of his team's FGA counts as a hero-ball game
+HERO_BALL_SHARE = 0.40
+
+
+class EngineStats:
+    """Accumulator filled by MatchEngine._run_game while instrumentation is enabled."""
+    __slots__ = ("games", "possessions", "sim_seconds", "phase_calls", "phase_seconds", "totals",
+                 "ot_games", "ot_rounds", "ot_seconds", "max_ot_rounds",
+                 "top_share_sum", "max_top_share", "max_player_fga", "hero_ball_games", "_t")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.games = 0
+        self.possessions = 0
+        self.sim_seconds = 0.0
+        self.phase_calls = [0] * len(PHASE_NAMES)
+        self.phase_seconds = [0.0] * len(PHASE_NAMES)
+        self.totals = dict.fromkeys(_TOTAL_KEYS, 0)
+        self.ot_games = 0
+        self.ot_rounds = 0
+        self.ot_seconds = 0.0
+        self.max_ot_rounds = 0
+        self.top_share_sum = 0.0
+        self.max_top_share = 0.0
+        self.max_player_fga = 0
+        self.hero_ball_games = 0
+        self._t = 0.0
+
+    # --- Hot path (called from simulate_possession) ---
+
+    def start(self):
+        self._t = perf_counter()
+
+    def lap(self, phase: int):
+        """Charges the time since the last start()/lap() to `phase`."""
+        now = perf_counter()
+        self.phase_seconds[phase] += now - self._t
+        self.phase_calls[phase] += 1
+        self._t = now
+
+    # --- Per game ---
+
+    def record_game(self, home_ids: List[str], away_ids: List[str], out: Dict[str, Any], ticks: int,
+                    elapsed: float, ot_elapsed: float):
+        """`out` is MatchEngine._run_game's result dict; `ticks` regulation possessions per side."""
+        stats = out["stats"]
+        ot = out["ot_rounds"]
+        self.games += 1
+        self.possessions += 2 * (ticks + ot)
+        self.sim_seconds += elapsed
+
+        totals = self.totals
+        for pid in home_ids:
+            s = stats[pid]
+            for k in _TOTAL_KEYS:
+                totals[k] += s[k]
+        for pid in away_ids:
+            s = stats[pid]
+            for k in _TOTAL_KEYS:
+                totals[k] += s[k]
+
+        if ot:
+            self.ot_games += 1
+            self.ot_rounds += ot
+            self.ot_seconds += ot_elapsed
+            self.max_ot_rounds = max(self.max_ot_rounds, ot)
+
+        # Hero ball: one player's share of his team's shots
+        for ids in (home_ids, away_ids):
+            fga = [stats[pid]["fga"] for pid in ids]
+            team_fga = sum(fga)
+            if not team_fga:
+                continue
+            top = max(fga)
+            share = top / team_fga
+            self.top_share_sum += share
+            self.max_top_share = max(self.max_top_share, share)
+            self.max_player_fga = max(self.max_player_fga, top)
+            if share >= HERO_BALL_SHARE:
+                self.hero_ball_games += 1
+
+    # --- Report ---
+
+    def to_dict(self) -> Dict[str, Any]:
+        games = self.games or 1
+        t = self.totals
+        makes = t["fgm"]
+        # And-1s are the only points not explained by made field goals
+        and1 = t["pts"] - 2 * t["2pm"] - 3 * t["3pm"]
+        phase_total = sum(self.phase_seconds) or 1.0
+
+        def ratio(a, b):
+            return round(a / b, 4) if b else 0.0
+
+        return {
+            "enabled": is_enabled(),
+            "games": self.games,
+            "possessions": self.possessions,
+            "sim_seconds": round(self.sim_seconds, 4),
+            "games_per_sec": round(self.games / self.sim_seconds, 1) if self.sim_seconds else 0.0,
+            "phases": {
+                name: {
+                    "calls": self.phase_calls[i],
+                    "seconds": round(self.phase_seconds[i], 4),
+                    "us_per_call": round(1e6 * self.phase_seconds[i] / self.phase_calls[i], 3)
+                    if self.phase_calls[i] else 0.0,
+                    "share": round(self.phase_seconds[i] / phase_total, 4),
+                }
+                for i, name in enumerate(PHASE_NAMES)
+            },
+            "per_game": dict({k: round(v / games, 3) for k, v in t.items()},
+                             possessions=round(self.possessions / games, 2),
+                             and1=round(and1 / games, 3)),
+            "rates": {
+                "to_per_possession": ratio(t["to"], self.possessions),
+                "steal_per_to": ratio(t["stl"], t["to"]),
+                "block_per_fga": ratio(t["blk"], t["fga"]),
+                "fg_pct": ratio(makes, t["fga"]),
+                "fg3_pct": ratio(t["3pm"], t["3pa"]),
+                "fg3a_rate": ratio(t["3pa"], t["2pa"] + t["3pa"]),
+                "and1_per_make": ratio(and1, makes),
+                "ast_per_fgm": ratio(t["ast"], makes),
+                "oreb_pct": ratio(t["oreb"], t["reb"]),
+            },
+            "overtime": {
+                "games": self.ot_games,
+                "game_rate": ratio(self.ot_games, self.games),
+                "rounds": self.ot_rounds,
+                "max_rounds": self.max_ot_rounds,
+                "seconds": round(self.ot_seconds, 4),
+            },
+            "hero_ball": {
+                "avg_top_fga_share": ratio(self.top_share_sum, 2 * self.games),
+                "max_top_fga_share": round(self.max_top_share, 4),
+                "max_player_fga": self.max_player_fga,
+                "team_games": self.hero_ball_games,
+                "threshold": HERO_BALL_SHARE,
+            },
+        }
+
+
+_stats = EngineStats()
+_enabled = False
+
+
+def active() -> Optional[EngineStats]:
+    """The accumulator MatchEngine should feed, or None when instrumentation is off."""
+    return _stats if _enabled else None
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def enable_engine_stats(enabled: bool = True):
+    global _enabled
+    _enabled = enabled
+
+
+def reset_engine_stats():
+    _stats.reset()
+
+
+def get_engine_stats() -> Dict[str, Any]:
+    """Counters/timers/rates collected since the last reset, as a JSON-ready dict."""
+    return _stats.to_dict()
+
+
+def dump_engine_stats(path: str) -> Dict[str, Any]:
+    data = get_engine_stats()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4)
+    return data
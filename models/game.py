@@ -2,14 +2,16 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from models.team import Team
 
-@dataclass
+@dataclass(slots=True)
 class Game:
     id: str
     day: int
     home_team: Team
     away_team: Team
     played: bool = False
-    result: Dict[str, Any] = field(default_factory=dict)
+    result: Dict[str, Any] = field(default_factory=dict) # GameResult once simulated (dict when loaded)
+    home_score: int = 0
+    away_score: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -18,5 +20,7 @@ class Game:
             "home_team_id": self.home_team.id,
             "away_team_id": self.away_team.id,
             "played": self.played,
-            "result": self.result
+            "home_score": self.home_score,
+            "away_score": self.away_score,
+            "result": self.result.to_dict() if hasattr(self.result, "to_dict") else self.result
         }
@@ -0,0 +1,126 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Per-player box-score columns, in MatchEngine stats-dict order
+BOX_STATS = ("pts", "reb", "ast", "fgm", "fga", "3pm", "3pa", "2pm", "2pa", "stl", "blk", "to", "oreb", "dreb")
+
+# Single-game record categories (GameManager.check_new_records)
+RECORD_STATS = ("pts", "reb", "ast", "stl", "blk", "3pm")
+
+# Simulation fidelity tiers. Both tiers play the exact same game (same RNG draws);
+# they only differ in what gets reported back.
+FIDELITY_FULL = "full"    # Per-player box scores + MVP (user games, UI)
+FIDELITY_SCORE = "score"  # Final score + season-stat increments + record leaders only
+
+
+@dataclass(slots=True)
+class GameResult:
+    """
+    Result of MatchEngine.simulate_game.
+    Box scores are stored as columns: stats[key][i] belongs to player_ids[i]
+    (home roster first, then away; the first n_home rows are home players).
+    Still readable like the old result dict (result["winner"], result.get("home_box_score"))
+    so code handling results loaded from saves works on both.
+    """
+    home_team: str # Team names (as shown in the UI)
+    away_team: str
+    home_team_id: str
+    away_team_id: str
+    home_score: int = 0
+    away_score: int = 0
+    winner: str = "None"
+    loser: str = "None"
+    mvp: str = "None"
+    ot_rounds: int = 0
+    fidelity: str = FIDELITY_FULL
+    n_home: int = 0
+    player_ids: List[str] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    stats: Dict[str, List[int]] = field(default_factory=dict)
+
+    @classmethod
+    def from_box_score(cls, home_team, away_team, box_score: Dict[str, Dict[str, int]], **kwargs) -> "GameResult":
+        """Columns from MatchEngine's {player_id: stats} dict (rosters give order and names)."""
+        roster = home_team.roster + away_team.roster
+        stats = {k: [box_score[p.id][k] for p in roster] for k in BOX_STATS}
+        return cls(home_team=home_team.name, away_team=away_team.name,
+                   home_team_id=home_team.id, away_team_id=away_team.id,
+                   n_home=len(home_team.roster), player_ids=[p.id for p in roster],
+                   names=[p.mask_name for p in roster], stats=stats, **kwargs)
+
+    # --- Derived ---
+
+    @property
+    def home_won(self) -> bool:
+        return self.home_score > self.away_score
+
+    @property
+    def winner_id(self) -> str:
+        return self.home_team_id if self.home_won else self.away_team_id
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """One player's box-score line in the MatchEngine dict format."""
+        line = {k: col[i] for k, col in self.stats.items()}
+        line["games"] = 1
+        line["name"] = self.names[i]
+        return line
+
+    def rows(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for i, pid in enumerate(self.player_ids):
+            yield pid, self.row(i)
+
+    @property
+    def box_score(self) -> Dict[str, Dict[str, Any]]:
+        return dict(self.rows())
+
+    @property
+    def home_box_score(self) -> List[Dict[str, Any]]:
+        return [self.row(i) for i in range(self.n_home)]
+
+    @property
+    def away_box_score(self) -> List[Dict[str, Any]]:
+        return [self.row(i) for i in range(self.n_home, len(self.player_ids))]
+
+    @property
+    def leaders(self) -> Dict[str, Tuple[Optional[str], int]]:
+        """{stat: (player_id, value)} for RECORD_STATS (first player wins ties)."""
+        out = {}
+        for k in RECORD_STATS:
+            col = self.stats.get(k, [])
+            best_i, best_val = None, 0
+            for i, v in enumerate(col):
+                if v > best_val:
+                    best_i, best_val = i, v
+            out[k] = (self.player_ids[best_i] if best_i is not None else None, best_val)
+        return out
+
+    # --- Dict compatibility & Serialization ---
+
+    _DICT_KEYS = ("home_team", "away_team", "home_score", "away_score", "winner", "loser", "mvp",
+                  "home_box_score", "away_box_score", "box_score", "leaders")
+
+    def __getitem__(self, key: str):
+        if key in GameResult._DICT_KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in GameResult._DICT_KEYS else default
+
+    def __contains__(self, key: str) -> bool:
+        return key in GameResult._DICT_KEYS
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Save-file shape (same as the old result dict): box scores for full games, leaders otherwise."""
+        data = {
+            "home_team": self.home_team, "away_team": self.away_team,
+            "home_score": self.home_score, "away_score": self.away_score,
+            "winner": self.winner, "loser": self.loser,
+        }
+        if self.fidelity == FIDELITY_FULL:
+            data["mvp"] = self.mvp
+            data["home_box_score"] = self.home_box_score
+            data["away_box_score"] = self.away_box_score
+        else:
+            data["leaders"] = self.leaders
+        return data
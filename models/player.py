@@ -1,7 +1,8 @@
+import random
 from dataclasses import dataclass, field
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Iterator, Tuple
 
-@dataclass
+@dataclass(slots=True)
 class PlayerAttributes:
     two_pt: int = 0
     three_pt: int = 0
@@ -25,7 +26,94 @@ class PlayerAttributes:
             defense=data.get("def", 0)
         )
 
-@dataclass
+# Box-score key -> SeasonStats field ("3pm" etc. aren't valid identifiers)
+STAT_FIELDS = {
+    "games": "games", "pts": "pts", "reb": "reb", "ast": "ast",
+    "fgm": "fgm", "fga": "fga", "3pm": "fg3m", "3pa": "fg3a", "2pm": "fg2m", "2pa": "fg2a",
+    "stl": "stl", "blk": "blk", "to": "tov", "oreb": "oreb", "dreb": "dreb",
+}
+
+
+@dataclass(slots=True)
+class SeasonStats:
+    """
+    Fixed-field season totals. Keeps the dict-style API the views use
+    (stats["pts"], stats.get("3pm", 0), items(), copy()) with box-score keys.
+    """
+    games: int = 0
+    pts: int = 0
+    reb: int = 0
+    ast: int = 0
+    fgm: int = 0
+    fga: int = 0
+    fg3m: int = 0
+    fg3a: int = 0
+    fg2m: int = 0
+    fg2a: int = 0
+    stl: int = 0
+    blk: int = 0
+    tov: int = 0
+    oreb: int = 0
+    dreb: int = 0
+
+    def __getitem__(self, key: str):
+        return getattr(self, STAT_FIELDS[key])
+
+    def __setitem__(self, key: str, value):
+        setattr(self, STAT_FIELDS[key], value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in STAT_FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(STAT_FIELDS)
+
+    def get(self, key: str, default=None):
+        attr = STAT_FIELDS.get(key)
+        return getattr(self, attr) if attr else default
+
+    def keys(self):
+        return STAT_FIELDS.keys()
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(key, getattr(self, attr)) for key, attr in STAT_FIELDS.items()]
+
+    def add_box_score(self, s: Dict[str, int]):
+        """Adds one game's box-score line (MatchEngine stats dict)."""
+        self.games += s["games"]
+        self.pts += s["pts"]
+        self.reb += s["reb"]
+        self.ast += s["ast"]
+        self.fgm += s["fgm"]
+        self.fga += s["fga"]
+        self.fg3m += s["3pm"]
+        self.fg3a += s["3pa"]
+        self.fg2m += s["2pm"]
+        self.fg2a += s["2pa"]
+        self.stl += s["stl"]
+        self.blk += s["blk"]
+        self.tov += s["to"]
+        self.oreb += s["oreb"]
+        self.dreb += s["dreb"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, attr) for key, attr in STAT_FIELDS.items()}
+
+    def copy(self) -> Dict[str, Any]:
+        """Plain-dict snapshot (used for history entries, which get extra keys)."""
+        return self.to_dict()
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "SeasonStats":
+        stats = cls()
+        for key, value in (data or {}).items():
+            attr = STAT_FIELDS.get(key)
+            if attr:
+                setattr(stats, attr, value)
+        return stats
+
+
+@dataclass(slots=True)
 class Player:
     id: str
     real_name: str
@@ -40,13 +128,19 @@ class Player:
     # Additional specific attributes from prompt
     number: int = 0 
     contract_length: int = 1
-    stats: Dict[str, float] = field(default_factory=lambda: {"games": 0, "pts": 0, "reb": 0, "ast": 0})
+    stats: SeasonStats = field(default_factory=SeasonStats)
     history: List[Dict[str, Any]] = field(default_factory=list)
     potential: int = 0
     is_scouted: bool = False
     offense_status: int = 0
     years_on_team: int = 0
 
+    # Contract negotiation state (runtime only, not saved).
+    # None = not negotiating yet; GameManager.negotiate_contract fills it in.
+    negotiation_allowed: bool = True
+    negotiation_patience: Optional[int] = None
+    negotiation_max_patience: Optional[int] = None
+
     @staticmethod
     def calculate_ovr(attr: PlayerAttributes) -> int:
         # User Formula:
@@ -76,7 +170,8 @@ class Player:
         return int(round(total))
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]):
+    def from_dict(cls, data: Dict[str, Any], rng: random.Random = None):
+        """`rng` draws a missing potential (defaults to the global `random` module)."""
         attr_data = data.get("attributes", {})
         attributes = PlayerAttributes.from_dict(attr_data)
         
@@ -100,12 +195,13 @@ class Player:
         # Potential logic
         potential = data.get("potential", 0)
         if potential == 0:
-            import random
+            if rng is None:
+                rng = random
             age = data.get("age", 20)
             if age < 25:
-                potential = ovr + random.randint(5, 15)
+                potential = ovr + rng.randint(5, 15)
             elif age < 30:
-                potential = ovr + random.randint(0, 5)
+                potential = ovr + rng.randint(0, 5)
             else:
                 potential = ovr # Old players peaked
             
@@ -124,7 +220,7 @@ class Player:
             attributes=attributes,
             number=data.get("number", 0),
             contract_length=data.get("contract_length", 1),
-            stats=data.get("stats", {"games": 0, "pts": 0, "reb": 0, "ast": 0}),
+            stats=SeasonStats.from_dict(data.get("stats")),
             history=data.get("history", []),
             potential=potential,
             is_scouted=data.get("is_scouted", False),
@@ -144,7 +240,7 @@ class Player:
             "age": self.age,
             "number": self.number,
             "contract_length": self.contract_length,
-            "stats": self.stats,
+            "stats": self.stats.to_dict(),
             "history": self.history,
             "potential": self.potential,
             "is_scouted": self.is_scouted,
@@ -0,0 +1,261 @@
+"""
+Per-game possession loop over the struct-of-arrays batch tables (_BatchTables).
+JIT-compiled with Numba when it is importable (desktop / offline work);
+otherwise the very same function runs as plain Python, so results for a given
+seed are identical on both backends. Randomness is pre-drawn from a NumPy
+Generator (U_PER_POSSESSION uniforms per possession) for the same reason.
+
+Mobile/web builds never import Numba: BatchMatchEngine only picks this kernel
+by default when HAS_NUMBA is True and keeps its vectorized NumPy path otherwise.
+NUMBA_DISABLE_JIT=1 forces the pure-Python path (tests/test_possession_kernel.py).
+"""
+import numpy as np
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError: # Optional dependency (not in requirements.txt / buildozer)
+    numba = None
+    HAS_NUMBA = False
+
+# Same box-score columns (and order) as batch_engine.STAT_KEYS
+S_PTS, S_REB, S_AST, S_FGM, S_FGA, S_3PM, S_3PA, S_2PM, S_2PA, S_STL, S_BLK, S_TO, S_OREB, S_DREB = range(14)
+N_STATS = 14
+
+# Uniform draws per possession
+U_ATTACKER, U_TO, U_STEAL, U_BLOCK, U_IS3, U_VARIANCE, U_MAKE, U_AND1, U_PASSER, U_AST, U_REB = range(11)
+U_PER_POSSESSION = 11
+
+# Overtime possessions pre-drawn per game; games that need more are replayed with a longer buffer
+OT_POSSESSIONS = 40
+
+# ot_rounds value for a game that ran out of overtime uniforms (see extend_uniforms)
+OT_UNFINISHED = -1
+
+# SimParams packed into a float vector (numba can't take the dataclass)
+(P_BASE_TO, P_TO_DIV, P_STEAL_DIV, P_STEAL_RATIO, P_BASE_BLK, P_BIG_SMALL, P_MW_REQ, P_DEF_IMPACT,
+ P_ATTR_DIV, P_BASE_PCT, P_VAR_HIGH, P_HOT_PER, P_HOT_CAP, P_3PT_PEN) = range(14)
+
+
+def _jit(fn):
+    return numba.njit(cache=True)(fn) if HAS_NUMBA else fn
+
+
+def pack_params(P) -> np.ndarray:
+    return np.array([P.base_to_chance, P.to_divisor, P.steal_divisor, P.steal_ratio_of_to,
+                     P.base_block_chance, P.big_block_small_bonus, P.microwave_streak_req,
+                     P.defense_impact_factor, P.attribute_impact_divisor, P.base_pct, P.variance_high,
+                     P.hot_hand_bonus_per_streak, P.hot_hand_cap, P.three_pt_penalty], dtype=np.float64)
+
+
+def draw_uniforms(rng: np.random.Generator, games: int, ticks: int) -> np.ndarray:
+    """[games, 2 * ticks + OT_POSSESSIONS, U_PER_POSSESSION] uniforms."""
+    return rng.random((games, 2 * ticks + OT_POSSESSIONS, U_PER_POSSESSION))
+
+
+def extend_uniforms(rng: np.random.Generator, u: np.ndarray) -> np.ndarray:
+    """
+    Appends OT_POSSESSIONS fresh overtime possessions to every game. The existing
+    draws are kept, so a replayed game repeats its first overtimes and then goes on
+    with new uniforms instead of recycling old ones.
+    """
+    return np.concatenate([u, rng.random((u.shape[0], OT_POSSESSIONS, U_PER_POSSESSION))], axis=1)
+
+
+@_jit
+def _pick(w, n, u):
+    """Inverse-CDF pick over w[:n] (same rule as batch_engine._weighted_pick)."""
+    total = 0.0
+    for j in range(n):
+        total += w[j]
+    if total <= 0.0:
+        for j in range(n):
+            w[j] = 1.0
+        total = float(n)
+    target = u * total
+    idx = 0
+    cum = 0.0
+    for j in range(n):
+        cum += w[j]
+        if cum <= target:
+            idx += 1
+    return min(idx, n - 1)
+
+
+@_jit
+def _possession(g, o, tick, comeback, uu, usage, ovr_f, two_pt, three_pt, passing, consistency, steal,
+                defense, blk_val, reb_off, reb_def, tendency, def_penalty, v_low, boost, scrub, mw_bonus,
+                pass_w, ast_chance, is_small, is_big, lineups, pv, stats, streak, w5, w10):
+    """One possession for side `o` of game `g`; returns points scored."""
+    d = 1 - o
+
+    # 1. Attacker (usage x fatigue) & matched defender
+    for j in range(5):
+        s = lineups[g, o, tick, j]
+        f = stats[S_FGA, g, o, s]
+        fatigue = 1.0
+        if f >= 40:
+            fatigue = 0.05
+        elif f >= 30:
+            fatigue = 0.20
+        elif f >= 22:
+            fatigue = 0.50
+        w5[j] = usage[g, o, s] * fatigue
+    pos = _pick(w5, 5, uu[U_ATTACKER])
+    a = lineups[g, o, tick, pos]
+    df = lineups[g, d, tick, pos]
+    off_f = ovr_f[g, o, a]
+    def_f = ovr_f[g, d, df]
+
+    # 2. Turnover
+    to_chance = (pv[P_BASE_TO]
+                 - (passing[g, o, a] * off_f + consistency[g, o, a] * off_f) / pv[P_TO_DIV]
+                 + (steal[g, d, df] * def_f + defense[g, d, df] * def_f) / pv[P_STEAL_DIV])
+    if uu[U_TO] < to_chance:
+        stats[S_TO, g, o, a] += 1
+        if uu[U_STEAL] < pv[P_STEAL_RATIO]:
+            stats[S_STL, g, d, df] += 1
+        return 0
+
+    # 3. Shot attempt & block
+    stats[S_FGA, g, o, a] += 1
+    blk_chance = pv[P_BASE_BLK] + blk_val[g, d, df]
+    if is_small[g, o, a] and is_big[g, d, df]:
+        blk_chance += pv[P_BIG_SMALL]
+    if uu[U_BLOCK] < blk_chance:
+        stats[S_BLK, g, d, df] += 1
+        return 0
+
+    # 4. Shot type & make probability
+    is3 = uu[U_IS3] < tendency[g, o, a]
+    a_streak = streak[o, a]
+    a_fga = stats[S_FGA, g, o, a]
+    shot_val = (three_pt[g, o, a] if is3 else two_pt[g, o, a]) * off_f
+    if a_streak >= pv[P_MW_REQ]:
+        shot_val += mw_bonus[g, o, a]
+    if a_fga > 25:
+        shot_val -= (a_fga - 25) * 3.0
+    def_val = defense[g, d, df] * def_f * def_penalty[g, o, a]
+    diff = shot_val - def_val
+    if diff < 0:
+        diff *= pv[P_DEF_IMPACT]
+
+    lo = v_low[g, o, a]
+    make = (pv[P_BASE_PCT] + diff / pv[P_ATTR_DIV]) * (lo + (pv[P_VAR_HIGH] - lo) * uu[U_VARIANCE])
+    if a_streak > 0:
+        make += min(a_streak * pv[P_HOT_PER], pv[P_HOT_CAP])
+    if is3:
+        make *= pv[P_3PT_PEN]
+    make += boost[g, o, a]
+    make += scrub[g, o, a] * (0.10 if is3 else 0.20)
+    if comeback:
+        make += 0.15
+
+    if is3:
+        stats[S_3PA, g, o, a] += 1
+    else:
+        stats[S_2PA, g, o, a] += 1
+
+    if uu[U_MAKE] < make:
+        stats[S_FGM, g, o, a] += 1
+        streak[o, a] += 1
+        if is3:
+            stats[S_3PM, g, o, a] += 1
+            pts = 3
+        else:
+            stats[S_2PM, g, o, a] += 1
+            pts = 2
+        if uu[U_AND1] < 0.2:
+            pts += 1
+        stats[S_PTS, g, o, a] += pts
+
+        # 5. Assist (teammates weighted by passing^3)
+        for j in range(5):
+            w5[j] = 0.0 if j == pos else pass_w[g, o, lineups[g, o, tick, j]]
+        total = 0.0
+        for j in range(5):
+            total += w5[j]
+        if total <= 0.0:
+            for j in range(5):
+                w5[j] = 0.0 if j == pos else 1.0
+        passer = lineups[g, o, tick, _pick(w5, 5, uu[U_PASSER])]
+        if uu[U_AST] < ast_chance[g, o, passer]:
+            stats[S_AST, g, o, passer] += 1
+        return pts
+
+    # 6. Miss -> rebound (offense x1, defense x3)
+    streak[o, a] = 0
+    for j in range(5):
+        w10[j] = reb_off[g, o, lineups[g, o, tick, j]]
+        w10[5 + j] = reb_def[g, d, lineups[g, d, tick, j]]
+    r = _pick(w10, 10, uu[U_REB])
+    if r < 5:
+        s = lineups[g, o, tick, r]
+        stats[S_REB, g, o, s] += 1
+        stats[S_OREB, g, o, s] += 1
+    else:
+        s = lineups[g, d, tick, r - 5]
+        stats[S_REB, g, d, s] += 1
+        stats[S_DREB, g, d, s] += 1
+    return 0
+
+
+@_jit
+def simulate_kernel(usage, ovr_f, two_pt, three_pt, passing, consistency, steal, defense, blk_val,
+                    reb_off, reb_def, tendency, def_penalty, v_low, boost, scrub, mw_bonus, pass_w,
+                    ast_chance, is_small, is_big, lineups, pv, u, stats, score, ot_rounds, games):
+    """
+    Plays the games listed in `games`; fills stats [N_STATS, K, 2, R], score [K, 2] and
+    ot_rounds [K]. A game still tied when u has no overtime uniforms left gets
+    ot_rounds = OT_UNFINISHED: clear its stats, extend_uniforms() and play it again.
+    """
+    R = usage.shape[2]
+    ticks = lineups.shape[2]
+    n_ot = (u.shape[1] - 2 * ticks) // 2
+    w5 = np.zeros(5)
+    w10 = np.zeros(10)
+    for g in games:
+        streak = np.zeros((2, R), dtype=np.int64)
+        home = 0
+        away = 0
+        comeback_h = False
+        comeback_a = False
+
+        for tick in range(ticks):
+            # Phase 50: Comeback Mode (activate when trailing by > 20, release at <= 10)
+            diff = home - away
+            if diff < -20:
+                comeback_h = True
+            elif diff >= -10:
+                comeback_h = False
+            if diff > 20:
+                comeback_a = True
+            elif diff <= 10:
+                comeback_a = False
+
+            home += _possession(g, 0, tick, comeback_h, u[g, 2 * tick], usage, ovr_f, two_pt, three_pt,
+                                passing, consistency, steal, defense, blk_val, reb_off, reb_def, tendency,
+                                def_penalty, v_low, boost, scrub, mw_bonus, pass_w, ast_chance, is_small,
+                                is_big, lineups, pv, stats, streak, w5, w10)
+            away += _possession(g, 1, tick, comeback_a, u[g, 2 * tick + 1], usage, ovr_f, two_pt, three_pt,
+                                passing, consistency, steal, defense, blk_val, reb_off, reb_def, tendency,
+                                def_penalty, v_low, boost, scrub, mw_bonus, pass_w, ast_chance, is_small,
+                                is_big, lineups, pv, stats, streak, w5, w10)
+
+        # Overtime (Phase 48): one possession each with the closing lineup until untied
+        ot = 0
+        while home == away and ot < n_ot:
+            base = 2 * ticks + 2 * ot
+            home += _possession(g, 0, ticks - 1, False, u[g, base], usage, ovr_f, two_pt, three_pt,
+                                passing, consistency, steal, defense, blk_val, reb_off, reb_def, tendency,
+                                def_penalty, v_low, boost, scrub, mw_bonus, pass_w, ast_chance, is_small,
+                                is_big, lineups, pv, stats, streak, w5, w10)
+            away += _possession(g, 1, ticks - 1, False, u[g, base + 1], usage, ovr_f, two_pt, three_pt,
+                                passing, consistency, steal, defense, blk_val, reb_off, reb_def, tendency,
+                                def_penalty, v_low, boost, scrub, mw_bonus, pass_w, ast_chance, is_small,
+                                is_big, lineups, pv, stats, streak, w5, w10)
+            ot += 1
+
+        score[g, 0] = home
+        score[g, 1] = away
+        ot_rounds[g] = ot if home != away else OT_UNFINISHED
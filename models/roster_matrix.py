@@ -0,0 +1,118 @@
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+from .player import Player
+
+# PlayerAttributes fields, in column order
+ATTRIBUTE_COLUMNS = ("two_pt", "three_pt", "rebound", "passing", "consistency", "block", "steal", "defense")
+
+# Known position labels (English + Chinese data files). pos_code = index; unknown labels are appended per matrix.
+POSITIONS = ("PG", "SG", "SF", "PF", "C", "G", "F", "後衛", "前鋒", "中鋒", "大前鋒", "控球後衛", "得分後衛")
+
+
+class RosterMatrix:
+    """
+    Struct-of-arrays view of a set of players for vectorized kernels.
+    One contiguous NumPy column per attribute plus ovr, pos_code, offense_status,
+    age and potential; `row_of` / `ids` map between player ids and rows.
+    The Player dataclasses stay the source of truth: edits made here are written
+    back with sync_to_players(), and refresh() re-reads the dataclasses.
+    Season progression (GameManager._handle_progression) still edits the Player objects
+    directly: it is a per-player, RNG-order-dependent loop run once per season, so
+    rebuild the matrix (GameManager.roster_matrix()) after it rather than routing it here.
+    """
+
+    def __init__(self, players: Iterable[Player]):
+        self.players: List[Player] = list(players)
+        self.ids: List[str] = [p.id for p in self.players]
+        self.row_of: Dict[str, int] = {pid: r for r, pid in enumerate(self.ids)}
+        self.pos_names: List[str] = list(POSITIONS)
+        self._pos_index: Dict[str, int] = {name: i for i, name in enumerate(self.pos_names)}
+        self.refresh()
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def refresh(self):
+        """(Re)loads every column from the Player objects."""
+        n = len(self.players)
+        self.attrs: Dict[str, np.ndarray] = {
+            name: np.fromiter((getattr(p.attributes, name) for p in self.players), dtype=np.int32, count=n)
+            for name in ATTRIBUTE_COLUMNS
+        }
+        self.ovr = np.fromiter((p.ovr for p in self.players), dtype=np.int32, count=n)
+        self.pos_code = np.fromiter((self._code(p.pos) for p in self.players), dtype=np.int16, count=n)
+        self.offense_status = np.fromiter((p.offense_status for p in self.players), dtype=np.int32, count=n)
+        self.age = np.fromiter((p.age for p in self.players), dtype=np.int32, count=n)
+        self.potential = np.fromiter((p.potential for p in self.players), dtype=np.int32, count=n)
+        self.dirty = np.zeros(n, dtype=bool)
+
+    def _code(self, pos: str) -> int:
+        code = self._pos_index.get(pos)
+        if code is None:
+            code = self._pos_index[pos] = len(self.pos_names)
+            self.pos_names.append(pos)
+        return code
+
+    # --- Lookups ---
+
+    def column(self, name: str) -> np.ndarray:
+        """Attribute column by PlayerAttributes field name (e.g. "two_pt")."""
+        return self.attrs[name]
+
+    def rows(self, ids: Sequence[str]) -> np.ndarray:
+        """Row indices for a list of player ids (e.g. a roster), usable for fancy indexing."""
+        return np.fromiter((self.row_of[pid] for pid in ids), dtype=np.int64, count=len(ids))
+
+    def pos_mask(self, positions: Iterable[str]) -> np.ndarray:
+        """Boolean mask of rows whose pos is one of `positions`."""
+        codes = [self._pos_index[p] for p in positions if p in self._pos_index]
+        return np.isin(self.pos_code, codes)
+
+    def pos_contains(self, fragment: str) -> np.ndarray:
+        """Boolean mask of rows whose pos label contains `fragment` (mirrors `"F" in pos` checks)."""
+        lookup = np.array([fragment in name for name in self.pos_names], dtype=bool)
+        return lookup[self.pos_code]
+
+    # --- Vectorized model helpers ---
+
+    def calculate_ovr(self, rows: np.ndarray = None) -> np.ndarray:
+        """Vectorized Player.calculate_ovr (same formula, same round-half-even)."""
+        sel = slice(None) if rows is None else rows
+        a = {name: col[sel].astype(np.float64) for name, col in self.attrs.items()}
+        s_max = np.maximum(a["two_pt"], a["three_pt"])
+        s_min = np.minimum(a["two_pt"], a["three_pt"])
+        score_val = (s_max * 0.32) + (s_min * 0.08)
+        def_val = np.maximum(np.maximum(a["steal"], a["block"]), a["defense"]) * 0.40
+        mix_val = ((a["consistency"] + a["defense"]) / 2) * 0.10
+        util_val = np.maximum(a["rebound"], a["passing"]) * 0.10
+        total = score_val + def_val + mix_val + util_val
+        return np.round(total).astype(np.int32)
+
+    # --- Edits & Sync ---
+
+    def set_attribute(self, row: int, name: str, value: int):
+        self.attrs[name][row] = value
+        self.dirty[row] = True
+
+    def update_ovr(self, rows: np.ndarray = None):
+        """Recomputes ovr (all rows, or `rows`) from the attribute columns."""
+        if rows is None:
+            self.ovr[:] = self.calculate_ovr()
+            self.dirty[:] = True
+        else:
+            self.ovr[rows] = self.calculate_ovr(rows)
+            self.dirty[rows] = True
+
+    def sync_to_players(self, only_dirty: bool = True):
+        """Writes attribute / ovr / offense_status columns back to the Player objects."""
+        rows = np.flatnonzero(self.dirty) if only_dirty else range(len(self.players))
+        for r in rows:
+            r = int(r)
+            p = self.players[r]
+            for name in ATTRIBUTE_COLUMNS:
+                setattr(p.attributes, name, int(self.attrs[name][r]))
+            p.ovr = int(self.ovr[r])
+            p.offense_status = int(self.offense_status[r])
+        self.dirty[:] = False
@@ -0,0 +1,84 @@
+import random
+from bisect import bisect
+from itertools import accumulate
+from typing import List, Sequence
+
+
+class CumulativeSampler:
+    """
+    Weighted index sampler: bisect over prebuilt cumulative weights.
+    Consumes exactly one rng.random() per draw and picks the same index as
+    rng.choices(range(n), weights=weights) would, so it can replace choices()
+    without changing seeded results.
+    """
+    __slots__ = ("cum", "total", "hi")
+
+    def __init__(self, weights: Sequence[float]):
+        self.cum = list(accumulate(weights))
+        if not self.cum:
+            raise ValueError("Cannot sample from empty weights")
+        self.total = self.cum[-1] + 0.0
+        if self.total <= 0.0:
+            raise ValueError("Total of weights must be greater than zero")
+        self.hi = len(self.cum) - 1
+
+    def __len__(self) -> int:
+        return self.hi + 1
+
+    def sample(self, rng=random) -> int:
+        return bisect(self.cum, rng.random() * self.total, 0, self.hi)
+
+    def choice(self, population: Sequence, rng=random):
+        return population[self.sample(rng)]
+
+
+class AliasTable:
+    """
+    Walker/Vose alias table: O(n) build, O(1) draws (one rng.random() per draw).
+    Best for fixed distributions that are sampled many times (e.g. AI trade modes).
+    Draws are NOT stream-compatible with rng.choices; use CumulativeSampler where
+    seeded results must stay unchanged.
+    """
+    __slots__ = ("prob", "alias", "n")
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        if n == 0:
+            raise ValueError("Cannot sample from empty weights")
+        total = float(sum(weights))
+        if total <= 0.0:
+            raise ValueError("Total of weights must be greater than zero")
+
+        scaled = [w * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, w in enumerate(scaled) if w < 1.0]
+        large = [i for i, w in enumerate(scaled) if w >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        # Leftovers are 1.0 up to rounding error
+
+        self.prob: List[float] = prob
+        self.alias: List[int] = alias
+        self.n = n
+
+    def __len__(self) -> int:
+        return self.n
+
+    def sample(self, rng=random) -> int:
+        # Single uniform: integer part picks the column, fraction is the coin flip
+        u = rng.random() * self.n
+        i = int(u)
+        return i if (u - i) < self.prob[i] else self.alias[i]
+
+    def choice(self, population: Sequence, rng=random):
+        return population[self.sample(rng)]
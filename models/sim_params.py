@@ -0,0 +1,171 @@
+import json
+import os
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
+
+DEFAULT_CONFIG_PATH = "data/game_config.json"
+
+
+def _default_rotation_multipliers() -> Mapping[str, float]:
+    return MappingProxyType({"++": 1.5, "--": 0.3})
+
+
+@dataclass(frozen=True, slots=True)
+class SimParams:
+    """
+    Immutable, flattened view of data/game_config.json.
+    Every tunable used by MatchEngine is a plain attribute so the possession
+    loop never has to do nested dict lookups.
+    Defaults mirror the fallbacks the engine used before the config existed.
+    """
+    # Pace
+    pace_min: int = 95
+    pace_max: int = 105
+    pace_tactic_bonus: int = 8
+
+    # Shooting
+    base_pct: float = 0.45
+    variance_low: float = 0.85
+    variance_high: float = 1.15
+    hot_hand_bonus_per_streak: float = 0.05
+    hot_hand_cap: float = 0.15
+    three_pt_freq: float = 0.4
+    attribute_impact_divisor: float = 350
+    three_pt_penalty: float = 0.72
+
+    # Defense
+    defense_impact_factor: float = 0.8
+    base_block_chance: float = 0.02
+    block_divisor: float = 700
+    big_block_small_bonus: float = 0.05
+    base_to_chance: float = 0.10
+    steal_divisor: float = 800
+    to_divisor: float = 1000
+    steal_ratio_of_to: float = 0.7
+
+    # Playmaking
+    assist_divisor: float = 15000
+    guard_bonus: float = 1.5
+
+    # Usage
+    usage_exponent: float = 3.0
+    usage_weight_2pt: float = 1.5
+    usage_weight_3pt: float = 1.2
+    usage_weight_consistency: float = 0.5
+    option_multipliers: Tuple[float, ...] = (3.5, 2.2, 1.5)
+    rotation_multipliers: Mapping[str, float] = None
+    tactics_bonus: float = 1.3
+
+    # OVR Mechanics (Phase 36)
+    ovr_baseline: float = 85
+    ovr_factor_per_point: float = 0.005
+
+    # Consistency (Phase 37)
+    consistency_floor_bonus: float = 0.15
+
+    # Microwave (Phase 38)
+    microwave_streak_req: int = 2
+    microwave_max_bonus: float = 5.0
+
+    def __post_init__(self):
+        if self.rotation_multipliers is None:
+            object.__setattr__(self, "rotation_multipliers", _default_rotation_multipliers())
+        elif not isinstance(self.rotation_multipliers, MappingProxyType):
+            object.__setattr__(self, "rotation_multipliers", MappingProxyType(dict(self.rotation_multipliers)))
+        object.__setattr__(self, "option_multipliers", tuple(self.option_multipliers))
+
+    def ovr_factor(self, ovr: int) -> float:
+        """Phase 36: Global OVR factor. Each point above/below baseline shifts ability."""
+        return 1.0 + (ovr - self.ovr_baseline) * self.ovr_factor_per_point
+
+    @classmethod
+    def from_config(cls, cfg: Dict[str, Any]) -> "SimParams":
+        """Builds params from the raw (comment-stripped) game_config.json dict."""
+        d = cls()
+
+        def c(section, key, default):
+            return cfg.get(section, {}).get(key, default)
+
+        att_weights = c("usage", "attribute_weights", {"2pt": 1.5, "3pt": 1.2, "consistency": 0.5})
+
+        return cls(
+            pace_min=c("pace", "min", d.pace_min),
+            pace_max=c("pace", "max", d.pace_max),
+            pace_tactic_bonus=c("pace", "tactic_bonus", d.pace_tactic_bonus),
+            base_pct=c("shooting", "base_pct", d.base_pct),
+            variance_low=c("shooting", "variance_low", d.variance_low),
+            variance_high=c("shooting", "variance_high", d.variance_high),
+            hot_hand_bonus_per_streak=c("shooting", "hot_hand_bonus_per_streak", d.hot_hand_bonus_per_streak),
+            hot_hand_cap=c("shooting", "hot_hand_cap", d.hot_hand_cap),
+            three_pt_freq=c("shooting", "three_pt_freq_pg_sg_sf", d.three_pt_freq),
+            attribute_impact_divisor=c("shooting", "attribute_impact_divisor", d.attribute_impact_divisor),
+            three_pt_penalty=c("shooting", "three_pt_penalty", d.three_pt_penalty),
+            defense_impact_factor=c("defense", "defense_impact_factor", d.defense_impact_factor),
+            base_block_chance=c("defense", "base_block_chance", d.base_block_chance),
+            block_divisor=c("defense", "block_divisor", d.block_divisor),
+            big_block_small_bonus=c("defense", "big_block_small_bonus", d.big_block_small_bonus),
+            base_to_chance=c("defense", "base_to_chance", d.base_to_chance),
+            steal_divisor=c("defense", "steal_divisor", d.steal_divisor),
+            to_divisor=c("defense", "to_divisor", d.to_divisor),
+            steal_ratio_of_to=c("defense", "steal_ratio_of_to", d.steal_ratio_of_to),
+            assist_divisor=c("playmaking", "assist_divisor", d.assist_divisor),
+            guard_bonus=c("playmaking", "guard_bonus", d.guard_bonus),
+            usage_exponent=c("usage", "attribute_exponent", d.usage_exponent),
+            usage_weight_2pt=att_weights.get("2pt", 1.5),
+            usage_weight_3pt=att_weights.get("3pt", 1.2),
+            usage_weight_consistency=att_weights.get("consistency", 0.5),
+            option_multipliers=tuple(c("usage", "option_multipliers", d.option_multipliers)),
+            rotation_multipliers=c("usage", "rotation_multipliers", {"++": 1.5, "--": 0.3}),
+            tactics_bonus=c("usage", "tactics_bonus", d.tactics_bonus),
+            ovr_baseline=c("ovr_mechanics", "baseline", d.ovr_baseline),
+            ovr_factor_per_point=c("ovr_mechanics", "factor_per_point", d.ovr_factor_per_point),
+            consistency_floor_bonus=c("consistency", "floor_bonus", d.consistency_floor_bonus),
+            microwave_streak_req=c("microwave", "streak_req", d.microwave_streak_req),
+            microwave_max_bonus=c("microwave", "max_bonus", d.microwave_max_bonus),
+        )
+
+
+def read_config_file(config_path: str = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
+    """Reads game_config.json. Supports // comments. Returns {} if missing or broken."""
+    try:
+        if os.path.exists(config_path):
+            with open(config_path, "r", encoding="utf-8") as f:
+                content = f.read()
+                # Simple comment stripping: Remove lines starting with // or part of line after //
+                clean_lines = []
+                for line in content.splitlines():
+                    if "//" in line:
+                        line = line.split("//")[0]
+                    clean_lines.append(line)
+                return json.loads("\n".join(clean_lines))
+    except Exception as e:
+        print(f"Error loading config: {e}")
+    return {}
+
+
+# Module-level cache: path -> (mtime, SimParams)
+_params_cache: Dict[str, Tuple[float, SimParams]] = {}
+
+
+def get_sim_params(config_path: str = DEFAULT_CONFIG_PATH) -> SimParams:
+    """
+    Returns the compiled SimParams for config_path.
+    The file is only re-read when its mtime changes (cheap os.stat per call).
+    """
+    try:
+        mtime = os.stat(config_path).st_mtime
+    except OSError:
+        mtime = None
+
+    cached = _params_cache.get(config_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    params = SimParams.from_config(read_config_file(config_path)) if mtime is not None else SimParams()
+    _params_cache[config_path] = (mtime, params)
+    return params
+
+
+def clear_sim_params_cache():
+    _params_cache.clear()
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any
 from .player import Player
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     id: str
     name: str
@@ -0,0 +1,169 @@
+import json
+import os
+from collections import Counter
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .player import Player
+from .team import Team
+from .match_engine import MatchEngine
+
+DEFAULT_MODEL_PATH = "data/win_prob_model.json"
+
+# Court-time weighted team averages; the model works on home-minus-away differences
+FEATURES = ("ovr", "two_pt", "three_pt", "rebound", "passing", "consistency", "block", "steal", "defense")
+
+TeamLike = Union[Team, Sequence[Player]]
+
+
+def team_features(team: TeamLike, strategy: Dict[str, Any] = None) -> np.ndarray:
+    """
+    Feature vector for one side: each FEATURES value averaged over the 100-tick
+    rotation segments MatchEngine would use (so ++/-- roles and bench minutes count).
+    """
+    if not isinstance(team, Team):
+        team = Team(id="_wp", name="", color="", roster=list(team))
+    if strategy is None:
+        strategy = MatchEngine._get_strategy(team)
+    if not team.roster:
+        return np.zeros(len(FEATURES))
+
+    ticks = Counter()
+    for seg in MatchEngine._rotation_segments(team, strategy):
+        for p in seg.lineup:
+            ticks[p.id] += seg.end - seg.start
+    total = float(sum(ticks.values()))
+    by_id = {p.id: p for p in team.roster}
+
+    out = np.zeros(len(FEATURES))
+    for pid, n in ticks.items():
+        p = by_id[pid]
+        a = p.attributes
+        out += (n / total) * np.array((p.ovr, a.two_pt, a.three_pt, a.rebound, a.passing,
+                                       a.consistency, a.block, a.steal, a.defense), dtype=np.float64)
+    return out
+
+
+class WinProbabilityModel:
+    """
+    Logistic regression on (home - away) team features, fitted offline against
+    MatchEngine results by tools/fit_win_probability.py.
+    P(home win) = sigmoid(intercept + coef . (f_home - f_away))
+    """
+
+    def __init__(self, coefficients: Sequence[float], intercept: float = 0.0,
+                 scale: Sequence[float] = None, report: Dict[str, Any] = None):
+        self.coef = np.asarray(coefficients, dtype=np.float64)
+        self.intercept = float(intercept)
+        # Features are standardized during the fit; keep the divisors with the coefficients
+        self.scale = np.ones(len(FEATURES)) if scale is None else np.asarray(scale, dtype=np.float64)
+        self.report = report or {}
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_MODEL_PATH) -> "WinProbabilityModel":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if list(data.get("features", [])) != list(FEATURES):
+            raise ValueError(f"{path}: feature list does not match models.win_probability.FEATURES; refit the model")
+        return cls(data["coefficients"], data.get("intercept", 0.0), data.get("scale"), data.get("report"))
+
+    def save(self, path: str = DEFAULT_MODEL_PATH, meta: Dict[str, Any] = None):
+        data = {
+            "features": list(FEATURES),
+            "coefficients": [float(c) for c in self.coef],
+            "intercept": self.intercept,
+            "scale": [float(s) for s in self.scale],
+            "report": self.report,
+        }
+        if meta:
+            data["meta"] = meta
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+
+    def predict_diff(self, diff: np.ndarray, neutral: bool = False) -> np.ndarray:
+        """
+        Home win probability for a [K, F] (or [F]) matrix of home-minus-away features.
+        neutral drops the intercept (home court), so p(a, b) + p(b, a) == 1.
+        """
+        z = (0.0 if neutral else self.intercept) + (np.asarray(diff) / self.scale) @ self.coef
+        return 1.0 / (1.0 + np.exp(-z))
+
+    def estimate(self, home: TeamLike, away: TeamLike,
+                 strategies: Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]] = (None, None),
+                 neutral: bool = False) -> float:
+        diff = team_features(home, strategies[0]) - team_features(away, strategies[1])
+        return float(self.predict_diff(diff, neutral))
+
+    @staticmethod
+    def fit(home_features: np.ndarray, away_features: np.ndarray, home_won: np.ndarray,
+            l2: float = 1e-3, iterations: int = 50) -> "WinProbabilityModel":
+        """Newton / IRLS logistic regression (small L2 penalty, intercept unpenalized)."""
+        diff = np.asarray(home_features, dtype=np.float64) - np.asarray(away_features, dtype=np.float64)
+        y = np.asarray(home_won, dtype=np.float64)
+        scale = diff.std(axis=0)
+        scale[scale == 0] = 1.0
+        X = np.hstack([np.ones((len(diff), 1)), diff / scale])
+
+        w = np.zeros(X.shape[1])
+        penalty = np.full(X.shape[1], l2 * len(y))
+        penalty[0] = 0.0
+        for _ in range(iterations):
+            p = 1.0 / (1.0 + np.exp(-(X @ w)))
+            grad = X.T @ (p - y) + penalty * w
+            hess = (X * (p * (1 - p))[:, None]).T @ X + np.diag(penalty)
+            step = np.linalg.solve(hess, grad)
+            w -= step
+            if np.max(np.abs(step)) < 1e-9:
+                break
+        return WinProbabilityModel(w[1:], w[0], scale)
+
+    def evaluate(self, home_features: np.ndarray, away_features: np.ndarray, home_won: np.ndarray,
+                 bins: int = 10) -> Dict[str, Any]:
+        """Accuracy / log loss / Brier score and a calibration table (predicted vs observed per bin)."""
+        p = self.predict_diff(np.asarray(home_features) - np.asarray(away_features))
+        y = np.asarray(home_won, dtype=np.float64)
+        eps = 1e-12
+        calibration = []
+        edges = np.linspace(0.0, 1.0, bins + 1)
+        for lo, hi in zip(edges[:-1], edges[1:]):
+            mask = (p >= lo) & ((p < hi) if hi < 1.0 else (p <= hi))
+            if mask.any():
+                calibration.append({"bin": f"{lo:.1f}-{hi:.1f}", "games": int(mask.sum()),
+                                    "predicted": float(p[mask].mean()), "observed": float(y[mask].mean())})
+        return {
+            "games": int(len(y)),
+            "accuracy": float(((p >= 0.5) == (y >= 0.5)).mean()),
+            "log_loss": float(-np.mean(y * np.log(p + eps) + (1 - y) * np.log(1 - p + eps))),
+            "brier": float(np.mean((p - y) ** 2)),
+            "base_rate": float(y.mean()),
+            "calibration": calibration,
+        }
+
+
+_default_model: Optional[WinProbabilityModel] = None
+
+
+def get_win_prob_model(path: str = DEFAULT_MODEL_PATH) -> WinProbabilityModel:
+    """Shipped coefficients (loaded once). Falls back to an OVR-only model if the file is missing."""
+    global _default_model
+    if _default_model is None:
+        if os.path.exists(path):
+            _default_model = WinProbabilityModel.load(path)
+        else:
+            print(f"Warning: {path} not found, using OVR-only win probability.")
+            coef = np.zeros(len(FEATURES))
+            coef[0] = 0.15 # ~ +3.7% per OVR point of court-time-weighted gap
+            _default_model = WinProbabilityModel(coef)
+    return _default_model
+
+
+def estimate_win_prob(home_lineup: TeamLike, away_lineup: TeamLike,
+                      strategies: Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]] = (None, None),
+                      neutral: bool = False) -> float:
+    """
+    Fast P(home wins) without running MatchEngine.
+    home_lineup / away_lineup: a Team or a list of Players; strategies default to each team's strategy_settings.
+    neutral: no home court (e.g. comparing two versions of one roster).
+    """
+    return get_win_prob_model().estimate(home_lineup, away_lineup, strategies, neutral)
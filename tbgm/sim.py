@@ -0,0 +1,258 @@
+"""
+Headless multi-season league simulation (balance testing / load test).
+
+Loads the template (or a save slot) and plays N complete seasons without the UI,
+walking the season phases (controllers.season_phases): regular season, playoffs,
+awards, progression (retirements, progression, contracts, rookies), auto draft
+for every team, then AI free agency until every roster is full. There is no user
+team: the template's user team is run by the AI like the rest. Saving is explicit-only (SavePolicy);
+nothing is written unless --save-slot is given.
+
+Reports per-season timings, seasons/minute, memory growth, time spent in phase
+transitions and a league summary (champion, MVP, scoring, shooting, parity).
+
+Usage:
+  python -m tbgm.sim --seasons 10
+  python -m tbgm.sim --seasons 20 --seed 7 -o sim_report.json
+  python -m tbgm.sim --load-slot 1 --save-dir game_saves --seasons 3 --save-slot 9
+  python -m tbgm.sim --seasons 5 --engine-stats engine_stats.json --tracemalloc
+  python -m tbgm.sim --seasons 2 --league-format nba.json   # {"teams": 30, "games_per_team": 82, "playoff_teams": 16, ...}
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, Optional
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from controllers.data_loader import DataLoader
+from controllers.game_manager import GameManager
+from controllers.save_manager import SaveManager
+from controllers.save_policy import SavePolicy, MODE_EXPLICIT
+from controllers.season_phases import PHASE_DRAFT, PHASE_PLAYOFFS
+from controllers.sim_progress import TARGET_SEASON_END
+from models import engine_stats
+from utils.crypto_utils import CryptoUtils
+
+DATA_PATH = "data/gamedata.json"
+
+# Playoff days are open-ended (series go to 7); stop runaway seasons instead of hanging
+MAX_PLAYOFF_DAYS = 100
+
+
+@contextlib.contextmanager
+def _quiet(enabled: bool = True):
+    """GameManager prints a lot of DEBUG lines; swallow them unless --verbose."""
+    if not enabled:
+        yield
+        return
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def _rss_mb() -> Optional[float]:
+    """Peak resident set size in MB (None where the resource module is unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024 # bytes on macOS, KB on Linux
+
+
+def _heap_mb() -> Optional[float]:
+    return tracemalloc.get_traced_memory()[0] / (1024 * 1024) if tracemalloc.is_tracing() else None
+
+
+def load_league(template: str, seed: Optional[int], save_dir: Optional[str], load_slot: Optional[int],
+                league_format: Optional[dict] = None) -> GameManager:
+    """
+    Fresh GameManager from the template, or from a save slot when load_slot is given.
+    league_format overrides the template's "league_format" block (see controllers.league_format).
+    The user team is cleared so the AI manages (renews, signs for) every team.
+    """
+    GameManager._instance = None
+    gm = GameManager()
+    gm.save_policy = SavePolicy(MODE_EXPLICIT)
+    if save_dir:
+        gm.save_manager = SaveManager(save_dir) # initialize() keeps an existing save dir
+    raw = DataLoader(template).load_data()
+    if seed is not None:
+        raw["league_seed"] = seed
+    if league_format is not None:
+        raw["league_format"] = league_format
+    gm.initialize(template, raw_data_override=raw)
+    # Encryption key lives with the saves, not in the working directory
+    CryptoUtils.use_key_file(os.path.join(gm.save_manager.save_dir, CryptoUtils.KEY_FILE))
+    if load_slot is not None:
+        ok, msg = gm.load_game(load_slot)
+        if not ok:
+            raise SystemExit(f"Could not load slot {load_slot}: {msg}")
+    gm.user_team_id = ""
+    return gm
+
+
+def _season_over(gm: GameManager) -> bool:
+    return gm.playoff_champion() is not None
+
+
+def play_season(gm: GameManager) -> Dict[str, float]:
+    """Regular season + playoffs from wherever the league currently is."""
+    start = time.perf_counter()
+    gm.simulate_until(PHASE_PLAYOFFS)
+    regular = time.perf_counter() - start
+
+    start = time.perf_counter()
+    progress = gm.simulate_until(TARGET_SEASON_END, max_days=MAX_PLAYOFF_DAYS)
+    if not _season_over(gm):
+        raise RuntimeError(f"Season {gm.season_year}: playoffs unfinished after {progress.days} days")
+    return {"regular_sec": regular, "playoffs_sec": time.perf_counter() - start, "playoff_days": progress.days}
+
+
+def play_offseason(gm: GameManager) -> Dict[str, float]:
+    """Aging/progression/contracts/rookies, auto draft, AI free agency until rosters are full."""
+    start = time.perf_counter()
+    gm.advance_phase(PHASE_DRAFT) # Progression, then draft order
+    while gm.is_draft_active: # The last pick enters free agency (stat reset, new schedule, AI signings)
+        gm.resolve_draft_pick()
+    gm.fill_ai_rosters()
+    return {"offseason_sec": time.perf_counter() - start}
+
+
+def league_summary(gm: GameManager) -> Dict[str, Any]:
+    """Season-end league stats (call before the offseason resets records and stats)."""
+    teams = [t for t in gm.teams if t.id != "T00"]
+    players = [p for p in gm.players if p.team_id != "T00"]
+    games = sum(t.wins for t in teams)
+    totals = {k: sum(p.stats.get(k, 0) for p in players) for k in ("pts", "ast", "reb", "fga", "fgm", "3pa", "3pm")}
+    team_games = 2 * games or 1
+
+    scorers = [(p.stats["pts"] / p.stats["games"], p) for p in players if p.stats.get("games", 0) >= 10]
+    top_ppg, top_player = max(scorers, key=lambda x: x[0], default=(0.0, None))
+    win_pcts = [t.wins / max(1, t.wins + t.losses) for t in teams]
+    best = max(teams, key=lambda t: t.wins)
+    history = gm.league_history[-1] if gm.league_history else {}
+
+    return {
+        "year": gm.season_year,
+        "champion": history.get("champion"),
+        "mvp": history.get("mvp"),
+        "fmvp": history.get("fmvp"),
+        "best_record": f"{best.name} {best.wins}-{best.losses}",
+        "ppg": round(totals["pts"] / team_games, 2),
+        "apg": round(totals["ast"] / team_games, 2),
+        "rpg": round(totals["reb"] / team_games, 2),
+        "fg_pct": round(totals["fgm"] / totals["fga"], 4) if totals["fga"] else 0.0,
+        "fg3_pct": round(totals["3pm"] / totals["3pa"], 4) if totals["3pa"] else 0.0,
+        "top_ppg": round(top_ppg, 2),
+        "top_scorer": top_player.mask_name if top_player else None,
+        "win_pct_stdev": round(statistics.pstdev(win_pcts), 4) if win_pcts else 0.0,
+        "avg_ovr": round(statistics.mean(p.ovr for p in players), 2) if players else 0.0,
+        "players": len(gm.players),
+        "free_agents": len(gm.get_team("T00").roster) if gm.get_team("T00") else 0,
+    }
+
+
+def run(args) -> Dict[str, Any]:
+    if args.tracemalloc:
+        tracemalloc.start()
+    if args.engine_stats:
+        engine_stats.reset_engine_stats()
+        engine_stats.enable_engine_stats()
+
+    with _quiet(not args.verbose):
+        league_format = None
+        if args.league_format:
+            with open(args.league_format, encoding="utf-8") as f:
+                league_format = json.load(f)
+        gm = load_league(args.template, args.seed, args.save_dir, args.load_slot, league_format)
+        if args.workers:
+            gm.enable_parallel_sim(args.workers)
+
+    mem_start = {"rss_mb": _rss_mb(), "heap_mb": _heap_mb()}
+    seasons = []
+    start = time.perf_counter()
+    try:
+        for n in range(args.seasons):
+            season_start = time.perf_counter()
+            with _quiet(not args.verbose):
+                timings = play_season(gm)
+                summary = league_summary(gm)
+                timings.update(play_offseason(gm))
+            summary.update({k: round(v, 3) for k, v in timings.items()})
+            summary["season_sec"] = round(time.perf_counter() - season_start, 3)
+            summary["rss_mb"] = _rss_mb()
+            summary["heap_mb"] = _heap_mb()
+            seasons.append(summary)
+            print(f"[{n + 1}/{args.seasons}] {summary['year']}: champion {summary['champion']}, "
+                  f"MVP {summary['mvp']}, {summary['ppg']} ppg, {summary['season_sec']:.1f}s", file=sys.stderr)
+    finally:
+        gm.disable_parallel_sim()
+    elapsed = time.perf_counter() - start
+
+    if args.save_slot is not None:
+        with _quiet(not args.verbose):
+            gm.save_game(args.save_slot)
+
+    def growth(key):
+        first, last = mem_start[key], seasons[-1][key] if seasons else None
+        return round(last - first, 2) if first is not None and last is not None else None
+
+    report = {
+        "seasons": len(seasons),
+        "elapsed_sec": round(elapsed, 2),
+        "seasons_per_min": round(60.0 * len(seasons) / elapsed, 2) if elapsed else 0.0,
+        "memory": {"start": mem_start, "rss_growth_mb": growth("rss_mb"), "heap_growth_mb": growth("heap_mb")},
+        "phase_transition_sec": {k: round(v, 3) for k, v in gm.phases.timings.items()},
+        "per_season": seasons,
+    }
+    if args.engine_stats:
+        # Worker-process games (--workers) are not counted, see models.engine_stats
+        report["engine_stats"] = engine_stats.dump_engine_stats(args.engine_stats)
+        engine_stats.enable_engine_stats(False)
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Headless multi-season TBGM simulation")
+    parser.add_argument("--seasons", type=int, default=5)
+    parser.add_argument("--template", help=f"league template JSON (default: {DATA_PATH})")
+    parser.add_argument("--seed", type=int, help="league seed (template only; default random)")
+    parser.add_argument("--save-dir", help="save directory (for --load-slot / --save-slot)")
+    parser.add_argument("--load-slot", type=int, help="start from this save slot instead of the template")
+    parser.add_argument("--save-slot", type=int, help="save the final league into this slot")
+    parser.add_argument("--league-format", metavar="PATH", help="league format JSON (teams, games, playoffs)")
+    parser.add_argument("--workers", type=int, default=0, help="simulate each day on a process pool")
+    parser.add_argument("--engine-stats", metavar="PATH", help="dump models.engine_stats JSON here")
+    parser.add_argument("--tracemalloc", action="store_true", help="track Python heap growth (slower)")
+    parser.add_argument("-o", "--output", help="write the report JSON here")
+    parser.add_argument("-v", "--verbose", action="store_true", help="keep GameManager debug output")
+    args = parser.parse_args(argv)
+
+    # Paths given on the command line are relative to the caller's cwd, not the repo root
+    for name in ("template", "save_dir", "league_format", "engine_stats", "output"):
+        if getattr(args, name):
+            setattr(args, name, os.path.abspath(getattr(args, name)))
+    args.template = args.template or DATA_PATH
+    os.chdir(ROOT) # data paths are relative to the repo root
+    report = run(args)
+    text = json.dumps(report, indent=4, ensure_ascii=False)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -41,6 +41,7 @@ def test_encryption():
     gm.achievements = {} 
     
     sm = SaveManager(save_dir="tests/test_saves")
+    CryptoUtils.use_key_file("tests/test_saves/secret.key") # Not the repo root
     
     # 2. Save
     print("Saving to slot 99...")
@@ -0,0 +1,72 @@
+import sys
+import os
+import random
+sys.path.append(os.getcwd())
+
+import pytest
+
+from controllers.data_loader import DataLoader
+from models import engine_stats
+from models.match_engine import MatchEngine, FIDELITY_FULL, FIDELITY_SCORE
+
+# Fixed-seed games on the shipped template: (home index, away index, seed) ->
+# (home score, away score, home top scorer's box-score line). Captured from the
+# pre-optimization engine (global random seeded the same way), so any change to the
+# RNG draw order or the possession rules shows up here.
+BOX_KEYS = ("pts", "reb", "ast", "fgm", "fga", "3pm", "3pa", "stl", "blk", "to")
+GOLDEN = {
+    (0, 1, 1000): (104, 90, ("P012", 26, 8, 2, 11, 15, 1, 1, 0, 3, 3)),
+    (2, 3, 1001): (109, 92, ("P031", 23, 0, 6, 8, 15, 5, 11, 1, 1, 0)),
+    (4, 5, 1002): (98, 76, ("P061", 18, 0, 4, 5, 8, 4, 7, 0, 0, 2)),
+    (6, 1, 1003): (95, 112, ("P095", 15, 1, 4, 6, 10, 2, 5, 1, 0, 0)),
+}
+
+
+def _teams():
+    raw = DataLoader("data/gamedata.json").load_data()
+    teams, _ = DataLoader("data/gamedata.json").process_data_into_objects(raw)
+    return teams
+
+
+def _play(home, away, seed, fidelity):
+    teams = _teams()
+    return MatchEngine.simulate_game(teams[home], teams[away], rng=random.Random(seed), apply=False,
+                                     fidelity=fidelity)
+
+
+def _top_line(result):
+    rows = list(result.rows())[:result.n_home]
+    pid, line = max(rows, key=lambda r: (r[1]["pts"], r[0]))
+    return (pid,) + tuple(line[k] for k in BOX_KEYS)
+
+
+@pytest.fixture(params=[False, True], ids=["stats_off", "stats_on"])
+def instrumentation(request):
+    was = engine_stats.is_enabled()
+    engine_stats.reset_engine_stats()
+    engine_stats.enable_engine_stats(request.param)
+    yield request.param
+    engine_stats.enable_engine_stats(was)
+    engine_stats.reset_engine_stats()
+
+
+@pytest.mark.parametrize("fidelity", [FIDELITY_FULL, FIDELITY_SCORE])
+def test_seeded_games_match_golden(instrumentation, fidelity):
+    for (home, away, seed), (home_score, away_score, line) in GOLDEN.items():
+        result = _play(home, away, seed, fidelity)
+        assert (result.home_score, result.away_score) == (home_score, away_score)
+        if fidelity == FIDELITY_FULL:
+            assert _top_line(result) == line
+    # Instrumentation only counts; it never touches the games
+    assert engine_stats.get_engine_stats()["games"] == (len(GOLDEN) if instrumentation else 0)
+
+
+def test_play_by_play_stream_matches_golden():
+    (home, away, seed), (home_score, away_score, line) = next(iter(GOLDEN.items()))
+    teams = _teams()
+    finished = []
+    events = list(MatchEngine.iter_events(teams[home], teams[away], rng=random.Random(seed), apply=False,
+                                          on_finish=finished.append))
+    assert events
+    assert (finished[0].home_score, finished[0].away_score) == (home_score, away_score)
+    assert _top_line(finished[0]) == line
@@ -0,0 +1,61 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from controllers.league_index import LeagueIndex
+from controllers.trade_manager import TradeManager
+from tbgm.sim import load_league, DATA_PATH
+
+
+def _ids(by_key):
+    return {k: id(v) for k, v in by_key.items()}
+
+
+def _assert_index_consistent(gm):
+    fresh = LeagueIndex()
+    fresh.rebuild(gm.teams, gm.players, gm.schedule)
+    assert _ids(gm.index.teams) == _ids(fresh.teams)
+    assert _ids(gm.index.players) == _ids(fresh.players)
+    assert {d: [id(g) for g in gs] for d, gs in gm.index.games_by_day.items() if gs} == \
+        {d: [id(g) for g in gs] for d, gs in fresh.games_by_day.items()}
+    for team in gm.teams:
+        assert gm.index.roster(team.id) is team.roster
+        assert all(p.team_id == team.id and gm.index.has_player(p) for p in team.roster)
+
+
+def test_index_survives_roster_moves(tmp_path):
+    gm = load_league(DATA_PATH, seed=7, save_dir=str(tmp_path), load_slot=None)
+    gm.play_day()
+    teams = [t for t in gm.teams if t.id != "T00"]
+    _assert_index_consistent(gm)
+
+    # Sign
+    fa = min(gm.get_team("T00").roster, key=lambda p: p.salary)
+    fa.salary = 0.0
+    ok, _ = gm.sign_player(fa, teams[0])
+    assert ok and gm.get_player(fa.id) is fa and fa in teams[0].roster
+
+    # Release
+    released = teams[1].roster[-1]
+    gm.release_player(released)
+    assert released in gm.get_team("T00").roster
+
+    # Trade
+    a, b = teams[2].roster[0], teams[3].roster[0]
+    TradeManager().execute_trade(teams[2], [a], teams[3], [b])
+    assert a in teams[3].roster and b in teams[2].roster
+
+    # Retirement
+    veteran = teams[4].roster[0]
+    veteran.age = 45
+    gm._handle_retirements()
+    assert gm.get_player(veteran.id) is None and veteran in gm.retired_players
+
+    # Draft pick
+    gm.init_draft()
+    before = len(gm.players)
+    gm.resolve_draft_pick()
+    rookie = gm.players[-1]
+    assert len(gm.players) == before + 1 and gm.get_player(rookie.id) is rookie
+
+    _assert_index_consistent(gm)
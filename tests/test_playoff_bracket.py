@@ -0,0 +1,82 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from models.team import Team
+from controllers.league_format import LeagueFormat
+from controllers.playoff_bracket import PlayoffBracket, bracket_order
+
+
+def _teams(n):
+    return [Team(id=f"T{i:02d}", name=f"Team {i}", color="") for i in range(1, n + 1)]
+
+
+def _play_out(bracket, seeds, favourite):
+    """Runs the bracket to a champion; favourite(t1, t2) picks every game's winner."""
+    series = bracket.start(seeds)
+    while not bracket.champion(series):
+        for s in series:
+            while not s["winner"]:
+                bracket.record_win(s, favourite(s["t1"], s["t2"]).id)
+        new = bracket.advance(series, seeds)
+        assert new or bracket.champion(series)
+        series += new
+    return series
+
+
+def test_bracket_order():
+    assert bracket_order(2) == [1, 2]
+    assert bracket_order(4) == [1, 4, 2, 3]
+    assert bracket_order(8) == [1, 8, 4, 5, 2, 7, 3, 6]
+    assert sorted(bracket_order(16)) == list(range(1, 17))
+
+
+def test_default_format_matches_top4():
+    seeds = _teams(8)
+    bracket = PlayoffBracket(LeagueFormat(), 8)
+    first = bracket.start(seeds)
+    assert [(s["id"], s["t1"].id, s["t2"].id, s["best_of"]) for s in first] == \
+        [("S1", "T01", "T04", 7), ("S2", "T02", "T03", 7)]
+
+    series = _play_out(bracket, seeds, lambda a, b: a) # Higher seed always wins
+    final = series[-1]
+    assert final["id"] == "F1" and final["round"] == 2
+    assert (final["w1"], final["w2"]) == (4, 0)
+    assert bracket.champion(series).id == "T01"
+
+
+def test_16_team_bracket_with_play_in():
+    teams = _teams(30)
+    fmt = LeagueFormat(playoff_teams=16, series_lengths=(5, 7), play_in=True)
+    bracket = PlayoffBracket(fmt, len(teams))
+    assert (bracket.size, bracket.rounds, bracket.num_seeds) == (16, 4, 18)
+
+    seeds = teams[:bracket.num_seeds]
+    # Lower seed always wins: T16 takes PI1, T18 beats T17 and then T15
+    series = _play_out(bracket, seeds, lambda a, b: b)
+    by_round = {}
+    for s in series:
+        by_round.setdefault(s["round"], []).append(s)
+    assert [len(by_round[r]) for r in range(5)] == [3, 8, 4, 2, 1]
+    assert {s["best_of"] for s in by_round[1]} == {5}
+    assert {s["best_of"] for s in by_round[4]} == {7}
+    assert all(s["best_of"] == 1 for s in by_round[0])
+
+    # PI1 winner (T16) is seed 15, PI3 winner (T18 beat T15) is seed 16
+    first = {s["slot"]: s for s in by_round[1]}
+    assert (first[0]["t1"].id, first[0]["t2"].id) == ("T01", "T18")
+    assert (first[4]["t1"].id, first[4]["t2"].id) == ("T02", "T16")
+    assert len({s["id"] for s in series}) == len(series)
+
+    # Round each team went out in; play-in losers (T15, T17) count as 0
+    out = bracket.elimination_rounds(series)
+    champ = bracket.champion(series)
+    assert out[champ.id] == 5
+    assert sorted(out[t.id] for t in seeds) == [0, 0] + [1] * 8 + [2] * 4 + [3] * 2 + [4] + [5]
+
+
+def test_small_league_shrinks_bracket():
+    fmt = LeagueFormat(playoff_teams=16, play_in=True)
+    bracket = PlayoffBracket(fmt, 6)
+    assert (bracket.size, bracket.rounds, bracket.play_in) == (4, 2, True)
+    assert PlayoffBracket(fmt, 5).play_in is False
@@ -0,0 +1,78 @@
+import sys
+import os
+import json
+import subprocess
+sys.path.append(os.getcwd())
+
+import numpy as np
+import pytest
+
+from controllers.data_loader import DataLoader
+from models import possession_kernel as kernel
+from models.batch_engine import BatchMatchEngine, BACKEND_KERNEL, BACKEND_VECTORIZED
+
+# Script run in both modes: jitted (default) and pure Python (NUMBA_DISABLE_JIT=1)
+SCRIPT = """
+import json, sys
+import numpy as np
+sys.path.insert(0, ".")
+from controllers.data_loader import DataLoader
+from models.batch_engine import BatchMatchEngine, BACKEND_KERNEL
+raw = DataLoader("data/gamedata.json").load_data()
+teams, _ = DataLoader("data/gamedata.json").process_data_into_objects(raw)
+teams = [t for t in teams if len(t.roster) >= 5]
+matchups = [(h, a) for h in teams for a in teams if h is not a]
+res = BatchMatchEngine.simulate_matchups(matchups, rng=np.random.default_rng(2025), backend=BACKEND_KERNEL)
+print(json.dumps({"home": res.home_score.tolist(), "away": res.away_score.tolist(),
+                  "ot": res.ot_rounds.tolist(), "stats": {k: v.tolist() for k, v in res.stats.items()}}))
+"""
+
+
+def _run(disable_jit: bool):
+    env = dict(os.environ)
+    env["NUMBA_DISABLE_JIT"] = "1" if disable_jit else "0"
+    out = subprocess.run([sys.executable, "-c", SCRIPT], env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_kernel_parity_jit_vs_python():
+    pytest.importorskip("numba")
+    jitted = _run(disable_jit=False)
+    python = _run(disable_jit=True)
+    assert jitted["home"] == python["home"]
+    assert jitted["away"] == python["away"]
+    assert jitted["ot"] == python["ot"]
+    assert jitted["stats"] == python["stats"]
+
+
+def _matchups(replays):
+    raw = DataLoader("data/gamedata.json").load_data()
+    teams, _ = DataLoader("data/gamedata.json").process_data_into_objects(raw)
+    teams = [t for t in teams if len(t.roster) >= 5]
+    return [(h, a) for h in teams for a in teams if h is not a] * replays
+
+
+def test_kernel_matches_vectorized_distribution():
+    # Runs as plain Python without numba; same games, independent draws
+    matchups = _matchups(10)
+    vec = BatchMatchEngine.simulate_matchups(matchups, rng=np.random.default_rng(7), backend=BACKEND_VECTORIZED)
+    ker = BatchMatchEngine.simulate_matchups(matchups, rng=np.random.default_rng(7), backend=BACKEND_KERNEL)
+    assert abs(vec.home_score.mean() - ker.home_score.mean()) < 3.0
+    assert abs(vec.away_score.mean() - ker.away_score.mean()) < 3.0
+    assert abs(vec.home_score.std() - ker.home_score.std()) < 3.0
+    assert abs(vec.home_win_rate() - ker.home_win_rate()) < 0.1
+    for k in ("fga", "3pa", "ast", "reb", "to"):
+        v, c = vec.stats[k].sum() / len(matchups), ker.stats[k].sum() / len(matchups)
+        assert abs(v - c) < 0.05 * v, k
+
+
+def test_kernel_overtime_never_recycles_draws(monkeypatch):
+    # One pre-drawn overtime per game: every multi-OT game has to be replayed with fresh draws
+    monkeypatch.setattr(kernel, "OT_POSSESSIONS", 2)
+    res = BatchMatchEngine.simulate_matchups(_matchups(10), rng=np.random.default_rng(3), backend=BACKEND_KERNEL)
+    assert (res.ot_rounds >= 0).all()
+    assert (res.home_score != res.away_score).all()
+    assert res.ot_rounds.max() > 1
+    # Replayed games start from clean box scores
+    assert (res.stats["pts"][:, 0].sum(axis=1) == res.home_score).all()
+    assert (res.stats["pts"][:, 1].sum(axis=1) == res.away_score).all()
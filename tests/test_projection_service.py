@@ -0,0 +1,42 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from controllers import projection_service
+from controllers.projection_service import ProjectionService, CACHE_SIZE
+from tbgm.sim import load_league, DATA_PATH
+
+
+def test_projection_probabilities_and_cache(tmp_path):
+    gm = load_league(DATA_PATH, seed=7, save_dir=str(tmp_path), load_slot=None)
+    gm.simulate_until(gm.current_day + 10)
+    service = ProjectionService(gm, runs=20, chunk_size=10)
+    result = service.project()
+    assert result.complete
+
+    probs = result.probabilities()
+    size = gm.playoff_bracket().size
+    for k in range(1, size + 1):
+        # Every run hands out each seed exactly once
+        assert abs(sum(row[f"seed_{k}"] for row in probs.values()) - 1.0) < 1e-9
+    assert abs(sum(row["title"] for row in probs.values()) - 1.0) < 1e-9
+    assert all(0.0 <= row["playoffs"] <= 1.0 for row in probs.values())
+
+    # Same league state: the finished result comes back from the cache
+    assert service.project() is result
+    assert service.get_cached() is result
+
+
+def test_projection_cache_keeps_latest_days(monkeypatch):
+    monkeypatch.setattr(projection_service, "_cache", type(projection_service._cache)())
+    results = {("2025", day, "h"): object() for day in range(CACHE_SIZE + 2)}
+    for key, result in results.items():
+        projection_service._cache_put(key, result)
+    assert list(projection_service._cache) == list(results)[-CACHE_SIZE:]
+
+    # A hit counts as recent use
+    oldest = list(results)[2]
+    assert projection_service._cache_get(oldest) is results[oldest]
+    projection_service._cache_put(("2025", 99, "h"), object())
+    assert oldest in projection_service._cache
+    assert list(results)[3] not in projection_service._cache
@@ -0,0 +1,82 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+import pytest
+
+from controllers.save_policy import (SavePolicy, MODE_EVERY_N_DAYS, MODE_PHASE_CHANGE, MODE_EXPLICIT,
+                                     TRIGGER_CHANGE, TRIGGER_DAY, TRIGGER_PHASE, TRIGGER_PAUSE)
+from tbgm.sim import load_league, DATA_PATH
+
+
+class _Flush:
+    """Stands in for GameManager.flush_save: counts writes and marks the policy saved."""
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        self.policy.saved()
+
+
+def test_deferred_block_writes_once():
+    policy = SavePolicy()
+    flush = _Flush(policy)
+    with policy.deferred(flush):
+        for trigger in (TRIGGER_CHANGE, TRIGGER_DAY, TRIGGER_PHASE, TRIGGER_DAY):
+            assert policy.request(trigger) is False
+        assert flush.calls == 0
+    assert flush.calls == 1 and not policy.dirty
+
+    with policy.deferred(flush): # Nothing changed: no write
+        pass
+    assert flush.calls == 1
+
+
+def test_nested_deferred_flushes_on_outermost_exit():
+    policy = SavePolicy()
+    flush = _Flush(policy)
+    with policy.deferred(flush):
+        with policy.deferred(flush):
+            policy.request(TRIGGER_CHANGE)
+        assert flush.calls == 0 and policy.dirty
+        policy.request(TRIGGER_DAY)
+    assert flush.calls == 1
+
+
+def test_explicit_mode_never_autosaves():
+    policy = SavePolicy(MODE_EXPLICIT)
+    flush = _Flush(policy)
+    for trigger in (TRIGGER_CHANGE, TRIGGER_DAY, TRIGGER_PHASE, TRIGGER_PAUSE):
+        assert policy.request(trigger) is False
+    with policy.deferred(flush):
+        policy.request(TRIGGER_PHASE)
+    assert flush.calls == 0 and policy.dirty
+
+
+def test_trigger_semantics():
+    policy = SavePolicy(MODE_EVERY_N_DAYS, every_n_days=3)
+    assert [policy.request(TRIGGER_DAY) for _ in range(3)] == [False, False, True]
+    policy.saved()
+    # A phase change inside a deferred day is saved with that day
+    with policy.deferred():
+        policy.request(TRIGGER_PHASE)
+    assert policy.request(TRIGGER_DAY) is True
+
+    phase_only = SavePolicy(MODE_PHASE_CHANGE)
+    assert phase_only.request(TRIGGER_CHANGE) is False
+    assert phase_only.request(TRIGGER_PHASE) is True
+    with pytest.raises(ValueError):
+        SavePolicy("sometimes")
+
+
+def test_simulation_writes_one_save(tmp_path, monkeypatch):
+    gm = load_league(DATA_PATH, seed=7, save_dir=str(tmp_path), load_slot=None)
+    gm.save_policy = SavePolicy() # Default mode: every day would save
+    writes = []
+    save = gm.save_manager.save_game
+    monkeypatch.setattr(gm.save_manager, "save_game", lambda g, slot: writes.append(slot) or save(g, slot))
+    gm.simulate_until(gm.current_day + 5)
+    assert writes == [1]
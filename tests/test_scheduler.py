@@ -0,0 +1,74 @@
+import sys
+import os
+import random
+import time
+from collections import Counter
+sys.path.append(os.getcwd())
+
+from models.team import Team
+from controllers.scheduler import Scheduler, ScheduleConfig
+
+
+def _teams(n):
+    return [Team(id=f"T{i:02d}", name=f"Team {i}", color="") for i in range(1, n + 1)]
+
+
+def _check(games, teams, cfg):
+    # No team plays twice on the same day
+    per_day = Counter()
+    for g in games:
+        assert g.home is not g.away
+        per_day[(g.day, g.home.id)] += 1
+        per_day[(g.day, g.away.id)] += 1
+    assert max(per_day.values()) == 1
+
+    # Back-to-back limit
+    if cfg.max_consecutive_days:
+        days = {}
+        for (day, tid) in per_day:
+            days.setdefault(tid, []).append(day)
+        for tid, ds in days.items():
+            ds.sort()
+            run = 1
+            for prev, cur in zip(ds, ds[1:]):
+                run = run + 1 if cur == prev + 1 else 1
+                assert run <= cfg.max_consecutive_days, tid
+
+    # Every team within one game of an even home/away split
+    home = Counter(g.home.id for g in games)
+    away = Counter(g.away.id for g in games)
+    for t in teams:
+        assert abs(home[t.id] - away[t.id]) <= 1, t.id
+
+
+def test_no_team_plays_twice_per_day_property():
+    rng = random.Random(2025)
+    for _ in range(150):
+        n = rng.randint(2, 31)
+        cfg = ScheduleConfig(rounds=rng.randint(1, 6),
+                             max_consecutive_days=rng.choice([None, 1, 2, 3]),
+                             rest_days_between_rounds=rng.choice([0, 0, 2]))
+        teams = _teams(n)
+        games = Scheduler(cfg).generate(teams, random.Random(rng.random()))
+        _check(games, teams, cfg)
+
+        # Full rounds: every pair meets exactly `rounds` times
+        pairs = Counter(frozenset((g.home.id, g.away.id)) for g in games)
+        assert len(pairs) == n * (n - 1) // 2
+        assert set(pairs.values()) == {cfg.rounds}
+
+
+def test_30_team_82_game_schedule():
+    teams = _teams(30)
+    cfg = ScheduleConfig(games_per_team=82, max_consecutive_days=2)
+    start = time.perf_counter()
+    games = Scheduler(cfg).generate(teams, random.Random(7))
+    elapsed = time.perf_counter() - start
+
+    _check(games, teams, cfg)
+    played = Counter()
+    for g in games:
+        played[g.home.id] += 1
+        played[g.away.id] += 1
+    assert set(played.values()) == {82}
+    assert elapsed < 0.5
@@ -0,0 +1,64 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+import pytest
+
+from controllers.season_phases import (SeasonPhases, PHASE_ORDER, PHASE_REGULAR_SEASON, PHASE_PLAYOFFS,
+                                       PHASE_AWARDS, PHASE_DRAFT, PHASE_FREE_AGENCY)
+from tbgm.sim import load_league, DATA_PATH
+
+
+def _recording():
+    phases = SeasonPhases()
+    log = []
+    for p in PHASE_ORDER:
+        phases.on_enter(p, lambda p=p: log.append(("enter", p)))
+        phases.on_day(p, lambda p=p: log.append(("day", p)))
+    return phases, log
+
+
+def test_advance_runs_each_boundary_once():
+    phases, log = _recording()
+    assert phases.advance_to(PHASE_PLAYOFFS) == [PHASE_PLAYOFFS]
+    assert phases.advance_to(PHASE_PLAYOFFS) == [] # Idempotent
+    assert log == [("enter", PHASE_PLAYOFFS)]
+
+    # Skipping ahead walks through every phase in between
+    assert phases.advance_to(PHASE_DRAFT) == PHASE_ORDER[2:5]
+    assert [p for kind, p in log if kind == "enter"] == PHASE_ORDER[1:5]
+    assert phases.transitions == 4
+
+    # Free agency wraps around to the next regular season
+    phases.advance_to(PHASE_FREE_AGENCY)
+    assert phases.advance_to(PHASE_REGULAR_SEASON) == [PHASE_REGULAR_SEASON]
+    assert all(t >= 0 for t in phases.timings.values())
+
+
+def test_day_hooks_follow_the_phase():
+    phases, log = _recording()
+    phases.run_day()
+    phases.set_phase(PHASE_AWARDS) # No hooks
+    phases.run_day()
+    assert log == [("day", PHASE_REGULAR_SEASON), ("day", PHASE_AWARDS)]
+
+
+def test_unknown_phase():
+    with pytest.raises(ValueError):
+        SeasonPhases("preseason")
+    with pytest.raises(ValueError):
+        SeasonPhases().advance_to("preseason")
+
+
+def test_ai_strategies_follow_roster_moves(tmp_path):
+    gm = load_league(DATA_PATH, seed=7, save_dir=str(tmp_path), load_slot=None)
+    gm.play_day()
+    team = next(t for t in gm.teams if t.id not in (gm.user_team_id, "T00"))
+    star = max(team.roster, key=lambda p: p.ovr)
+    assert team.strategy_settings["scoring_options"][0] == str(star.id)
+
+    gm.release_player(star)
+    gm.play_day() # Day hook refreshes AI tactics and rotations
+    top3 = [str(p.id) for p in sorted(team.roster, key=lambda p: p.ovr, reverse=True)[:3]]
+    assert team.strategy_settings["scoring_options"] == top3
+    assert set(team.strategy_settings["rotation_settings"]) == {str(p.id) for p in team.roster}
@@ -0,0 +1,22 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from controllers.data_loader import DataLoader
+from tbgm.sim import load_league, DATA_PATH
+
+
+def _potentials(seed, save_dir):
+    gm = load_league(DATA_PATH, seed=seed, save_dir=save_dir, load_slot=None)
+    return {p.id: p.potential for p in gm.players}
+
+
+def test_missing_potential_follows_league_seed(tmp_path):
+    raw = DataLoader(DATA_PATH).load_data()
+    missing = {str(p["id"]) for p in raw.get("players") or raw["roster"] if not p.get("potential")}
+    assert missing # The template leaves most potentials to the loader
+
+    first = _potentials(7, str(tmp_path))
+    assert _potentials(7, str(tmp_path)) == first
+    other = _potentials(8, str(tmp_path))
+    assert any(first[pid] != other[pid] for pid in missing)
@@ -0,0 +1,33 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from tbgm.sim import load_league, DATA_PATH
+
+DAYS = 6
+
+
+def _play(save_dir, workers):
+    gm = load_league(DATA_PATH, seed=11, save_dir=save_dir, load_slot=None)
+    gm.user_team_id = "T01" # One full-fidelity game a day next to the score-only ones
+    if workers:
+        gm.enable_parallel_sim(workers)
+    try:
+        results = []
+        for _ in range(DAYS):
+            results += gm.play_day() # GameResult compares every box-score column
+        if workers:
+            assert gm.sim_executor._pool is not None # Games really went through the pool
+    finally:
+        gm.disable_parallel_sim()
+    season = {p.id: p.stats.to_dict() for p in gm.players}
+    records = {t.id: (t.wins, t.losses) for t in gm.teams}
+    return results, season, records
+
+
+def test_process_pool_matches_serial(tmp_path):
+    serial = _play(str(tmp_path), workers=0)
+    pooled = _play(str(tmp_path), workers=2)
+    assert len(serial[0]) >= DAYS
+    assert {r.fidelity for r in serial[0]} == {"full", "score"}
+    assert serial == pooled
@@ -0,0 +1,42 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+import pytest
+
+from controllers.season_phases import PHASE_PLAYOFFS, PHASE_AWARDS
+from controllers.sim_progress import TARGET_USER_GAME, TARGET_SEASON_END
+from tbgm.sim import load_league, DATA_PATH
+
+
+@pytest.fixture
+def gm(tmp_path):
+    return load_league(DATA_PATH, seed=7, save_dir=str(tmp_path), load_slot=None)
+
+
+def test_day_and_user_game_targets(gm):
+    start = gm.current_day
+    last = gm.simulate_until(start + 5)
+    assert gm.current_day == start + 5
+    assert (last.days, last.done, last.fraction) == (5, True, 1.0)
+
+    gm.user_team_id = "T01" # load_league runs every team as AI
+    gm.simulate_until(TARGET_USER_GAME)
+    assert gm._user_plays_on(gm.current_day)
+    assert gm.simulate_until(TARGET_USER_GAME).days == 0 # Already there
+
+    with pytest.raises(ValueError):
+        gm.simulate_until("preseason")
+
+
+def test_season_end_reports_progress(gm):
+    reports = []
+    last = gm.simulate_until(PHASE_PLAYOFFS, on_progress=reports.append, progress_interval=0)
+    assert gm.phases.phase == PHASE_PLAYOFFS
+    assert len(reports) == last.days + 1 and reports[-1] is last
+
+    reports.clear()
+    last = gm.simulate_until(TARGET_SEASON_END, on_progress=reports.append, progress_interval=60)
+    assert gm.phases.phase == PHASE_AWARDS and gm.playoff_champion() is not None
+    # Throttled: the first day and the final report
+    assert len(reports) == 2 and reports[-1].done
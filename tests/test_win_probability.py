@@ -0,0 +1,67 @@
+import sys
+import os
+import copy
+import math
+sys.path.append(os.getcwd())
+
+from controllers.data_loader import DataLoader
+from controllers.trade_manager import TradeManager
+from models.player import Player
+from models.win_probability import WinProbabilityModel, DEFAULT_MODEL_PATH, FEATURES
+
+
+def _teams():
+    raw = DataLoader("data/gamedata.json").load_data()
+    teams, _ = DataLoader("data/gamedata.json").process_data_into_objects(raw)
+    return [t for t in teams if t.id != "T00" and len(t.roster) >= 5]
+
+
+def _boosted(roster, points):
+    out = []
+    for p in roster:
+        q = copy.deepcopy(p)
+        for name in ("two_pt", "three_pt", "rebound", "passing", "consistency", "block", "steal", "defense"):
+            setattr(q.attributes, name, getattr(q.attributes, name) + points)
+        q.ovr = Player.calculate_ovr(q.attributes)
+        out.append(q)
+    return out
+
+
+def _logit(p):
+    return math.log(p / (1 - p))
+
+
+def test_shipped_model_is_symmetric():
+    model = WinProbabilityModel.load(DEFAULT_MODEL_PATH)
+    assert len(model.coef) == len(FEATURES)
+    teams = _teams()
+    for h in teams:
+        for a in teams:
+            if h is a:
+                continue
+            # Only the intercept (home court) separates p(h, a) from 1 - p(a, h)
+            assert abs(_logit(model.estimate(h, a)) + _logit(model.estimate(a, h)) - 2 * model.intercept) < 1e-9
+            assert abs(model.estimate(h, a, neutral=True) + model.estimate(a, h, neutral=True) - 1.0) < 1e-9
+
+
+def test_model_favours_stronger_roster():
+    model = WinProbabilityModel.load(DEFAULT_MODEL_PATH)
+    roster = list(_teams()[0].roster)
+    p = model.estimate(_boosted(roster, 5), roster, neutral=True)
+    assert p > 0.7
+    assert model.estimate(_boosted(roster, 10), roster, neutral=True) > p
+
+
+def test_quality_penalty_is_monotonic():
+    # A bigger OVR downgrade for the AI's best player is never penalized less
+    factors = [TradeManager._quality_penalty(diff) for diff in range(-10, 40)]
+    assert all(a >= b for a, b in zip(factors, factors[1:]))
+    assert factors[0] == 1.0 and factors[-1] == 0.5
+
+
+def test_upgrade_gain_follows_roster_strength():
+    roster = sorted(_teams()[0].roster, key=lambda p: p.ovr, reverse=True)
+    star, scrub = roster[0], roster[-1]
+    # Losing the star for a copy of the scrub makes the team worse, a boosted scrub better
+    assert TradeManager._upgrade_gain(roster, [copy.deepcopy(scrub)], [star]) < 0.5
+    assert TradeManager._upgrade_gain(roster, _boosted([scrub], 15), [scrub]) > 0.5
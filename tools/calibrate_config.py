@@ -0,0 +1,213 @@
+"""
+Auto-calibrates data/game_config.json against target league averages.
+
+Every candidate config is scored by simulating full seasons (each pair of teams
+6 times, like GameManager._generate_schedule) on the vectorized BatchMatchEngine,
+fanned out over a process pool. Loss = sum of squared relative errors vs the targets.
+
+Search:
+  grid    - every combination of --grid-points values per knob
+  random  - --candidates random samples, then --refine rounds of re-sampling
+            in a box shrunk around the best candidate so far
+
+Usage:
+  python tools/calibrate_config.py --ppg 98 --fg3-pct 0.34 --apg 21 --bpg 4.5 --top-ppg 28
+  python tools/calibrate_config.py --ppg 98 --search grid --grid-points 4 --dry-run
+  python tools/calibrate_config.py --ppg 98 --knob shooting.base_pct=0.40:0.50
+"""
+import argparse
+import copy
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from controllers.data_loader import DataLoader
+from models.sim_params import SimParams, read_config_file, DEFAULT_CONFIG_PATH
+from models.batch_engine import BatchMatchEngine
+from models.roster_matrix import RosterMatrix
+
+DATA_PATH = "data/gamedata.json"
+
+# Default search space: "section.key" -> (low, high)
+DEFAULT_KNOBS = {
+    "usage.attribute_exponent": (2.5, 4.5),
+    "playmaking.assist_divisor": (20.0, 120.0),
+    "shooting.attribute_impact_divisor": (200.0, 500.0),
+    "defense.block_divisor": (400.0, 1200.0),
+}
+
+# Target name -> CLI flag help
+METRICS = {
+    "ppg": "team points per game",
+    "fg3_pct": "league 3P% (0-1)",
+    "apg": "team assists per game",
+    "bpg": "team blocks per game",
+    "top_ppg": "best individual PPG",
+}
+
+# Worker state (built once per process)
+_league = None
+
+
+def _init_worker():
+    global _league
+    os.chdir(ROOT)
+    raw = DataLoader(DATA_PATH).load_data()
+    teams, _ = DataLoader(DATA_PATH).process_data_into_objects(raw)
+    teams = [t for t in teams if t.id != "T00" and len(t.roster) >= 5]
+    matchups = [(h, a) for h in teams for a in teams if h is not a] * 3 # 6 meetings per pair
+    matrix = RosterMatrix({p.id: p for t in teams for p in t.roster}.values())
+    _league = (matchups, matrix)
+
+
+def apply_overrides(cfg: Dict, overrides: Dict[str, float]) -> Dict:
+    out = copy.deepcopy(cfg)
+    for path, value in overrides.items():
+        section, key = path.split(".", 1)
+        out.setdefault(section, {})[key] = value
+    return out
+
+
+def evaluate(job: Tuple[Dict, Dict[str, float], int, int]) -> Dict[str, float]:
+    """Worker: league averages for one candidate config (seasons x full schedule)."""
+    base_cfg, overrides, seasons, seed = job
+    matchups, matrix = _league
+    P = SimParams.from_config(apply_overrides(base_cfg, overrides))
+    rng = np.random.default_rng(seed)
+    res = BatchMatchEngine.simulate_matchups(matchups * seasons, P, rng, matrix)
+
+    team_games = 2 * len(res)
+    fg3a = res.stats["3pa"].sum()
+    totals = res.player_totals()
+    top = max((t["pts"] / t["games"] for t in totals.values() if t["games"]), default=0.0)
+    return {
+        "ppg": float((res.home_score.sum() + res.away_score.sum()) / team_games),
+        "fg3_pct": float(res.stats["3pm"].sum() / fg3a) if fg3a else 0.0,
+        "apg": float(res.stats["ast"].sum() / team_games),
+        "bpg": float(res.stats["blk"].sum() / team_games),
+        "top_ppg": float(top),
+    }
+
+
+def loss(metrics: Dict[str, float], targets: Dict[str, float]) -> float:
+    return sum(((metrics[k] - v) / v) ** 2 for k, v in targets.items() if v)
+
+
+def _grid(knobs: Dict[str, Tuple[float, float]], points: int) -> List[Dict[str, float]]:
+    axes = [[lo + (hi - lo) * i / max(1, points - 1) for i in range(points)] for lo, hi in knobs.values()]
+    return [dict(zip(knobs, combo)) for combo in itertools.product(*axes)]
+
+
+def _random(knobs: Dict[str, Tuple[float, float]], n: int, rng: random.Random) -> List[Dict[str, float]]:
+    return [{k: rng.uniform(lo, hi) for k, (lo, hi) in knobs.items()} for _ in range(n)]
+
+
+def _shrink(knobs: Dict[str, Tuple[float, float]], center: Dict[str, float], factor: float):
+    out = {}
+    for k, (lo, hi) in knobs.items():
+        half = (hi - lo) * factor / 2
+        out[k] = (max(lo, center[k] - half), min(hi, center[k] + half))
+    return out
+
+
+def _round(overrides: Dict[str, float]) -> Dict[str, float]:
+    return {k: round(v, 4) for k, v in overrides.items()}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Calibrate game_config.json against target league averages")
+    for name, help_text in METRICS.items():
+        parser.add_argument("--" + name.replace("_", "-"), dest=name, type=float, help=f"target {help_text}")
+    parser.add_argument("--knob", action="append", default=[],
+                        help="search range section.key=low:high (replaces the default knobs)")
+    parser.add_argument("--search", choices=("grid", "random"), default="random")
+    parser.add_argument("--grid-points", type=int, default=3)
+    parser.add_argument("--candidates", type=int, default=48)
+    parser.add_argument("--refine", type=int, default=2, help="random search: refinement rounds")
+    parser.add_argument("--seasons", type=int, default=2, help="seasons simulated per candidate")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--config", default=DEFAULT_CONFIG_PATH)
+    parser.add_argument("-o", "--output", help="where to write the best config (default: --config)")
+    parser.add_argument("--report", default="data/calibration_report.json")
+    parser.add_argument("--dry-run", action="store_true", help="report only, do not write the config")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    targets = {k: getattr(args, k) for k in METRICS if getattr(args, k) is not None}
+    if not targets:
+        parser.error("give at least one target (--ppg, --fg3-pct, --apg, --bpg, --top-ppg)")
+
+    knobs = dict(DEFAULT_KNOBS)
+    if args.knob:
+        knobs = {}
+        for spec in args.knob:
+            path, rng_text = spec.split("=")
+            lo, hi = rng_text.split(":")
+            knobs[path] = (float(lo), float(hi))
+
+    base_cfg = read_config_file(args.config)
+    rng = random.Random(args.seed)
+    results: List[Dict] = []
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as pool:
+        def run(candidates: List[Dict[str, float]]):
+            # Same season seed for every candidate: differences come from the config, not the dice
+            jobs = [(base_cfg, c, args.seasons, args.seed) for c in candidates]
+            for cand, metrics in zip(candidates, pool.map(evaluate, jobs)):
+                results.append({"overrides": _round(cand), "metrics": metrics, "loss": loss(metrics, targets)})
+                print(f"loss {results[-1]['loss']:.4f}  {_round(cand)}  ->  "
+                      + ", ".join(f"{k}={metrics[k]:.3f}" for k in targets))
+
+        # Baseline first so the report shows the improvement
+        run([{}])
+        baseline = results[0]
+        if args.search == "grid":
+            run(_grid(knobs, args.grid_points))
+        else:
+            run(_random(knobs, args.candidates, rng))
+            box = knobs
+            for _ in range(args.refine):
+                best = min(results[1:], key=lambda r: r["loss"])
+                box = _shrink(box, best["overrides"], 0.4)
+                run(_random(box, max(8, args.candidates // 2), rng))
+
+    ranked = sorted(results[1:], key=lambda r: r["loss"])
+    best = ranked[0] if ranked and ranked[0]["loss"] < baseline["loss"] else baseline
+    report = {
+        "targets": targets,
+        "knobs": {k: list(v) for k, v in knobs.items()},
+        "search": args.search,
+        "candidates": len(results) - 1,
+        "seasons_per_candidate": args.seasons,
+        "elapsed_sec": round(time.perf_counter() - start, 1),
+        "baseline": baseline,
+        "best": best,
+        "top": ranked[:10],
+    }
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4)
+
+    print(f"\nBaseline loss {baseline['loss']:.4f} -> best {best['loss']:.4f}: {best['overrides'] or 'unchanged'}")
+    print(f"Report: {args.report}")
+    if not args.dry_run and best is not baseline:
+        out_path = args.output or args.config
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(apply_overrides(base_cfg, best["overrides"]), f, indent=4, ensure_ascii=False)
+        print(f"Wrote {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Refits models.win_probability against MatchEngine and writes data/win_prob_model.json
+(coefficients + accuracy report on a held-out split).
+
+Matchups are half the shipped league teams and half random 13-man rosters drawn
+from the whole player pool (with AI strategies), so the fit covers lopsided games too.
+
+Usage:
+  python tools/fit_win_probability.py                 # 4000 matchups x 5 games
+  python tools/fit_win_probability.py --matchups 500 --reps 2 --dry-run
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from controllers.data_loader import DataLoader
+from controllers.game_manager import GameManager
+from models.team import Team
+from models.match_engine import MatchEngine, FIDELITY_SCORE
+from models.win_probability import WinProbabilityModel, team_features, DEFAULT_MODEL_PATH, FEATURES
+
+DATA_PATH = "data/gamedata.json"
+ROSTER_SIZE = 13
+
+
+def _random_team(tag: str, pool, rng: random.Random) -> Team:
+    team = Team(id=tag, name=tag, color="", roster=rng.sample(pool, ROSTER_SIZE))
+    GameManager.update_team_strategy(team)
+    return team
+
+
+def generate(matchups: int, reps: int, seed: int):
+    """Returns (home_features, away_features, home_won) with one row per simulated game."""
+    raw = DataLoader(DATA_PATH).load_data()
+    league, players = DataLoader(DATA_PATH).process_data_into_objects(raw)
+    league = [t for t in league if len(t.roster) >= 5]
+    pool = list(players)
+
+    rng = random.Random(seed)
+    home_f, away_f, won = [], [], []
+    for i in range(matchups):
+        if i % 2 == 0:
+            home, away = rng.sample(league, 2)
+        else:
+            home = _random_team(f"H{i}", pool, rng)
+            away = _random_team(f"A{i}", [p for p in pool if p not in home.roster], rng)
+        fh, fa = team_features(home), team_features(away)
+        for _ in range(reps):
+            res = MatchEngine.simulate_game(home, away, rng=rng, apply=False, fidelity=FIDELITY_SCORE)
+            home_f.append(fh)
+            away_f.append(fa)
+            won.append(res.home_won)
+    return np.array(home_f), np.array(away_f), np.array(won)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Refit the analytic win-probability model")
+    parser.add_argument("--matchups", type=int, default=4000)
+    parser.add_argument("--reps", type=int, default=5, help="games simulated per matchup")
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--holdout", type=float, default=0.2, help="fraction of matchups kept for the report")
+    parser.add_argument("-o", "--output", default=DEFAULT_MODEL_PATH)
+    parser.add_argument("--dry-run", action="store_true", help="print the report without writing the model")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    start = time.perf_counter()
+    home_f, away_f, won = generate(args.matchups, args.reps, args.seed)
+    sim_sec = time.perf_counter() - start
+
+    # Split by matchup so repeated games of one matchup never straddle train/test
+    n_test = int(args.matchups * args.holdout) * args.reps
+    train = slice(n_test, None)
+    test = slice(0, n_test)
+
+    model = WinProbabilityModel.fit(home_f[train], away_f[train], won[train])
+    report = model.evaluate(home_f[test], away_f[test], won[test])
+    report["train_games"] = int(len(won) - n_test)
+
+    # Reference point: the same fit on OVR alone (what AI heuristics use today)
+    ovr = [FEATURES.index("ovr")]
+    ovr_model = WinProbabilityModel.fit(home_f[train][:, ovr], away_f[train][:, ovr], won[train])
+    p = ovr_model.intercept + (home_f[test][:, ovr] - away_f[test][:, ovr]) / ovr_model.scale @ ovr_model.coef
+    p = 1.0 / (1.0 + np.exp(-p))
+    y = won[test].astype(np.float64)
+    report["ovr_only"] = {"accuracy": float(((p >= 0.5) == (y >= 0.5)).mean()),
+                          "brier": float(np.mean((p - y) ** 2))}
+    model.report = report
+
+    start = time.perf_counter()
+    for h, a in zip(home_f[:2000], away_f[:2000]):
+        model.predict_diff(h - a)
+    report["predict_per_sec"] = 2000 / (time.perf_counter() - start)
+
+    print(json.dumps(report, indent=4))
+    print(f"\nSimulated {len(won)} games in {sim_sec:.1f}s")
+    if not args.dry_run:
+        model.save(args.output, meta={"matchups": args.matchups, "reps": args.reps, "seed": args.seed})
+        print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
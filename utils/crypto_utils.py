@@ -3,8 +3,17 @@ from cryptography.fernet import Fernet
 from pathlib import Path
 
 class CryptoUtils:
+    KEY_FILE = "secret.key"
     _key = None
     _cipher_suite = None
+    _key_path = Path(KEY_FILE) # Relative to the working directory (app default)
+
+    @classmethod
+    def use_key_file(cls, path):
+        """Reads/creates the key at `path` from now on (e.g. next to a headless run's saves)."""
+        cls._key_path = Path(path)
+        cls._key = None
+        cls._cipher_suite = None
 
     @classmethod
     def initialize(cls):
@@ -12,7 +21,7 @@ class CryptoUtils:
         In a real app, this should be securely stored or obfuscated.
         For this prototype, we store it in a 'secret.key' file.
         """
-        key_path = Path("secret.key")
+        key_path = cls._key_path
         if key_path.exists():
             with open(key_path, "rb") as key_file:
                 cls._key = key_file.read()
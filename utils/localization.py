@@ -212,6 +212,8 @@ class LocalizationManager:
             "Day": "第", 
             "Playoffs: Semi-Finals": "季後賽：準決賽",
             "Playoffs: Finals": "季後賽：總決賽",
+            "Playoffs: Play-In": "季後賽：附加賽",
+            "Playoffs: Round {n}": "季後賽：第{n}輪",
             "Season Finished": "賽季結束",
             "Simulate Next Game": "模擬下一場",
             "View Season Summary": "查看賽季總結",
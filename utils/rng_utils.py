@@ -0,0 +1,34 @@
+import hashlib
+import random
+from typing import Any
+
+
+def new_master_seed() -> int:
+    """Fresh 63-bit league seed (stored in the save so the league can be replayed)."""
+    return random.SystemRandom().randrange(1, 2 ** 63)
+
+
+def derive_seed(master_seed: int, *keys: Any) -> int:
+    """
+    Derives a stable 64-bit seed from the league master seed and a key path,
+    e.g. derive_seed(seed, "game", 2025, "G12").
+    Uses blake2b so streams for different keys are independent and
+    identical across runs, platforms and worker processes (unlike hash()).
+    """
+    material = ":".join([str(master_seed)] + [str(k) for k in keys]).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(material, digest_size=8).digest(), "little")
+
+
+def derive_rng(master_seed: int, *keys: Any) -> random.Random:
+    """random.Random stream for a subsystem. Falls back to the global `random` module if no seed."""
+    if master_seed is None:
+        return random
+    return random.Random(derive_seed(master_seed, *keys))
+
+
+def derive_np_rng(master_seed: int, *keys: Any):
+    """NumPy Generator stream for vectorized subsystems (batch engine, projections)."""
+    import numpy as np
+    if master_seed is None:
+        return np.random.default_rng()
+    return np.random.default_rng(derive_seed(master_seed, *keys))
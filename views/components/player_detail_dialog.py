@@ -157,7 +157,7 @@ class PlayerDetailDialog(ft.AlertDialog):
         if not can_negotiate:
                 is_disabled = True
                 disabled_reason = "Cannot Negotiate"
-        elif not getattr(p, "negotiation_allowed", True):
+        elif not p.negotiation_allowed:
                 is_disabled = True
                 disabled_reason = "Refuses to Negotiate"
         elif space < 0:
@@ -186,8 +186,8 @@ class PlayerDetailDialog(ft.AlertDialog):
             msg = response["message"]
             
             # Update Patience
-            current_patience = getattr(p, "negotiation_patience", 0)
-            max_p_current = getattr(p, "negotiation_max_patience", 3)
+            current_patience = p.negotiation_patience or 0
+            max_p_current = p.negotiation_max_patience or 3
             self.patience_text.value = f"{tr('Mood')}: " + ("❤️" * current_patience + "🖤" * (max_p_current - current_patience))
             
             if status == "accept":
@@ -268,8 +268,8 @@ class PlayerDetailDialog(ft.AlertDialog):
         # ----------------------------
 
         # Init Patience for display
-        patience = getattr(p, "negotiation_patience", 3)
-        max_patience = getattr(p, "negotiation_max_patience", 3)
+        patience = p.negotiation_patience if p.negotiation_patience is not None else 3
+        max_patience = p.negotiation_max_patience if p.negotiation_max_patience is not None else 3
         # Fallback if max < patience (legacy/bug safe)
         max_patience = max(patience, max_patience) 
         
@@ -360,7 +360,7 @@ class PlayerDetailDialog(ft.AlertDialog):
             if not can_negotiate:
                  is_disabled = True
                  disabled_reason = "無法談判 (球隊/合約)"
-            elif not getattr(p, "negotiation_allowed", True):
+            elif not p.negotiation_allowed:
                  is_disabled = True
                  disabled_reason = "球員拒絕談判"
             elif space < 0:
@@ -393,8 +393,8 @@ class PlayerDetailDialog(ft.AlertDialog):
             msg = response["message"]
             
             # Update Patience Display
-            current_patience = getattr(p, "negotiation_patience", 0)
-            max_p_current = getattr(p, "negotiation_max_patience", 3)
+            current_patience = p.negotiation_patience or 0
+            max_p_current = p.negotiation_max_patience or 3
             self.patience_text.value = f"{tr('Mood')}: " + ("❤️" * current_patience + "🖤" * (max_p_current - current_patience))
             
             if status == "accept":
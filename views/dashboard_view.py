@@ -1,5 +1,6 @@
 import flet as ft
 from controllers.game_manager import GameManager
+from controllers.season_phases import PHASE_DRAFT
 from utils.localization import tr
 
 class DashboardView(ft.Container):
@@ -184,16 +185,12 @@ class DashboardView(ft.Container):
 
     def _check_season_over(self):
         # Logic to check if finals are done
-        # Usually check if rounds 2 is done
-        round2 = [s for s in self.gm.playoff_series if s['round'] == 2]
-        if round2 and round2[0].get('winner'):
-             return True
-        return False
+        return self.gm.playoff_champion() is not None
 
     def start_offseason(self, e):
         # Trigger Offseason Flow
         print("Starting Offseason Sequence...")
-        self.gm.init_draft()
+        self.gm.advance_phase(PHASE_DRAFT) # Progression (new season year, rookies), then the draft
         self.page.go("/draft")
 
     def _build_stat_card(self, title, value, icon):
@@ -1,5 +1,6 @@
 import flet as ft
 from controllers.game_manager import GameManager
+from controllers.season_phases import PHASE_FREE_AGENCY
 from utils.localization import tr
 
 class DraftView(ft.Container):
@@ -355,11 +356,12 @@ class DraftView(ft.Container):
         user_team = self.gm.get_user_team()
         max_picks = len(self.gm.draft_order)
         
-        while self.gm.is_draft_active and self.gm.current_draft_pick_index < max_picks:
-             active_team_id = self.gm.draft_order[self.gm.current_draft_pick_index]
-             if active_team_id == user_team.id:
-                 break # Stop at User Pick
-             self.gm.resolve_draft_pick()
+        with self.gm.deferred_saves(): # One save after the AI picks
+            while self.gm.is_draft_active and self.gm.current_draft_pick_index < max_picks:
+                 active_team_id = self.gm.draft_order[self.gm.current_draft_pick_index]
+                 if active_team_id == user_team.id:
+                     break # Stop at User Pick
+                 self.gm.resolve_draft_pick()
              
         self._update_view()
 
@@ -367,7 +369,7 @@ class DraftView(ft.Container):
         # 1. End Draft & Schedule (Redundant safety)
         if self.gm.is_draft_active:
              self.gm.is_draft_active = False
-             self.gm.schedule_post_draft()
+             self.gm.advance_phase(PHASE_FREE_AGENCY)
              self.gm.save_game(0) # Logic Update: Save on finish
         
         # 2. Trigger Callback to Parent (ScoutingView)
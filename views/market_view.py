@@ -28,7 +28,7 @@ class MarketView(ft.Container):
         ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
 
         # 2. Get Data & Filter
-        free_agents = [p for p in self.gm.players if p.team_id == "T00"]
+        free_agents = list(self.gm.index.roster("T00"))
         
         current_pos = self.pos_options[self.current_pos_idx]
         if current_pos != "All":
@@ -1,5 +1,6 @@
 import flet as ft
 from controllers.game_manager import GameManager
+from controllers.sim_progress import TARGET_SEASON_END
 from models.match_engine import MatchEngine
 import random
 from utils.localization import tr
@@ -65,14 +66,18 @@ class MatchView(ft.Container):
                 day_text = tr("Season Finished")
                 is_season_end = True
             else:
-                 # Check if Finals (Round 2)
-                 is_finals = False
+                 # Round name from the latest round (bracket size comes from the league format)
                  round_name = tr("Playoffs: Semi-Finals")
                  
                  if hasattr(self.gm, 'playoff_series') and self.gm.playoff_series:
-                     if any(s['round'] == 2 for s in self.gm.playoff_series):
-                         is_finals = True
+                     active_round = max(s['round'] for s in self.gm.playoff_series)
+                     rounds_left = self.gm.playoff_bracket().rounds - active_round
+                     if active_round == 0:
+                         round_name = tr("Playoffs: Play-In")
+                     elif rounds_left == 0:
                          round_name = tr("Playoffs: Finals")
+                     elif rounds_left > 1:
+                         round_name = tr("Playoffs: Round {n}").format(n=active_round)
                  
                  # Append Series Score info
                  series_info = []
@@ -184,32 +189,12 @@ class MatchView(ft.Container):
         user_game_result = None
         
         for result in results:
-             summary = f"{result['winner']} def. {result['loser']} ({result['home_score']}-{result['away_score']})"
+             summary = f"{result.winner} def. {result.loser} ({result.home_score}-{result.away_score})"
              daily_summary.append(summary)
              
-             # Check for user team
-             h = result['home_team']
-             a = result['away_team']
-             if h == self.gm.user_team_id or a == self.gm.user_team_id: # Correction: result usually has names or IDs?
-                 # MatchEngine returns Dict with names. We need ID check or assume names unique?
-                 # Wait, MatchEngine.simulate_game returns:
-                 # "home_team": home_team.name, "away_team": away_team.name
-                 # We need the game object to know IDs easily, or look up by name.
-                 # Actually gm.play_day iterates games.
-                 pass
-
-        # Since we lost the Game object reference in the loop inside gm.play_day (it returns results dicts),
-        # we might need to find the user game separately or modify play_day to return Game objects.
-        # But for now, let's just show summary.
-        
-        # To show user stats popup, we need to know if user played.
-        # Let's hunt for user team name in results.
-        user_team = self.gm.get_user_team()
-        if user_team:
-            for res in results:
-                if res['home_team'] == user_team.name or res['away_team'] == user_team.name:
-                    user_game_result = res
-                    break
+             # GameResult carries team ids, so the user's game can be matched directly
+             if self.gm.user_team_id in (result.home_team_id, result.away_team_id):
+                 user_game_result = result
 
         self.result_text.value = f"{tr('Day')} {self.gm.current_day - 1} {tr('Simulation Complete')}."
         
@@ -227,10 +212,10 @@ class MatchView(ft.Container):
 
     def _show_game_stats(self, result):
         try:
-            home_name = result["home_team"]
-            away_name = result["away_team"]
-            home_score = result["home_score"]
-            away_score = result["away_score"]
+            home_name = result.home_team
+            away_name = result.away_team
+            home_score = result.home_score
+            away_score = result.away_score
             
             def create_table(box_list):
                 if not box_list:
@@ -273,10 +258,10 @@ class MatchView(ft.Container):
                 ft.Text(f"{home_name} ({home_score}) vs {away_name} ({away_score})", size=20, weight=ft.FontWeight.BOLD),
                 ft.Divider(),
                 ft.Text(f"{tr('Home')}: {home_name}"),
-                ft.Row([create_table(result.get("home_box_score", []))], scroll=ft.ScrollMode.AUTO),
+                ft.Row([create_table(result.home_box_score)], scroll=ft.ScrollMode.AUTO),
                 ft.Divider(),
                 ft.Text(f"{tr('Away')}: {away_name}"),
-                ft.Row([create_table(result.get("away_box_score", []))], scroll=ft.ScrollMode.AUTO),
+                ft.Row([create_table(result.away_box_score)], scroll=ft.ScrollMode.AUTO),
             ], scroll=ft.ScrollMode.AUTO, height=500, width=750)
 
             self.stat_dlg = ft.AlertDialog(
@@ -310,38 +295,15 @@ class MatchView(ft.Container):
         self.page.update()
 
     def sim_to_playoffs(self, e):
-        limit = getattr(self.gm, 'total_regular_season_days', 60)
-        
-        # Show loading?
+        # "Simulate Season" = everything up to the champion (one save at the end)
         self.result_text.value = tr("Simulating season...")
         self.update()
-        
-        # Safety break
-        safety = 0
-        import time
-        
-        while self.gm.current_day <= limit + 30 and safety < 100: # Limit + 30 for playoffs
-             # Check if Season Ended (Champion determined or no games left)
-             # Wait, sim_to_playoffs name implies stopping AT playoffs.
-             # User probably wants "Simulate Season" to mean "Simulate EVERYTHING".
-             # So let's allow it to run until no games are left.
-             
-             if not self.gm.get_todays_games() and self.gm.current_day > limit:
-                 # No games and past regular season -> Finished?
-                 # If Playoff Series exists but no winner yet, maybe games not scheduled yet?
-                 # _schedule_next_playoff_games is called in advance_day.
-                 # So if we are in playoffs, get_todays_games should return something.
-                 # If not, it means season over.
-                 break
-                 
-             self.gm.play_day()
-             safety += 1
-             
-             # Optional: Update UI every few days to show progress
-             if safety % 5 == 0:
-                 self.result_text.value = f"Simulating... Day {self.gm.current_day} / {limit}"
-                 self.update() # Update entire container to be safe
-                 time.sleep(0.5) # Increased delay for visibility
-             
+
+        def show_progress(progress):
+            self.result_text.value = f"Simulating... Day {progress.day} ({progress.fraction:.0%})"
+            self.update()
+
+        self.gm.simulate_until(TARGET_SEASON_END, on_progress=show_progress, progress_interval=0.25)
+
         self.build_content()
         self.page.update() # Ensure page update
@@ -1,6 +1,7 @@
 import flet as ft
 from controllers.game_manager import GameManager
 from controllers.ui_utils import get_ovr_color
+from controllers.season_phases import PHASE_DRAFT
 from utils.localization import tr
 
 class OffseasonView(ft.Container):
@@ -27,10 +28,9 @@ class OffseasonView(ft.Container):
         champion_team = None
         
         if hasattr(self.gm, 'playoff_series') and self.gm.playoff_series:
-            # Find Final Series
-            final_series = next((s for s in self.gm.playoff_series if s['round'] == 2), None)
-            if final_series and final_series.get('winner'):
-                winner_obj = final_series['winner']
+            # Winner of the Final Series
+            winner_obj = self.gm.playoff_champion()
+            if winner_obj:
                 champion_name = winner_obj.name
                 champion_team = winner_obj
         
@@ -102,11 +102,9 @@ class OffseasonView(ft.Container):
         ], scroll=ft.ScrollMode.AUTO)
 
     def _on_start_click(self, e):
-        # 1. Start Season Logic (Retirements, Progression, Draft Class Gen)
-        # Note: start_new_season now Initializes Draft instead of full reset
-        if not self.gm.is_draft_active:
-            self.gm.start_new_season() 
-            self.gm.init_draft()
+        # 1. Start Season Logic (Retirements, Progression, Draft Class Gen), then the Draft
+        # (no-op if the offseason already got this far)
+        self.gm.advance_phase(PHASE_DRAFT)
 
         # 2. Redirect to Progression
         if self.on_next_season_click:
@@ -122,9 +122,7 @@ class ScoutingView(ft.Container):
         # Move from draft_class to users team
         if player in self.gm.draft_class:
              self.gm.draft_class.remove(player)
-             player.team_id = user_team.id
-             user_team.roster.append(player)
-             self.gm.players.append(player) # Now active
+             self.gm.add_player(player, user_team) # Now active
              
              snack = ft.SnackBar(ft.Text(f"{tr('Drafted')} {player.mask_name}!"))
              self.page.overlay.append(snack)